@@ -73,6 +73,10 @@ enum class MeasureErrorNO : int {
   kRunTimeoutError = 7,
   /*! \brief Unknown error. */
   kUnknownError = 8,
+  /*! \brief Rejected after a probe run much slower than the best state. The costs hold its time. */
+  kCensored = 9,
+  /*! \brief Not measured because a roofline model ranked it among the slow states of a batch. */
+  kScreened = 10,
 };
 
 // Inputs and results of one measurement
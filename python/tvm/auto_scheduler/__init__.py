@@ -37,7 +37,12 @@ from .dispatcher import DispatchContext, ApplyHistoryBest, ApplyHistoryBestOrSam
 from .measure import (
     MeasureInput,
     MeasureResult,
+    MeasureCache,
+    PersistentRunner,
+    AdaptiveMeasure,
+    EarlyRejection,
     LocalBuilder,
+    RemoteBuilder,
     LocalRunner,
     RPCRunner,
     LocalRPCMeasureContext,
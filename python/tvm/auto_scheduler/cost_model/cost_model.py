@@ -17,6 +17,7 @@
 
 """ Cost models that estimate the performance of programs """
 import ctypes
+import threading
 import numpy as np
 
 import tvm._ffi
@@ -89,16 +90,23 @@ class PythonBasedModel(CostModel):
     """Base class for cost models implemented in python"""
 
     def __init__(self):
+        # The model is shared by the search policies of the tasks tuned concurrently by the
+        # task scheduler, so the calls from C++ are serialized.
+        lock = threading.Lock()
+
         def update_func(inputs, results):
-            self.update(inputs, results)
+            with lock:
+                self.update(inputs, results)
 
         def predict_func(task, states, return_ptr):
             return_ptr = ctypes.cast(return_ptr, ctypes.POINTER(ctypes.c_float))
             array_wrapper = np.ctypeslib.as_array(return_ptr, shape=(len(states),))
-            array_wrapper[:] = self.predict(task, states)
+            with lock:
+                array_wrapper[:] = self.predict(task, states)
 
         def predict_stage_func(task, states, return_ptr):
-            ret = self.predict_stages(task, states)
+            with lock:
+                ret = self.predict_stages(task, states)
             return_ptr = ctypes.cast(return_ptr, ctypes.POINTER(ctypes.c_float))
             array_wrapper = np.ctypeslib.as_array(return_ptr, shape=ret.shape)
             array_wrapper[:] = ret
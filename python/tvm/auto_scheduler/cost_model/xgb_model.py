@@ -19,6 +19,7 @@
 """Cost model based on xgboost"""
 import multiprocessing
 import logging
+import time
 from collections import defaultdict
 
 import numpy as np
@@ -26,6 +27,7 @@ import numpy as np
 from tvm.autotvm.tuner.metric import max_curve
 from .cost_model import PythonBasedModel
 from ..feature import get_per_store_features_from_measure_pairs, get_per_store_features_from_states
+from ..measure import MeasureErrorNo
 from ..measure_record import RecordReader
 
 xgb = None
@@ -101,6 +103,16 @@ class XGBModel(PythonBasedModel):
     adapative_training: bool = False
         Whether to use adapatie training, which reduces the training frequency when there are
         too many logs.
+    incremental: bool = False
+        Whether to continue boosting the previous model on the new records instead of training
+        a new model on all the records in every update.
+    full_refit_interval: int = 10
+        In incremental mode, the number of incremental updates between two full refits.
+        Full refits keep the model consistent with the throughputs, which are re-normalized
+        as better programs are found.
+    replay_buffer_size: int = 1024
+        In incremental mode, the maximum number of old records randomly sampled and trained
+        together with the new records, so that the model does not forget them.
     """
 
     def __init__(
@@ -110,6 +122,9 @@ class XGBModel(PythonBasedModel):
         seed=None,
         model_file=None,
         adapative_training=False,
+        incremental=False,
+        full_refit_interval=10,
+        replay_buffer_size=1024,
     ):
         global xgb
         try:
@@ -142,6 +157,9 @@ class XGBModel(PythonBasedModel):
         self.verbose_eval = verbose_eval
         self.model_file = model_file
         self.adapative_training = adapative_training
+        self.incremental = incremental
+        self.full_refit_interval = full_refit_interval
+        self.replay_buffer_size = replay_buffer_size
 
         super().__init__()
 
@@ -151,9 +169,15 @@ class XGBModel(PythonBasedModel):
         self.last_train_length = 0
         self.inputs_feature_cache = []
 
+        # state of incremental training
+        self.num_incremental_updates = 0
+        self.full_train_secs_per_sample = None
+
     def update(self, inputs, results):
         """Update the cost model according to new measurement results (training data).
-        XGBoost does not support incremental training, so we re-train a new model every time.
+        A new model is trained on all the records, unless the model is incremental, in which
+        case the previous model is boosted further on the new records and a replayed sample of
+        the old ones.
         Parameters
         ----------
         inputs : List[MeasureInput]
@@ -161,9 +185,13 @@ class XGBModel(PythonBasedModel):
         results : List[MeasureResult]
             The measurement results
         """
+        assert len(inputs) == len(results)
+        # The screened states are not measured, so they carry no training data
+        kept = [i for i, res in enumerate(results) if res.error_no != MeasureErrorNo.SCREENED]
+        inputs = [inputs[i] for i in kept]
+        results = [results[i] for i in kept]
         if len(inputs) <= 0:
             return
-        assert len(inputs) == len(results)
 
         self.inputs.extend(inputs)
         self.results.extend(results)
@@ -175,7 +203,9 @@ class XGBModel(PythonBasedModel):
             # Set a training threshold related to `last_train_length` to reduce the training
             # overhead when there're too many logs
             return
+        num_new = len(self.inputs) - self.last_train_length
         self.last_train_length = len(self.inputs)
+        tic = time.time()
 
         # extract feature
         n_cached = len(self.inputs_feature_cache)
@@ -187,6 +217,23 @@ class XGBModel(PythonBasedModel):
             features[:n_cached] = self.inputs_feature_cache
             features = np.array(features, dtype=object)
         self.inputs_feature_cache = features
+
+        incremental = (
+            self.incremental
+            and self.full_train_secs_per_sample is not None
+            and self.num_incremental_updates < self.full_refit_interval
+        )
+        if incremental:
+            # train on the new records and a bounded sample of the old ones
+            num_old = len(features) - num_new
+            replay = np.random.choice(num_old, min(num_old, self.replay_buffer_size), replace=False)
+            index = np.concatenate([replay, np.arange(num_old, len(features))]).astype(np.int64)
+            features = features[index]
+            normalized_throughputs = normalized_throughputs[index]
+            task_ids = task_ids[index]
+            # forget the early stopping state of the previous training
+            self.bst.set_attr(best_score=None, best_iteration=None, best_msg=None)
+
         dtrain = pack_sum_xgbmatrix(
             features, normalized_throughputs, task_ids, normalized_throughputs
         )
@@ -196,6 +243,7 @@ class XGBModel(PythonBasedModel):
             self.xgb_params,
             dtrain,
             num_boost_round=10000,
+            xgb_model=self.bst if incremental else None,
             obj=pack_sum_square_error,
             callbacks=[
                 custom_callback(
@@ -212,6 +260,21 @@ class XGBModel(PythonBasedModel):
             ],
         )
 
+        train_secs = time.time() - tic
+        if not incremental:
+            self.num_incremental_updates = 0
+            self.full_train_secs_per_sample = train_secs / len(self.inputs)
+        else:
+            self.num_incremental_updates += 1
+            logger.info(
+                "XGBModel: Incremental update on %d new and %d replayed records took %.2f s, "
+                "%.2f s less than an estimated full refit",
+                num_new,
+                len(features) - num_new,
+                train_secs,
+                self.full_train_secs_per_sample * len(self.inputs) - train_secs,
+            )
+
         # Update the model file if it has been set
         if self.model_file:
             self.save(self.model_file)
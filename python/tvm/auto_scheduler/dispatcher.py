@@ -23,6 +23,7 @@ as a schedule configuration here.
 """
 # pylint: disable=invalid-name
 
+import itertools
 import logging
 import pathlib
 from collections.abc import Iterable
@@ -33,7 +34,7 @@ from tvm.contrib.utils import tempdir
 from tvm.tir.expr import FloatImm
 from .cost_model import RandomModel, XGBModel
 from .measure import LocalRPCMeasureContext
-from .measure_record import RecordToFile, load_records
+from .measure_record import RecordReader, RecordToFile, load_records
 from .search_policy import PreloadMeasuredStates, SketchPolicy
 from .search_task import SearchTask, TuningOptions
 from .utils import calc_workload_dis_factor, decode_workload_key
@@ -142,11 +143,16 @@ class ApplyHistoryBest(DispatchContext):
         if it is not None, only load the first `n_lines` lines of log.
     include_compatible: bool
         When set to True, compatible records will also be considered.
+    workload_keys: Optional[List[str]]
+        If it is not None, only the records of these workloads (or of compatible workloads
+        when include_compatible is True) are loaded from log files. Other records are
+        skipped before they are deserialized.
     """
 
-    def __init__(self, records, n_lines=None, include_compatible=False):
+    def __init__(self, records, n_lines=None, include_compatible=False, workload_keys=None):
         super(ApplyHistoryBest, self).__init__()
         self.include_compatible = include_compatible
+        self.workload_keys = workload_keys
 
         # Dict[str (target key),
         #   Dict[str (workload hash),
@@ -208,7 +214,14 @@ class ApplyHistoryBest(DispatchContext):
                 rec = str(rec)
 
             if isinstance(rec, str):
-                rec = load_records(rec)
+                if self.workload_keys is None:
+                    rec = load_records(rec)
+                else:
+                    batches = RecordReader(rec).read_batches(
+                        workload_key=self.workload_keys,
+                        include_compatible=self.include_compatible,
+                    )
+                    rec = itertools.chain.from_iterable(zip(*batch) for batch in batches)
                 joint_records += rec
             else:
                 if rec is not None:
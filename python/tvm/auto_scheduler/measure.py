@@ -31,6 +31,9 @@ get the measurement results. The flow of data structures is
 We implement these in python to utilize python's multiprocessing and error handling.
 """
 
+import collections
+import functools
+import itertools
 import os
 import time
 import shutil
@@ -38,6 +41,8 @@ import tempfile
 import multiprocessing
 import logging
 
+import numpy as np
+
 import tvm._ffi
 from tvm.runtime import Object, module, ndarray
 from tvm.driver import build_module
@@ -77,10 +82,275 @@ class BuildFunc:
         The name of registered build function.
     build_func: callable = tar.tar
         The callable of registered build function.
+    farm: Optional[BuildFarm] = None
+        The build farm to build on, or None to build on the local host.
+    screening: Optional[RooflineScreening] = None
+        The screening of the states of a batch before they are built, or None to build all.
     """
 
     name = "default"
     build_func = tar.tar
+    farm = None
+    screening = None
+
+
+class MeasureCache:
+    """Cache of measurement results keyed by the fingerprint of the lowered program.
+
+    Different states often lower to the identical program. Within the scope of a cache, the
+    LocalBuilder/RemoteBuilder lowers each state but only compiles one state of each program
+    whose fingerprint has not been measured yet, and the LocalRunner/RPCRunner reuse the
+    result of that state for the others. Only successful results are cached. The fingerprint
+    includes the target, so a cache can be shared across tasks.
+
+    Like BuildFunc, the cache in use is stored in a class variable, because the registered
+    build and run functions are called from C++ with fixed arguments. It is set by entering
+    the cache as a context manager.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with auto_scheduler.MeasureCache():
+            task.tune(tune_option)
+    """
+
+    current = None
+
+    # The build result filename of a program whose result is cached
+    HIT_PREFIX = "measure_cache:"
+
+    def __init__(self):
+        self.results = {}
+        # filename of a build result => fingerprint of the program
+        self.fingerprints = {}
+        self.hits = 0
+        self._old_cache = None
+
+    def __len__(self):
+        return len(self.results)
+
+    def __enter__(self):
+        self._old_cache = MeasureCache.current
+        MeasureCache.current = self
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        MeasureCache.current = self._old_cache
+
+    def fingerprint(self, build_res):
+        """Get the fingerprint of the program of a build result, or None if it is unknown."""
+        if build_res.error_no != MeasureErrorNo.NO_ERROR:
+            return None
+        filename = build_res.filename
+        if filename.startswith(MeasureCache.HIT_PREFIX):
+            return filename[len(MeasureCache.HIT_PREFIX) :]
+        return self.fingerprints.get(filename)
+
+    def lookup(self, build_res):
+        """Get the cached result of a build result, or None if it is not cached."""
+        cached = self.results.get(self.fingerprint(build_res))
+        if cached is None:
+            return None
+        self.hits += 1
+        return MeasureResult(
+            [x.value for x in cached.costs],
+            MeasureErrorNo.NO_ERROR,
+            "",
+            build_res.time_cost,
+            time.time(),
+        )
+
+    def update(self, build_res, result):
+        """Cache the result of a build result if it is successful."""
+        fingerprint = self.fingerprints.pop(build_res.filename, None)
+        if fingerprint is not None and result.error_no == MeasureErrorNo.NO_ERROR:
+            self.results.setdefault(fingerprint, result)
+
+
+class AdaptiveMeasure:
+    """Settings of the adaptive measurement used by LocalRunner and RPCRunner.
+
+    When target_rel_error is set, each program is measured in batches of `repeat` costs until
+    the confidence interval of its mean cost is within target_rel_error of the mean, or until
+    max_time_ms is spent. See `tvm.runtime.Module.time_evaluator`.
+
+    Like BuildFunc, the settings are stored in class variables.
+
+    target_rel_error: Optional[float] = None
+        The target relative error of the mean cost, or None to measure `repeat` costs once.
+    max_time_ms: Optional[float] = None
+        The time budget of the measurement of one program in milliseconds.
+    """
+
+    target_rel_error = None
+    max_time_ms = None
+
+    @staticmethod
+    def options():
+        """Get the settings as keyword arguments of time_evaluator."""
+        if AdaptiveMeasure.target_rel_error is None:
+            return None
+        return {
+            "target_rel_error": AdaptiveMeasure.target_rel_error,
+            "max_time_ms": AdaptiveMeasure.max_time_ms,
+        }
+
+
+class EarlyRejection:
+    """Settings and incumbents of the early rejection used by LocalRunner and RPCRunner.
+
+    When ratio is set, each program is first run once as a probe. If the probe is slower than
+    ratio times the best mean cost measured so far for its workload, the program is not timed
+    further, and gets a result with error_no CENSORED whose costs hold the probe time. Such
+    results are not errors, and the cost model learns from their probe time.
+
+    Like BuildFunc, the settings are stored in class variables.
+
+    ratio: Optional[float] = None
+        The rejection ratio, or None to time every program.
+    best_costs: Dict[str, float] = {}
+        The best mean cost of each workload key measured so far.
+    """
+
+    ratio = None
+    best_costs = {}
+
+    @staticmethod
+    def reject_cost(inp):
+        """Get the probe time in seconds above which a measure input is rejected, or None."""
+        best = EarlyRejection.best_costs.get(inp.task.workload_key)
+        if EarlyRejection.ratio is None or best is None:
+            return None
+        return EarlyRejection.ratio * best
+
+    @staticmethod
+    def update(inp, res):
+        """Update the incumbent of a workload with a result measured to completion."""
+        if EarlyRejection.ratio is None or res.error_no != MeasureErrorNo.NO_ERROR:
+            return
+        cost = sum(x.value for x in res.costs) / len(res.costs)
+        key = inp.task.workload_key
+        EarlyRejection.best_costs[key] = min(EarlyRejection.best_costs.get(key, cost), cost)
+
+
+class PersistentRunner:
+    """Worker processes of LocalRunner kept warm across measurement batches.
+
+    Without it, every batch of LocalRunner starts a new worker process, which imports tvm
+    again and allocates new random inputs for each program. With it, each device is measured
+    by one worker process that lives across the batches, and keeps the randomly filled input
+    buffers cached by shape and dtype.
+
+    Like MeasureCache, the runner in use is stored in a class variable.
+
+    Note
+    ----
+    A module exported as a tar archive is linked into a shared library before it is loaded.
+    Build with `LocalBuilder(build_func=tvm.contrib.cc.create_shared)` to skip this step.
+    """
+
+    current = None
+
+    def __init__(self):
+        # device id => PopenWorker
+        self.workers = {}
+
+    def worker(self, device):
+        """Get the worker process of a device."""
+        if device not in self.workers:
+            self.workers[device] = PopenWorker()
+        return self.workers[device]
+
+
+# The randomly filled input buffers of a persistent runner worker, keyed by
+# (shape, dtype, device, index among the arguments of the same shape and dtype)
+_INPUT_BUFFER_CACHE = collections.OrderedDict()
+_INPUT_BUFFER_CACHE_SIZE = 64
+
+
+def _cached_input_buffer(key, dev, random_fill):
+    """Get a randomly filled input buffer from the cache, allocating it on a miss."""
+    if key in _INPUT_BUFFER_CACHE:
+        _INPUT_BUFFER_CACHE.move_to_end(key)
+        return _INPUT_BUFFER_CACHE[key]
+    shape, dtype = key[:2]
+    buffer = ndarray.empty(shape, dtype, dev)
+    random_fill(buffer)
+    _INPUT_BUFFER_CACHE[key] = buffer
+    while len(_INPUT_BUFFER_CACHE) > _INPUT_BUFFER_CACHE_SIZE:
+        _INPUT_BUFFER_CACHE.popitem(last=False)
+    return buffer
+
+
+# dlopen returns the library already loaded under the same path, which a builder may reuse for
+# another program, so a persistent worker loads every module under a path not used before
+_LOADED_MODULE_COUNTER = itertools.count()
+
+
+def _load_module_under_unique_path(filename):
+    """Load a built module through a symbolic link to it at a path not used before."""
+    dirname = tempfile.mkdtemp()
+    try:
+        path = os.path.join(
+            dirname, "%d_%s" % (next(_LOADED_MODULE_COUNTER), os.path.basename(filename))
+        )
+        try:
+            os.symlink(os.path.abspath(filename), path)
+        except OSError:
+            # e.g. symbolic links need a privilege on Windows
+            path = filename
+        return module.load_module(path)
+    finally:
+        shutil.rmtree(dirname, ignore_errors=True)
+
+
+def _with_measure_cache(run_func):
+    """Decorate a registered run function to reuse the results in MeasureCache.current"""
+
+    @functools.wraps(run_func)
+    def _run(inputs, build_results, *args, **kwargs):
+        cache = MeasureCache.current
+        if cache is None:
+            return run_func(inputs, build_results, *args, **kwargs)
+
+        results = [cache.lookup(build_res) for build_res in build_results]
+        to_run = []
+        # input index => index of the input run for the same program in this batch
+        copies = {}
+        run_indices = {}
+        for k, res in enumerate(results):
+            if res is not None:
+                continue
+            fingerprint = cache.fingerprint(build_results[k])
+            if fingerprint in run_indices:
+                copies[k] = run_indices[fingerprint]
+                continue
+            if fingerprint is not None:
+                run_indices[fingerprint] = k
+            to_run.append(k)
+        if to_run:
+            run_results = run_func(
+                [inputs[k] for k in to_run],
+                [build_results[k] for k in to_run],
+                *args,
+                **kwargs,
+            )
+            for k, res in zip(to_run, run_results):
+                results[k] = res
+                cache.update(build_results[k], res)
+        for k, j in copies.items():
+            # the result of a failed run is shared, but not cached
+            results[k] = cache.lookup(build_results[k]) or MeasureResult(
+                [x.value for x in results[j].costs],
+                results[j].error_no,
+                results[j].error_msg,
+                build_results[k].time_cost,
+                time.time(),
+            )
+        return results
+
+    return _run
 
 
 @tvm._ffi.register_object("auto_scheduler.MeasureCallback")
@@ -327,9 +597,20 @@ class LocalBuilder(ProgramBuilder):
         If is 'default', use default build function
         If is 'ndk', use function for android ndk
         If is callable, use it as custom build function, expect lib_format field.
+    screening: Optional[tvm.utils.RooflineScreening]
+        If given, the states of a batch are ranked by the run time a roofline model
+        estimates from their features, and only the fastest `screening.ratio` of them are
+        built and measured. The others get the error number `MeasureErrorNo.SCREENED`.
     """
 
-    def __init__(self, timeout=15, n_parallel=multiprocessing.cpu_count(), build_func="default"):
+    def __init__(
+        self,
+        timeout=15,
+        n_parallel=multiprocessing.cpu_count(),
+        build_func="default",
+        screening=None,
+    ):
+        BuildFunc.screening = screening
         if build_func == "default":
             BuildFunc.name = "default"
             BuildFunc.build_func = tar.tar
@@ -341,12 +622,69 @@ class LocalBuilder(ProgramBuilder):
             BuildFunc.build_func = build_func
         else:
             raise ValueError("Invalid build_func" + build_func)
+        BuildFunc.farm = None
 
         self.__init_handle_by_constructor__(
             _ffi_api.LocalBuilder, timeout, n_parallel, BuildFunc.name
         )
 
 
+class RemoteBuilder(LocalBuilder):
+    """RemoteBuilder builds programs on the build workers registered to an RPC tracker.
+    The programs are sharded over the workers, and the exported modules are sent back
+    and saved on the local host.
+
+    The build workers are started by `python -m tvm.exec.build_worker`.
+
+    Parameters
+    ----------
+    key : str = "build"
+        The key of the build workers in the tracker.
+    host : str = None
+        The host address of the RPC Tracker. Defaults to the environment variable
+        TVM_TRACKER_HOST.
+    port : int = None
+        The port of the RPC Tracker. Defaults to the environment variable TVM_TRACKER_PORT.
+    priority : int = 1
+        The priority of the session requests.
+    n_parallel : Optional[int] = None
+        The number of build workers used at the same time.
+        If None, all the workers registered under the key are used.
+    timeout : int = 15
+        The timeout limit (in second) for each build.
+    build_func: callable or str = "default"
+        Same as in LocalBuilder.
+    screening: Optional[tvm.utils.RooflineScreening]
+        Same as in LocalBuilder.
+    """
+
+    def __init__(
+        self,
+        key="build",
+        host=None,
+        port=None,
+        priority=1,
+        n_parallel=None,
+        timeout=15,
+        build_func="default",
+        screening=None,
+    ):
+        host = host or os.environ.get("TVM_TRACKER_HOST")
+        port = port or os.environ.get("TVM_TRACKER_PORT")
+        if host is None or port is None:
+            raise ValueError(
+                "The address of the RPC tracker is not given, and TVM_TRACKER_HOST or "
+                "TVM_TRACKER_PORT is not set"
+            )
+        # pylint: disable=import-outside-toplevel
+        from tvm.contrib.build_farm import BuildFarm
+
+        super().__init__(timeout, n_parallel or 0, build_func, screening)
+        BuildFunc.farm = BuildFarm(
+            host, port, key=key, max_workers=n_parallel, timeout=timeout, priority=priority
+        )
+
+
 @tvm._ffi.register_object("auto_scheduler.LocalRunner")
 class LocalRunner(ProgramRunner):
     """LocalRunner that uses local CPU/GPU to measures the time cost of programs.
@@ -382,6 +720,17 @@ class LocalRunner(ProgramRunner):
         This is only has effect on CPU task.
     device: int = 0
         Which device to run on if multiple are available.
+    persistent: bool = False
+        Whether to measure in a worker process per device kept warm across the batches,
+        which reuses randomly filled input buffers across programs. See PersistentRunner.
+    target_rel_error: Optional[float] = None
+        If set, measure each program adaptively until the confidence interval of its mean cost
+        is within this error relative to the mean. See AdaptiveMeasure.
+    max_time_ms: Optional[float] = None
+        The time budget of the adaptive measurement of one program in milliseconds.
+    early_reject_ratio: Optional[float] = None
+        If set, run each program once as a probe first, and do not time it further if the probe
+        is slower than this ratio times the best cost of its workload. See EarlyRejection.
     """
 
     def __init__(
@@ -393,10 +742,22 @@ class LocalRunner(ProgramRunner):
         cooldown_interval=0.0,
         enable_cpu_cache_flush=False,
         device=0,
+        persistent=False,
+        target_rel_error=None,
+        max_time_ms=None,
+        early_reject_ratio=None,
     ):
         if enable_cpu_cache_flush:
             number = 1
             min_repeat_ms = 0
+        AdaptiveMeasure.target_rel_error = target_rel_error
+        AdaptiveMeasure.max_time_ms = max_time_ms
+        EarlyRejection.ratio = early_reject_ratio
+        EarlyRejection.best_costs = {}
+        if not persistent:
+            PersistentRunner.current = None
+        elif PersistentRunner.current is None:
+            PersistentRunner.current = PersistentRunner()
 
         self.__init_handle_by_constructor__(
             _ffi_api.LocalRunner,
@@ -457,6 +818,14 @@ class RPCRunner(ProgramRunner):
         This is only has effect on CPU task.
     device: int = 0
         Which device to run on if multiple are available.
+    target_rel_error: Optional[float] = None
+        If set, measure each program adaptively until the confidence interval of its mean cost
+        is within this error relative to the mean. See AdaptiveMeasure.
+    max_time_ms: Optional[float] = None
+        The time budget of the adaptive measurement of one program in milliseconds.
+    early_reject_ratio: Optional[float] = None
+        If set, run each program once as a probe first, and do not time it further if the probe
+        is slower than this ratio times the best cost of its workload. See EarlyRejection.
     """
 
     def __init__(
@@ -473,7 +842,14 @@ class RPCRunner(ProgramRunner):
         cooldown_interval=0.0,
         enable_cpu_cache_flush=False,
         device=0,
+        target_rel_error=None,
+        max_time_ms=None,
+        early_reject_ratio=None,
     ):
+        AdaptiveMeasure.target_rel_error = target_rel_error
+        AdaptiveMeasure.max_time_ms = max_time_ms
+        EarlyRejection.ratio = early_reject_ratio
+        EarlyRejection.best_costs = {}
         self.__init_handle_by_constructor__(
             _ffi_api.RPCRunner,
             key,
@@ -540,6 +916,14 @@ class LocalRPCMeasureContext:
         This is only has effect on CPU task.
     device: int = 0
         Which device to run on if multiple are available.
+    target_rel_error: Optional[float] = None
+        If set, measure each program adaptively until the confidence interval of its mean cost
+        is within this error relative to the mean. See AdaptiveMeasure.
+    max_time_ms: Optional[float] = None
+        The time budget of the adaptive measurement of one program in milliseconds.
+    early_reject_ratio: Optional[float] = None
+        If set, run each program once as a probe first, and do not time it further if the probe
+        is slower than this ratio times the best cost of its workload. See EarlyRejection.
     """
 
     def __init__(
@@ -553,6 +937,9 @@ class LocalRPCMeasureContext:
         cooldown_interval=0.0,
         enable_cpu_cache_flush=False,
         device=0,
+        target_rel_error=None,
+        max_time_ms=None,
+        early_reject_ratio=None,
     ):
         # pylint: disable=import-outside-toplevel
         from tvm.rpc.tracker import Tracker
@@ -580,6 +967,9 @@ class LocalRPCMeasureContext:
             cooldown_interval,
             enable_cpu_cache_flush,
             device,
+            target_rel_error,
+            max_time_ms,
+            early_reject_ratio,
         )
         # Wait for the processes to start
         time.sleep(0.5)
@@ -604,9 +994,14 @@ class MeasureErrorNo(object):
     BUILD_TIMEOUT = 6  # Timeout during compilation
     RUN_TIMEOUT = 7  # Timeout during run
     UNKNOWN_ERROR = 8  # Unknown error
+    CENSORED = 9  # Rejected after a probe run much slower than the best state
+    # (the costs hold the time of the probe run)
+    SCREENED = 10  # Not built because a roofline model ranked it among the slow states of a batch
 
 
-def _local_build_worker(inp_serialized, build_func, verbose):
+def _local_build_worker(
+    inp_serialized, build_func, verbose, known_fingerprints=None, lower_only=False
+):
     tic = time.time()
     inp = MeasureInput.deserialize(inp_serialized)
     task = inp.task
@@ -615,6 +1010,7 @@ def _local_build_worker(inp_serialized, build_func, verbose):
     error_no = MeasureErrorNo.NO_ERROR
     error_msg = None
     args = []
+    fingerprint = None
 
     try:
         sch, args = task.compute_dag.apply_steps_from_state(
@@ -631,8 +1027,19 @@ def _local_build_worker(inp_serialized, build_func, verbose):
 
         try:
             with transform.PassContext():
-                func = build_module.build(sch, args, target=task.target)
-            func.export_library(filename, build_func)
+                if known_fingerprints is None and not lower_only:
+                    func = build_module.build(sch, args, target=task.target)
+                else:
+                    mod = build_module.lower(sch, args, name="default_function")
+                    fingerprint = "%x:%s" % (tvm.ir.structural_hash(mod), str(task.target))
+                    if lower_only or fingerprint in known_fingerprints:
+                        func = None
+                        filename = MeasureCache.HIT_PREFIX + fingerprint
+                        shutil.rmtree(dirname)
+                    else:
+                        func = build_module.build(mod, target=task.target)
+            if func is not None:
+                func.export_library(filename, build_func)
         # pylint: disable=broad-except
         except Exception:
             error_no = MeasureErrorNo.COMPILE_HOST
@@ -646,7 +1053,7 @@ def _local_build_worker(inp_serialized, build_func, verbose):
         else:
             print(".E", end="", flush=True)  # Build error
 
-    return filename, args, error_no, error_msg, time.time() - tic
+    return filename, args, error_no, error_msg, time.time() - tic, fingerprint
 
 
 def local_build_worker(args):
@@ -655,17 +1062,72 @@ def local_build_worker(args):
 
     Parameters
     ----------
-    args: Tuple[MeasureInput, callable, int]
-        inputs, build-func, verbose args passed to local_builder_build
+    args: Tuple[MeasureInput, callable, int, Optional[FrozenSet[str]]]
+        inputs, build-func, verbose, known fingerprints args passed to local_builder_build
 
     Returns
     -------
     res : BuildResult
         The build result of this Builder thread.
     """
-    inp, build_func, verbose = args
+    inp, build_func, verbose, known_fingerprints = args
+
+    return _local_build_worker(inp, build_func, verbose, known_fingerprints)
+
+
+def local_lower_worker(args):
+    """
+    Lower function of LocalBuilder with a MeasureCache, which lowers a MeasureInput without
+    compiling it, to get the fingerprint of its program.
+
+    Parameters
+    ----------
+    args: Tuple[MeasureInput, callable]
+        inputs, build-func args passed to local_builder_build
+
+    Returns
+    -------
+    res : BuildResult
+        The build result, whose module file is named after the fingerprint.
+    """
+    inp, build_func = args
+
+    return _local_build_worker(inp, build_func, 0, lower_only=True)
+
+
+def remote_build_worker(args):
+    """
+    Build function of RemoteBuilder to be ran on the build workers.
+
+    Parameters
+    ----------
+    args: Tuple[MeasureInput, callable, int, Optional[FrozenSet[str]]]
+        Same as in local_build_worker
 
-    return _local_build_worker(inp, build_func, verbose)
+    Returns
+    -------
+    res : Tuple[BuildResult, Optional[Tuple[str, bytes]]]
+        The build result, and the name and content of the built module if there is one.
+    """
+    res = local_build_worker(args)
+    filename = res[0]
+    if not os.path.isfile(filename):
+        return res, None
+    with open(filename, "rb") as f:
+        data = f.read()
+    shutil.rmtree(os.path.dirname(filename), ignore_errors=True)
+    return res, (os.path.basename(filename), data)
+
+
+def _save_remote_build(res):
+    """Save the module built by remote_build_worker to the local host."""
+    res, artifact = res
+    if artifact is None:
+        return res
+    filename = os.path.join(tempfile.mkdtemp(), artifact[0])
+    with open(filename, "wb") as f:
+        f.write(artifact[1])
+    return (filename,) + tuple(res[1:])
 
 
 @tvm._ffi.register_func("auto_scheduler.local_builder.build")
@@ -695,39 +1157,120 @@ def local_builder_build(inputs, timeout, n_parallel, build_func="default", verbo
     assert build_func == BuildFunc.name, (
         "BuildFunc.name: " + BuildFunc.name + ", but args is: " + build_func
     )
-    executor = PopenPoolExecutor(
-        n_parallel, timeout, reset_global_scope, (AutotvmGlobalScope.current,)
-    )
-    tuple_res = executor.map_with_error_catching(
-        local_build_worker,
-        [
-            (
-                i.serialize(),
-                BuildFunc.build_func,
-                verbose,
-            )
-            for i in inputs
-        ],
-    )
+    cache = MeasureCache.current
+    known_fingerprints = frozenset(cache.results) if cache is not None else None
+    if BuildFunc.screening is not None:
+        selected = _screen(inputs, BuildFunc.screening)
+        if verbose >= 1:
+            print(".S" * (len(inputs) - len(selected)), end="", flush=True)
+    else:
+        selected = range(len(inputs))
+    if BuildFunc.farm is not None:
+        map_with_error_catching = BuildFunc.farm.map_with_error_catching
+    else:
+        executor = PopenPoolExecutor(
+            n_parallel, timeout, reset_global_scope, (AutotvmGlobalScope.current,)
+        )
+        map_with_error_catching = executor.map_with_error_catching
+
+    # input index => the value returned by the build worker
+    values = {}
+    # input index => index of the input built for the same program in this batch
+    copies = {}
+    if cache is not None:
+        # lower the batch first, and build only one input of each program that is not cached
+        lowered = map_with_error_catching(
+            local_lower_worker, [(inputs[i].serialize(), BuildFunc.build_func) for i in selected]
+        )
+        to_build = []
+        build_indices = {}
+        for i, res in zip(selected, lowered):
+            fingerprint = res.value[-1] if res.status == StatusKind.COMPLETE else None
+            if fingerprint is None:
+                # built to report its error
+                to_build.append(i)
+            elif fingerprint in known_fingerprints:
+                values[i] = res.value
+            elif fingerprint in build_indices:
+                values[i] = res.value
+                copies[i] = build_indices[fingerprint]
+            else:
+                build_indices[fingerprint] = i
+                to_build.append(i)
+        selected = to_build
+
+    build_args = [
+        (
+            inputs[i].serialize(),
+            BuildFunc.build_func,
+            verbose,
+            known_fingerprints,
+        )
+        for i in selected
+    ]
+    if BuildFunc.farm is not None:
+        tuple_res = map_with_error_catching(remote_build_worker, build_args)
+    else:
+        tuple_res = map_with_error_catching(local_build_worker, build_args)
 
-    results = []
-    for res in tuple_res:
+    results = {}
+    for i, res in zip(selected, tuple_res):
         if res.status == StatusKind.COMPLETE:
-            results.append(BuildResult(*res.value))
+            values[i] = _save_remote_build(res.value) if BuildFunc.farm is not None else res.value
         elif res.status == StatusKind.TIMEOUT:
             if verbose >= 1:
                 print(".T", end="", flush=True)  # Build timeout
-            results.append(BuildResult(None, [], MeasureErrorNo.BUILD_TIMEOUT, None, timeout))
+            results[i] = BuildResult(None, [], MeasureErrorNo.BUILD_TIMEOUT, None, timeout)
         elif res.status == StatusKind.EXCEPTION:
             if verbose >= 1:
                 print(".E", end="", flush=True)  # Build error
-            results.append(
-                BuildResult(None, [], MeasureErrorNo.COMPILE_HOST, repr(res.value), timeout)
+            results[i] = BuildResult(
+                None, [], MeasureErrorNo.COMPILE_HOST, repr(res.value), timeout
             )
         else:
             raise ValueError("Result status is not expected. Unreachable branch")
 
-    return results
+    for i, value in values.items():
+        filename, args, error_no, error_msg, time_cost, fingerprint = value
+        if fingerprint is not None and not filename.startswith(MeasureCache.HIT_PREFIX):
+            cache.fingerprints[filename] = fingerprint
+        results[i] = BuildResult(filename, args, error_no, error_msg, time_cost)
+    for i, j in copies.items():
+        if results[j].error_no != MeasureErrorNo.NO_ERROR:
+            # the program failed to build, so the other inputs of it fail as well
+            results[i] = results[j]
+
+    return [
+        results[i] if i in results else BuildResult(None, [], MeasureErrorNo.SCREENED, None, 0)
+        for i in range(len(inputs))
+    ]
+
+
+def _screen(inputs, screening):
+    """Get the indices of the inputs that pass the screening, ranked among the inputs of the
+    same task."""
+    # pylint: disable=import-outside-toplevel
+    from .feature import get_per_store_features_from_states, get_per_store_feature_names
+
+    names = get_per_store_feature_names()
+    groups = collections.OrderedDict()
+    for i, inp in enumerate(inputs):
+        groups.setdefault(inp.task.workload_key, []).append(i)
+    selected = []
+    for indices in groups.values():
+        features = get_per_store_features_from_states(
+            [inputs[i].state for i in indices], inputs[indices[0]].task
+        )
+        estimates = []
+        for fea in features:
+            fea = np.reshape(fea, (-1, len(names)))
+            # undo the log2p scaling of the features extracted for the cost model
+            fea = np.sign(fea) * (np.exp2(np.abs(fea)) - 1)
+            estimates.append(
+                screening.estimate_from_features({name: fea[:, j] for j, name in enumerate(names)})
+            )
+        selected.extend(indices[j] for j in screening.select(estimates))
+    return sorted(selected)
 
 
 TASK_INPUT_CHECK_FUNC_REGISTRY = {}
@@ -869,6 +1412,15 @@ def prepare_runner_args(inp, build_res):
     return args
 
 
+def _probe(func, dev, enable_cpu_cache_flush, args, reject_cost):
+    """Run a program once, and get its cost as the costs of a censored result if it is slower
+    than reject_cost, or None if it is not."""
+    f_prepare = "cache_flush_cpu_non_first_arg" if enable_cpu_cache_flush else ""
+    probe_f = func.time_evaluator(func.entry_name, dev, number=1, repeat=1, f_preproc=f_prepare)
+    cost = probe_f(*args).results[0]
+    return (cost,) if cost > reject_cost else None
+
+
 def _timed_eval_func(
     inp_serialized,
     build_res,
@@ -880,13 +1432,19 @@ def _timed_eval_func(
     enable_cpu_cache_flush,
     verbose,
     device,
+    persistent=False,
+    adaptive=None,
+    reject_cost=None,
 ):
     inp = MeasureInput.deserialize(inp_serialized)
     tic = time.time()
     error_no = 0
     error_msg = None
     try:
-        func = module.load_module(build_res.filename)
+        if persistent:
+            func = _load_module_under_unique_path(build_res.filename)
+        else:
+            func = module.load_module(build_res.filename)
         dev = ndarray.device(str(inp.task.target), device)
         # Limitation:
         # We can not get PackFunction directly in the remote mode as it is wrapped
@@ -901,6 +1459,7 @@ def _timed_eval_func(
             repeat=repeat,
             min_repeat_ms=min_repeat_ms,
             f_preproc=f_prepare,
+            **(adaptive or {}),
         )
     # pylint: disable=broad-except
     except Exception:
@@ -914,19 +1473,32 @@ def _timed_eval_func(
             assert random_fill, "Please make sure USE_RANDOM is ON in the config.cmake"
             assert len(args) == len(build_res.args)
             loc_args = []
+            # (shape, dtype) => number of the arguments of the shape and dtype
+            num_cached = {}
             # pylint: disable=consider-using-enumerate
             for idx in range(len(args)):
                 if args[idx] is None:
                     build_res_arg = build_res.args[idx]
-                    empty_array = ndarray.empty(
-                        get_const_tuple(build_res_arg.shape), build_res_arg.dtype, dev
-                    )
+                    shape = get_const_tuple(build_res_arg.shape)
+                    if persistent:
+                        # distinct arguments never share a buffer
+                        ct = num_cached.get((shape, build_res_arg.dtype), 0)
+                        num_cached[(shape, build_res_arg.dtype)] = ct + 1
+                        key = (shape, build_res_arg.dtype, str(dev), ct)
+                        loc_args.append(_cached_input_buffer(key, dev, random_fill))
+                        continue
+                    empty_array = ndarray.empty(shape, build_res_arg.dtype, dev)
                     random_fill(empty_array)
                     loc_args.append(empty_array)
                 else:
                     loc_args.append(ndarray.array(args[idx], dev))
             dev.sync()
-            costs = time_f(*loc_args).results
+            if reject_cost is not None:
+                costs = _probe(func, dev, enable_cpu_cache_flush, loc_args, reject_cost)
+                if costs is not None:
+                    error_no = MeasureErrorNo.CENSORED
+            if error_no == 0:
+                costs = time_f(*loc_args).results
         # pylint: disable=broad-except
         except Exception:
             costs = (MAX_FLOAT,)
@@ -940,12 +1512,15 @@ def _timed_eval_func(
     if verbose >= 1:
         if error_no == MeasureErrorNo.NO_ERROR:
             print("*", end="", flush=True)
+        elif error_no == MeasureErrorNo.CENSORED:
+            print("*R", end="", flush=True)  # Rejected by the probe run
         else:
             print("*E", end="", flush=True)  # Run error
     return costs, error_no, error_msg, toc - tic + build_res.time_cost, toc
 
 
 @tvm._ffi.register_func("auto_scheduler.local_runner.run")
+@_with_measure_cache
 def local_run(
     inputs,
     build_results,
@@ -1007,7 +1582,9 @@ def local_run(
 
     measure_results = []
     assert len(inputs) == len(build_results), "Measure input size should be equal to build results"
-    worker = PopenWorker()
+    persistent = PersistentRunner.current
+    worker = persistent.worker(device) if persistent is not None else PopenWorker()
+    adaptive = AdaptiveMeasure.options()
     for inp, build_res in zip(inputs, build_results):
         if build_res.error_no != 0:
             res = (
@@ -1034,6 +1611,9 @@ def local_run(
                     enable_cpu_cache_flush,
                     verbose,
                     device,
+                    persistent is not None,
+                    adaptive,
+                    EarlyRejection.reject_cost(inp),
                 ),
             )
             if isinstance(res, TimeoutError):
@@ -1058,6 +1638,7 @@ def local_run(
                 )
 
         measure_results.append(MeasureResult(*res))
+        EarlyRejection.update(inp, measure_results[-1])
 
     if verbose >= 1:
         print("", flush=True)
@@ -1081,6 +1662,8 @@ def _rpc_run(
     enable_cpu_cache_flush,
     verbose,
     device,
+    adaptive=None,
+    reject_cost=None,
 ):
     inp = MeasureInput.deserialize(inp_serialized)
     tic = time.time()
@@ -1105,6 +1688,7 @@ def _rpc_run(
             repeat=repeat,
             min_repeat_ms=min_repeat_ms,
             f_preproc=f_prepare,
+            **(adaptive or {}),
         )
     # pylint: disable=broad-except
     except Exception:
@@ -1140,7 +1724,12 @@ def _rpc_run(
             func.entry_func(*loc_args)
             dev.sync()
 
-            costs = time_f(*loc_args).results
+            if reject_cost is not None:
+                costs = _probe(func, dev, enable_cpu_cache_flush, loc_args, reject_cost)
+                if costs is not None:
+                    error_no = MeasureErrorNo.CENSORED
+            if error_no == 0:
+                costs = time_f(*loc_args).results
 
             # clean up remote files
             remote.remove(build_res.filename)
@@ -1161,6 +1750,8 @@ def _rpc_run(
     if verbose >= 1:
         if error_no == MeasureErrorNo.NO_ERROR:
             print("*", end="")
+        elif error_no == MeasureErrorNo.CENSORED:
+            print("*R", end="")  # Rejected by the probe run
         else:
             print("*E", end="")  # Run error
 
@@ -1180,7 +1771,7 @@ def _rpc_run_worker(args):
     res : MeasureResult
         The measure result of this Runner thread.
     """
-    _, build_res, _, _, _, _, _, timeout, _, _, _, _, _, verbose, _ = args
+    _, build_res, _, _, _, _, _, timeout, _, _, _, _, _, verbose, _, _, _ = args
     if build_res.error_no != MeasureErrorNo.NO_ERROR:
         return (
             (MAX_FLOAT,),
@@ -1208,6 +1799,7 @@ def _rpc_run_worker(args):
 
 
 @tvm._ffi.register_func("auto_scheduler.rpc_runner.run")
+@_with_measure_cache
 def rpc_runner_run(
     inputs,
     build_results,
@@ -1281,6 +1873,7 @@ def rpc_runner_run(
         The measure results of these MeasureInputs.
     """
     assert len(inputs) == len(build_results), "Measure input size should be equal to build results"
+    adaptive = AdaptiveMeasure.options()
     # This pool is not doing computationally intensive work, so we can use threads
     executor = PopenPoolExecutor(n_parallel)
     tuple_res = executor.map_with_error_catching(
@@ -1302,6 +1895,8 @@ def rpc_runner_run(
                 enable_cpu_cache_flush,
                 verbose,
                 device,
+                adaptive,
+                EarlyRejection.reject_cost(inp),
             )
             for inp, build_res in zip(inputs, build_results)
         ],
@@ -1325,6 +1920,8 @@ def rpc_runner_run(
                     time.time(),
                 )
             )
+    for inp, res in zip(inputs, results):
+        EarlyRejection.update(inp, res)
 
     if verbose >= 1:
         print("")
@@ -18,9 +18,12 @@
 
 """ Serialization and other I/O support for measurement records (tuning logs). """
 import argparse
+import json
 import logging
 import os
 import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -32,6 +35,8 @@ from . import _ffi_api
 
 logger = logging.getLogger("auto_scheduler")
 
+_json_decoder = json.JSONDecoder()
+
 
 @tvm._ffi.register_object("auto_scheduler.RecordToFile")
 class RecordToFile(MeasureCallback):
@@ -67,6 +72,7 @@ class RecordReader(Object):
             logger.warning("%s does not exist!", filename)
         # a set to prevent print duplicated message
         self.messages = set()
+        self.filename = filename
         self.__init_handle_by_constructor__(_ffi_api.RecordReader, filename)
 
     def check_workload_key(self, inputs):
@@ -125,6 +131,92 @@ class RecordReader(Object):
         self.check_workload_key(inputs)
         return inputs, results
 
+    def read_batches(
+        self,
+        batch_size=1024,
+        num_threads=None,
+        workload_key=None,
+        target=None,
+        include_compatible=False,
+    ):
+        """Generator: decode the log file in batches with multiple threads.
+
+        The file is read in chunks of `batch_size` lines. The workload key and target of
+        each line are peeked from the raw json before deserializing the full record, so
+        lines that do not match the filters cost almost nothing. The matching lines of a
+        chunk are decoded in a thread pool while the next chunks are being read.
+
+        Parameters
+        ----------
+        batch_size : int = 1024
+            The number of lines of the file in each chunk.
+        num_threads : Optional[int]
+            The number of decoding threads. None to use the number of CPUs.
+        workload_key : Optional[Union[str, List[str]]]
+            Only decode the records of these workload keys. None to decode all records.
+        target : Optional[tvm.target.Target]
+            Only decode the records whose target has the same kind. None for all targets.
+        include_compatible : bool = False
+            When set to True, the workload key filter only compares the workload hash,
+            so that compatible records are decoded as well.
+
+        Yields
+        ------
+        inputs : List[auto_scheduler.measure.MeasureInput]
+            The MeasureInputs of a batch, in the order of the file.
+        results : List[auto_scheduler.measure.MeasureResult]
+            The MeasureResults of a batch, in the order of the file.
+        """
+        if isinstance(workload_key, str):
+            workload_key = [workload_key]
+        if workload_key is not None:
+            if include_compatible:
+                workload_key = {decode_workload_key(key)[0] for key in workload_key}
+            else:
+                workload_key = set(workload_key)
+        target_kind = target.kind.name if target is not None else None
+
+        def _match(line):
+            if workload_key is None and target_kind is None:
+                return True
+            line_key, line_target = _peek_record_task(line)
+            if workload_key is not None:
+                if include_compatible:
+                    line_key = decode_workload_key(line_key)[0]
+                if line_key not in workload_key:
+                    return False
+            return target_kind is None or line_target.split(" ", 1)[0] == target_kind
+
+        def _decode(lines):
+            inputs, results = [], []
+            for line in lines:
+                inp, res = _ffi_api.ReadMeasureRecord(line)
+                inputs.append(inp)
+                results.append(res)
+            return inputs, results
+
+        num_threads = num_threads or os.cpu_count() or 1
+        # bound the number of chunks in flight so memory stays proportional to batch_size
+        max_pending = 2 * num_threads
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            pending = deque()
+            with open(self.filename) as infile:
+                while True:
+                    lines = list(itertools.islice(infile, batch_size))
+                    if not lines:
+                        break
+                    lines = [x for x in lines if x[0] not in "# \n" and _match(x)]
+                    if lines:
+                        pending.append(pool.submit(_decode, lines))
+                    while len(pending) > max_pending or (pending and pending[0].done()):
+                        inputs, results = pending.popleft().result()
+                        self.check_workload_key(inputs)
+                        yield inputs, results
+            while pending:
+                inputs, results = pending.popleft().result()
+                self.check_workload_key(inputs)
+                yield inputs, results
+
     def __iter__(self):
         while True:
             ret = _ffi_api.RecordReaderReadNext(self)
@@ -134,6 +226,23 @@ class RecordReader(Object):
             yield ret[0], ret[1]  # (input, result)
 
 
+def _peek_record_task(line):
+    """Get the workload key and the target string of a serialized record
+    without deserializing the full record."""
+    try:
+        # A record starts with {"i": [["workload_key", "target", ...
+        pos = line.index("[[") + 2
+        workload_key, pos = _json_decoder.raw_decode(line, pos)
+        pos = line.index(",", pos) + 1
+        while line[pos] == " ":
+            pos += 1
+        target, _ = _json_decoder.raw_decode(line, pos)
+    except (ValueError, IndexError):
+        task = json.loads(line)["i"][0]
+        workload_key, target = task[0], task[1]
+    return workload_key, target
+
+
 def load_record_from_string(record):
     """
     Load the measure record from string.
@@ -242,7 +351,10 @@ def load_best_record(filename, workload_key=None, target=None, include_compatibl
     best_inp = None
     best_res = None
 
-    for inp, res in log_reader:
+    batches = log_reader.read_batches(
+        workload_key=workload_key, target=target, include_compatible=include_compatible
+    )
+    for inp, res in itertools.chain.from_iterable(zip(*batch) for batch in batches):
         if res.error_no != MeasureErrorNo.NO_ERROR:
             continue
         if target and inp.task.target.kind.name != target.kind.name:
@@ -22,7 +22,9 @@ The details of the "gradient" strategy below can be found in the section 6 of th
 L. Zheng, C. Jia, M. Sun, Z. Wu, C. Yu, et al. "Ansor : Generating High-Performance Tensor
 Programs for Deep Learning." (OSDI 2020).
 """
+import concurrent.futures
 import os
+import queue
 import time
 import math
 import logging
@@ -202,6 +204,13 @@ class TaskScheduler:
     callbacks: Optional[List[TaskSchedulerCallback]]
         The task scheduler callbacks that will be called before and after tuning a task.
         If None, PrintTableInfo and LogEstimatedLatency callback will be used.
+    num_parallel_tasks: int = 1
+        The number of tasks tuned at the same time, e.g. the number of devices behind the
+        RPCRunner. Every task in flight searches and measures one round with its own
+        ProgramMeasurer, and a new task is chosen by the strategy among the idle tasks
+        whenever a round finishes. This is meant for an RPCRunner whose tracker serves
+        several devices; with a LocalRunner the concurrent rounds would interfere with
+        each other's measurements.
     """
 
     def __init__(
@@ -217,6 +226,7 @@ class TaskScheduler:
         gamma: float = 0.5,
         backward_window_size: int = 3,
         callbacks=None,
+        num_parallel_tasks: int = 1,
     ):
         self.tasks = tasks
         if objective_func:  # use custom objective function
@@ -234,6 +244,7 @@ class TaskScheduler:
         self.beta = beta
         self.gamma = gamma
         self.backward_window_size = backward_window_size
+        self.num_parallel_tasks = num_parallel_tasks
         self.callbacks = (
             callbacks
             if callbacks is not None
@@ -242,6 +253,7 @@ class TaskScheduler:
 
         assert len(self.tasks) != 0, "No tasks"
         assert self.strategy in ["round-robin", "gradient"]
+        assert self.num_parallel_tasks >= 1, "num_parallel_tasks must be positive"
 
         # task_cts[i] saves how many times task i is tuned
         self.task_cts = [0 for _ in range(len(self.tasks))]
@@ -350,6 +362,10 @@ class TaskScheduler:
             adapative_training,
         )
 
+        if self.num_parallel_tasks > 1:
+            self._tune_parallel()
+            return
+
         # do a round robin first to warm up
         for idx in range(len(self.tasks)):
             # skip warming up this task if it has been tuned before (restored from the log file)
@@ -361,86 +377,166 @@ class TaskScheduler:
         # use the specific strategy to choose workload to tune
         task_idx = -1
         while self.ct < tune_option.num_measure_trials and len(self.dead_tasks) < len(self.tasks):
-            if self.strategy == "round-robin":
-                task_idx = (task_idx + 1) % len(self.tasks)
-                while task_idx in self.dead_tasks:
-                    task_idx = (task_idx + 1) % len(self.tasks)
-            elif self.strategy == "gradient":
-                gradients = []
-                for i in range(len(self.tasks)):
-                    if i in self.dead_tasks:
-                        gradients.append(0)
-                        continue
-
-                    # compute gradient from chain rule : (delta f / delta g_i)
-                    delta = 1e-4
-                    new_costs = list(self.best_costs)
-                    new_costs[i] -= delta
-                    chain_grad = (
-                        self._compute_score(self.best_costs) - self._compute_score(new_costs)
-                    ) / delta
-
-                    # compute (g_i(t_i) - g(t_i - \Delta t)) / (\Delta t)
-                    if (
-                        self.task_cts[i] - 1 < len(self.task_costs_history[i])
-                        and self.task_cts[i] - 1 - self.backward_window_size >= 0
-                    ):
-                        backward_grad = (
-                            self.task_costs_history[i][self.task_cts[i] - 1]
-                            - self.task_costs_history[i][
-                                self.task_cts[i] - 1 - self.backward_window_size
-                            ]
-                        ) / self.backward_window_size
-                    else:
-                        backward_grad = 0
-
-                    # compute (g_i(t_i + \Delta t) - g(t_i)) / (\Delta t)
-                    g_next_1 = self.best_costs[i] - (self.best_costs[i] / self.task_cts[i])
-
-                    g_next_2 = self.beta * 1e30
-                    group_id = self.tag_to_group_id.get(self.task_tags[i], None)
-                    if group_id is not None and len(self.group_task_ids[group_id]) > 1:
-                        best_flops = max(
-                            [
-                                self.flop_cts[j] / self.best_costs[j]
-                                for j in self.group_task_ids[group_id]
-                            ]
-                        )
-                        g_next_2 = self.beta * self.flop_cts[i] / best_flops
-
-                    g_next = min(g_next_1, g_next_2)
-                    forward_grad = g_next - self.best_costs[i]
-
-                    # combine all grads
-                    grad = chain_grad * (
-                        self.alpha * backward_grad + (1 - self.alpha) * forward_grad
-                    )
-                    assert grad <= 0
-                    gradients.append(grad)
-
-                if max(gradients) == min(gradients):
-                    task_idx = np.random.choice(len(gradients))
+            task_idx = self._next_task(task_idx, self.dead_tasks)
+            self._tune_task(task_idx)
+            if self._check_early_stopping(task_idx):
+                break
+
+    def _tune_parallel(self):
+        """Tune up to `num_parallel_tasks` tasks at the same time, one round each, until the
+        trials are used up. A task is chosen by the strategy among the tasks that are neither
+        dead nor being tuned, whenever a round finishes."""
+        measurers = queue.Queue()
+        for i in range(self.num_parallel_tasks):
+            measurers.put(
+                self.measurer
+                if i == 0
+                else ProgramMeasurer(
+                    self.tune_option.builder,
+                    self.tune_option.runner,
+                    self.tune_option.measure_callbacks,
+                    self.tune_option.verbose,
+                )
+            )
+
+        def _search(task_idx):
+            measurer = measurers.get()
+            try:
+                return self.search_policies[task_idx].continue_search_one_round(
+                    self.num_measures_per_round, measurer
+                )
+            finally:
+                measurers.put(measurer)
+
+        running = {}  # future -> task_idx
+
+        def _submit(task_idx):
+            for callback in self.callbacks:
+                callback.pre_tune(self, task_idx)
+            running[executor.submit(_search, task_idx)] = task_idx
+
+        def _wait(check_early_stopping=False):
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            stop = False
+            for future in done:
+                task_idx = running.pop(future)
+                measure_inputs, measure_results = future.result()
+                self._update_task(task_idx, measure_inputs, measure_results)
+                if check_early_stopping:
+                    stop = self._check_early_stopping(task_idx) or stop
+            return stop
+
+        with concurrent.futures.ThreadPoolExecutor(self.num_parallel_tasks) as executor:
+            # do a round robin first to warm up
+            for idx in range(len(self.tasks)):
+                if not self.task_cts[idx]:
+                    if len(running) == self.num_parallel_tasks:
+                        _wait()
+                    _submit(idx)
+            while running:
+                _wait()
+            self.best_ct = self.ct
+            self.best_score = self.cur_score
+
+            task_idx = -1
+            stop = False
+            while not stop:
+                busy = self.dead_tasks | set(running.values())
+                pending_trials = len(running) * self.num_measures_per_round
+                if (
+                    len(busy) < len(self.tasks)
+                    and len(running) < self.num_parallel_tasks
+                    and self.ct + pending_trials < self.tune_option.num_measure_trials
+                ):
+                    task_idx = self._next_task(task_idx, busy)
+                    _submit(task_idx)
+                elif running:
+                    stop = _wait(check_early_stopping=True)
                 else:
-                    task_idx = np.argmin(gradients)
+                    break
+            # let the rounds in flight finish, their measurements are already paid for
+            while running:
+                _wait()
+
+    def _next_task(self, task_idx, excluded):
+        """Choose the next task to tune with the strategy, among the tasks not in `excluded`"""
+        if self.strategy == "round-robin":
+            task_idx = (task_idx + 1) % len(self.tasks)
+            while task_idx in excluded:
+                task_idx = (task_idx + 1) % len(self.tasks)
+            return task_idx
+        if self.strategy != "gradient":
+            raise ValueError("Invalid strategy: " + self.strategy)
+
+        gradients = []
+        for i in range(len(self.tasks)):
+            if i in excluded:
+                gradients.append(0)
+                continue
+
+            # compute gradient from chain rule : (delta f / delta g_i)
+            delta = 1e-4
+            new_costs = list(self.best_costs)
+            new_costs[i] -= delta
+            chain_grad = (
+                self._compute_score(self.best_costs) - self._compute_score(new_costs)
+            ) / delta
+
+            # compute (g_i(t_i) - g(t_i - \Delta t)) / (\Delta t)
+            if (
+                self.task_cts[i] - 1 < len(self.task_costs_history[i])
+                and self.task_cts[i] - 1 - self.backward_window_size >= 0
+            ):
+                backward_grad = (
+                    self.task_costs_history[i][self.task_cts[i] - 1]
+                    - self.task_costs_history[i][self.task_cts[i] - 1 - self.backward_window_size]
+                ) / self.backward_window_size
             else:
-                raise ValueError("Invalid strategy: " + self.strategy)
+                backward_grad = 0
 
-            self._tune_task(task_idx)
-            self._adjust_similarity_group(task_idx)
+            # compute (g_i(t_i + \Delta t) - g(t_i)) / (\Delta t)
+            g_next_1 = self.best_costs[i] - (self.best_costs[i] / self.task_cts[i])
 
-            if self.cur_score < self.best_score:
-                self.best_score = self.cur_score
-                self.best_ct = self.ct
-            elif self.ct - self.best_ct >= self.early_stopping_all and all(
-                cost < 1e9 for cost in self.best_costs
-            ):
-                if self.tune_option.verbose >= 1:
-                    print(
-                        "Stop early since no performance improvement in the last "
-                        + str(self.early_stopping_all)
-                        + " measurement trials."
-                    )
-                break
+            g_next_2 = self.beta * 1e30
+            group_id = self.tag_to_group_id.get(self.task_tags[i], None)
+            if group_id is not None and len(self.group_task_ids[group_id]) > 1:
+                best_flops = max(
+                    [self.flop_cts[j] / self.best_costs[j] for j in self.group_task_ids[group_id]]
+                )
+                g_next_2 = self.beta * self.flop_cts[i] / best_flops
+
+            g_next = min(g_next_1, g_next_2)
+            forward_grad = g_next - self.best_costs[i]
+
+            # combine all grads
+            grad = chain_grad * (self.alpha * backward_grad + (1 - self.alpha) * forward_grad)
+            assert grad <= 0
+            gradients.append(grad)
+
+        if max(gradients) == min(gradients):
+            return np.random.choice([i for i in range(len(self.tasks)) if i not in excluded])
+        return int(np.argmin(gradients))
+
+    def _check_early_stopping(self, task_idx):
+        """Update the best score after a round of the task, and check whether to stop early"""
+        self._adjust_similarity_group(task_idx)
+
+        if self.cur_score < self.best_score:
+            self.best_score = self.cur_score
+            self.best_ct = self.ct
+        elif self.ct - self.best_ct >= self.early_stopping_all and all(
+            cost < 1e9 for cost in self.best_costs
+        ):
+            if self.tune_option.verbose >= 1:
+                print(
+                    "Stop early since no performance improvement in the last "
+                    + str(self.early_stopping_all)
+                    + " measurement trials."
+                )
+            return True
+        return False
 
     def _tune_task(self, task_idx):
         """Tune the select task for one round"""
@@ -452,7 +548,10 @@ class TaskScheduler:
         measure_inputs, measure_results = self.search_policies[task_idx].continue_search_one_round(
             self.num_measures_per_round, self.measurer
         )
+        self._update_task(task_idx, measure_inputs, measure_results)
 
+    def _update_task(self, task_idx, measure_inputs, measure_results):
+        """Update the status with the results of a round of the task"""
         self.task_cts[task_idx] += 1
 
         for res in measure_results:
@@ -31,6 +31,7 @@ from . import database
 from . import feature
 from . import measure
 from . import record
+from . import record_store
 from . import task
 from . import tuner
 from . import utils
@@ -43,6 +44,7 @@ from .measure import (
     MeasureInput,
     MeasureResult,
     MeasureErrorNo,
+    MeasureCache,
     LocalBuilder,
     LocalRunner,
     RPCRunner,
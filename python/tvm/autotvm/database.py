@@ -20,6 +20,7 @@ Database of MeasureInput/MeasureResult pair.
 This can be used for replaying measurement.
 """
 import os
+import sqlite3
 
 from .record import encode, decode, measure_str_key
 
@@ -188,6 +189,80 @@ class RedisDatabase(Database):
         self.db.flushdb()
 
 
+class SQLiteDatabase(Database):
+    """
+    Local file version of record database, backed by SQLite.
+    It needs no outside service and can be shared by several tuning processes on one host.
+
+    Parameters
+    ----------
+    filename: str
+        The path of the database file. It is created if it does not exist.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.db = sqlite3.connect(filename, timeout=60)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, row TEXT NOT NULL)"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS records_key ON records (key)")
+
+    def _load_rows(self, key):
+        cursor = self.db.execute("SELECT row FROM records WHERE key = ? ORDER BY id", (key,))
+        records = [decode(row) for (row,) in cursor]
+        return [rec for rec in records if rec is not None]
+
+    def load(self, inp, get_all=False):
+        records = self._load_rows(measure_str_key(inp))
+        if not records:
+            return None
+        results = [rec[1] for rec in records]
+        if get_all:
+            return results
+        return max(results, key=lambda result: result.timestamp)
+
+    def save(self, inp, res, extend=False):
+        key = measure_str_key(inp)
+        with self.db:
+            if not extend:
+                self.db.execute("DELETE FROM records WHERE key = ?", (key,))
+            self.db.execute("INSERT INTO records (key, row) VALUES (?, ?)", (key, encode(inp, res)))
+
+    def filter(self, func):
+        """
+        Dump all of the records that match the given rule
+
+        Parameters
+        ----------
+        func: callable
+            The signature of the function is (MeasureInput, [MeasureResult]) -> bool
+
+        Returns
+        -------
+        list of records in tuple (MeasureInput, MeasureResult) matching the rule
+        """
+        matched_records = list()
+        keys = [key for (key,) in self.db.execute("SELECT DISTINCT key FROM records")]
+        for key in keys:
+            records = self._load_rows(key)
+            if not records:
+                continue
+            inps, results = zip(*records)
+            inp = inps[0]
+            if not func(inp, results):
+                continue
+            result = max(results, key=lambda res: res.timestamp)
+            matched_records.append((inp, result))
+        return matched_records
+
+    def flush(self):
+        with self.db:
+            self.db.execute("DELETE FROM records")
+
+
 class DummyDatabase(RedisDatabase):
     """
     A database based on python dictionary for testing.
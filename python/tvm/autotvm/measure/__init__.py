@@ -20,6 +20,7 @@ from .measure import (
     MeasureInput,
     MeasureResult,
     MeasureErrorNo,
+    MeasureCache,
     measure_option,
     create_measure_batch,
 )
@@ -28,6 +29,7 @@ from .measure_methods import (
     LocalRunner,
     RPCRunner,
     default_module_loader,
+    lease_remote,
     request_remote,
 )
 from .executor import Executor
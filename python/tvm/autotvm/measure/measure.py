@@ -17,9 +17,17 @@
 # pylint: disable=pointless-string-statement,consider-using-enumerate,invalid-name
 """User facing API for specifying how to measure the generated code"""
 import enum
+import functools
+import logging
 import multiprocessing
+import threading
+import time
 from collections import namedtuple
 
+from tvm.contrib.popen_pool import StatusKind
+
+logger = logging.getLogger("autotvm")
+
 
 class MeasureInput(namedtuple("MeasureInput", ["target", "task", "config"])):
     """
@@ -77,6 +85,8 @@ class MeasureErrorNo(enum.IntEnum):
     BUILD_TIMEOUT = 6  # timeout during compilation
     RUN_TIMEOUT = 7  # timeout during run
     UNKNOWN_ERROR = 8  # unknown error
+    CENSORED = 9  # rejected after a probe run much slower than the best config, costs has its time
+    SCREENED = 10  # not built because a roofline model ranked it among the slow configs of a batch
 
 
 class Builder(object):
@@ -197,7 +207,62 @@ class Runner(object):
         raise NotImplementedError()
 
 
-def measure_option(builder, runner):
+class MeasureCache(object):
+    """Cache of measurement results keyed by the fingerprint of the lowered program.
+
+    Different configs often lower to the identical program, e.g. splits that collapse
+    after simplification. With a cache, the builder lowers each config but only compiles
+    and runs programs whose fingerprint has not been measured yet, and reuses the earlier
+    result for the others. The configs of a batch that share a program are compiled and run
+    once as well. Only successful results are cached.
+    The fingerprint includes the target, so a cache can be shared across tasks and tuners.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.results)
+
+    def __contains__(self, fingerprint):
+        return fingerprint in self.results
+
+    def get(self, fingerprint, build_time=0):
+        """Get a copy of the cached result of a fingerprint
+
+        Parameters
+        ----------
+        fingerprint: str
+            The fingerprint of the lowered program
+        build_time: float
+            The time spent lowering the program, reported as the all_cost of the result
+
+        Returns
+        -------
+        result: MeasureResult or None
+        """
+        res = self.results.get(fingerprint)
+        if res is None:
+            return None
+        self.hits += 1
+        return MeasureResult(res.costs, res.error_no, build_time, time.time())
+
+    def put(self, fingerprint, result):
+        """Cache the result of a fingerprint if it is successful
+
+        Parameters
+        ----------
+        fingerprint: str
+            The fingerprint of the lowered program
+        result: MeasureResult
+            The measured result
+        """
+        if fingerprint is not None and result.error_no == MeasureErrorNo.NO_ERROR:
+            self.results.setdefault(fingerprint, result)
+
+
+def measure_option(builder, runner, cache=None, screening=None):
     """
     Set options for measure. To measure a config, we will build it and run it.
     So we have to set options for these two steps.
@@ -209,6 +274,15 @@ def measure_option(builder, runner):
         Specify how to build programs
     runner: Runner
         Specify how to run programs
+    cache: MeasureCache or bool, optional
+        If given, configs that lower to a program that was already measured are not
+        compiled or run again. Pass True to create a new cache, or pass the same
+        MeasureCache to several tuners to share it. Requires a LocalBuilder.
+    screening: tvm.utils.RooflineScreening, optional
+        If given, the configs of a batch are lowered and ranked by the run time a roofline
+        model estimates from their features, and only the fastest `screening.ratio` of them
+        are built and measured. The others get the error number `MeasureErrorNo.SCREENED`.
+        Requires a LocalBuilder.
 
     Examples
     --------
@@ -252,9 +326,18 @@ def measure_option(builder, runner):
         else:
             raise ValueError("Invalid runner: " + runner)
 
+    if isinstance(cache, bool):
+        cache = MeasureCache() if cache else None
+    if cache is not None and not isinstance(builder, LocalBuilder):
+        raise ValueError("MeasureCache requires a LocalBuilder")
+    if screening is not None and not isinstance(builder, LocalBuilder):
+        raise ValueError("Screening requires a LocalBuilder")
+
     opt = {
         "builder": builder,
         "runner": runner,
+        "cache": cache,
+        "screening": screening,
     }
 
     return opt
@@ -274,7 +357,9 @@ def create_measure_batch(task, option):
     Returns
     -------
     measure_batch: callable
-        a callback function to measure a batch of configs
+        a callback function to measure a batch of configs.
+        Its attributes `build(measure_inputs)` and `run(measure_inputs, build_results)`
+        are the two stages of the measurement, which can be called separately.
     """
     builder = option["builder"]
     runner = option["runner"]
@@ -286,11 +371,132 @@ def create_measure_batch(task, option):
     build_kwargs = runner.get_build_kwargs()
     builder.set_task(task, build_kwargs)
 
-    def measure_batch(measure_inputs):
-        build_results = builder.build(measure_inputs)
-        results = runner.run(measure_inputs, build_results)
+    cache = option.get("cache")
+    if hasattr(builder, "known_fingerprints"):
+        builder.known_fingerprints = None
+    # build_batch and run_batch may be called from different threads by a pipelined tuner
+    cache_lock = threading.Lock()
+
+    screening = option.get("screening")
+
+    def build_distinct(measure_inputs):
+        """Build a batch, compiling only one config of each program that is not cached"""
+        if cache is None:
+            return builder.build(measure_inputs)
+        # pylint: disable=import-outside-toplevel
+        from .measure_methods import _lower_build_func
+
+        # lower the whole batch first to find the configs of the same program
+        results = [
+            res.value if res.status == StatusKind.COMPLETE else None
+            for res in builder.executor.map_with_error_catching(
+                functools.partial(
+                    _lower_build_func, runtime=builder.build_func.runtime, **builder.build_kwargs
+                ),
+                measure_inputs,
+            )
+        ]
+        with cache_lock:
+            builder.known_fingerprints = frozenset(cache.results)
+        to_build = []
+        # fingerprint => index of the config of the batch that is built for the program
+        build_indices = {}
+        for k, res in enumerate(results):
+            # a config that failed to lower is built to report its error
+            if res is None or res.fingerprint is None:
+                to_build.append(k)
+            elif res.fingerprint not in builder.known_fingerprints:
+                if res.fingerprint not in build_indices:
+                    to_build.append(k)
+                    build_indices[res.fingerprint] = k
+        for k, res in zip(to_build, builder.build([measure_inputs[k] for k in to_build])):
+            results[k] = res
+        for k, res in enumerate(results):
+            built = results[build_indices.get(getattr(res, "fingerprint", None), k)]
+            if not hasattr(built, "filename"):
+                # the program failed to build, so the other configs of it fail as well
+                results[k] = built
+        return results
+
+    def build_batch(measure_inputs):
+        if screening is None:
+            return build_distinct(measure_inputs)
+
+        estimates = [
+            res.value if res.status == StatusKind.COMPLETE else float("inf")
+            for res in builder.executor.map_with_error_catching(
+                functools.partial(_estimate_run_time, screening), measure_inputs
+            )
+        ]
+        selected = screening.select(estimates)
+        logger.debug("Screening: build %d configs of a batch of %d", len(selected), len(estimates))
+        results = [
+            MeasureResult((estimates[k],), MeasureErrorNo.SCREENED, 0, time.time())
+            for k in range(len(measure_inputs))
+        ]
+        for k, res in zip(selected, build_distinct([measure_inputs[k] for k in selected])):
+            results[k] = res
         return results
 
+    def run_batch(measure_inputs, build_results):
+        if cache is None:
+            return runner.run(measure_inputs, build_results)
+
+        results = [None] * len(measure_inputs)
+        to_run = []
+        # fingerprint => index of the config of the batch that is run for the program
+        run_indices = {}
+        for k, build_res in enumerate(build_results):
+            # a config without a file has the program of a cached or of a run config
+            if getattr(build_res, "filename", True) is not None:
+                to_run.append(k)
+                run_indices.setdefault(getattr(build_res, "fingerprint", None), k)
+
+        if to_run:
+            run_results = runner.run(
+                [measure_inputs[k] for k in to_run], [build_results[k] for k in to_run]
+            )
+            for k, res in zip(to_run, run_results):
+                results[k] = res
+
+        with cache_lock:
+            for k in to_run:
+                cache.put(getattr(build_results[k], "fingerprint", None), results[k])
+            for k, build_res in enumerate(build_results):
+                if results[k] is not None:
+                    continue
+                if build_res.fingerprint in cache:
+                    results[k] = cache.get(build_res.fingerprint, build_res.time_cost)
+                else:
+                    # the result of a failed run is shared, but not cached
+                    res = results[run_indices[build_res.fingerprint]]
+                    results[k] = MeasureResult(
+                        res.costs, res.error_no, build_res.time_cost, time.time()
+                    )
+
+        logger.debug(
+            "MeasureCache: %d hits in a batch of %d", len(results) - len(to_run), len(results)
+        )
+        return results
+
+    def measure_batch(measure_inputs):
+        return run_batch(measure_inputs, build_batch(measure_inputs))
+
+    # the two stages of measure_batch, for tuners that overlap building and running
+    measure_batch.build = build_batch
+    measure_batch.run = run_batch
     measure_batch.n_parallel = builder.n_parallel
     measure_batch.attach_objects = attach_objects
     return measure_batch
+
+
+def _estimate_run_time(screening, measure_input):
+    """Lower a config and estimate its run time with the roofline model of the screening"""
+    # pylint: disable=import-outside-toplevel
+    from tvm.driver import lower
+
+    target, task, config = measure_input
+    with target:
+        sch, args = task.instantiate(config)
+        mod = lower(sch, args)
+    return screening.estimate(mod["main"])
@@ -42,7 +42,7 @@ from tvm import rpc as _rpc
 from tvm.autotvm.env import AutotvmGlobalScope, reset_global_scope
 from tvm.contrib import ndk, stackvm, tar
 from tvm.contrib.popen_pool import PopenPoolExecutor
-from tvm.driver import build
+from tvm.driver import build, lower
 from tvm.error import TVMError
 from tvm.target import Target
 
@@ -54,20 +54,29 @@ from .measure import Builder, MeasureErrorNo, MeasureResult, Runner
 logger = logging.getLogger("autotvm")
 
 
-class BuildResult(namedtuple("BuildResult", ("filename", "arg_info", "error", "time_cost"))):
+class BuildResult(
+    namedtuple(
+        "BuildResult",
+        ("filename", "arg_info", "error", "time_cost", "fingerprint"),
+        defaults=(None,),
+    )
+):
     """
     Stores all the necessary inputs for a measurement.
 
     Parameters
     ----------
     filename : str
-        The filename of generated library
+        The filename of generated library.
+        It is None if the build was skipped because of a measure cache hit.
     arg_info : Tuple
         The shape and dtype information of tvm tensor arguments
     error : Exception
         The error happens during compilation.
     time_cost : float
         The time cost of building
+    fingerprint : Optional[str]
+        The fingerprint of the lowered program, only computed when a MeasureCache is used.
     """
 
 
@@ -92,8 +101,19 @@ class LocalBuilder(Builder):
         If False, do not fork when building. Requires n_parallel=1.
     runtime: Optional[Runtime]
         Specify the runtime to generate artifacts for
+    warm_workers: int
+        The number of spare build processes to keep started in the background while the
+        builder is alive, see `tvm.contrib.popen_pool.PopenPoolExecutor`.
+    shared_memory_threshold: Optional[int]
+        Build tasks and results of at least this number of bytes are passed to and from the
+        build processes through shared memory, see `tvm.contrib.popen_pool.PopenPoolExecutor`.
+        If None, they are always passed through pipes.
     """
 
+    # Set by create_measure_batch when a MeasureCache is used. Configs whose lowered program
+    # has one of these fingerprints are lowered but not compiled.
+    known_fingerprints = None
+
     def __init__(
         self,
         timeout=10,
@@ -102,6 +122,8 @@ class LocalBuilder(Builder):
         build_func="default",
         do_fork=False,
         runtime=None,
+        warm_workers=0,
+        shared_memory_threshold=None,
     ):
         super(LocalBuilder, self).__init__(timeout, n_parallel, build_kwargs)
 
@@ -121,20 +143,32 @@ class LocalBuilder(Builder):
                 1,
             ), f"if do_fork=False, need n_parallel=None or 1; got {n_parallel}"
         self.executor = PopenPoolExecutor(
-            timeout=timeout, initializer=reset_global_scope, initargs=(AutotvmGlobalScope.current,)
+            timeout=timeout,
+            initializer=reset_global_scope,
+            initargs=(AutotvmGlobalScope.current,),
+            warm_workers=warm_workers,
+            shared_memory_threshold=shared_memory_threshold,
         )
         self.tmp_dir = tempfile.mkdtemp()
+        self._prev_tmp_dir = None
 
     def build(self, measure_inputs):
         results = []
 
-        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        # a pipelined tuner runs the modules of the previous build while this one builds,
+        # so only the modules of the build before it are removed
+        if self._prev_tmp_dir is not None:
+            shutil.rmtree(self._prev_tmp_dir, ignore_errors=True)
+        self._prev_tmp_dir = self.tmp_dir
         self.tmp_dir = tempfile.mkdtemp()
 
         for i in range(0, len(measure_inputs), self.n_parallel):
             futures = []
             for inp in measure_inputs[i : i + self.n_parallel]:
-                ret = self.executor.submit(self.build_func, inp, self.tmp_dir, **self.build_kwargs)
+                build_kwargs = self.build_kwargs
+                if self.known_fingerprints is not None:
+                    build_kwargs = dict(build_kwargs, known_fingerprints=self.known_fingerprints)
+                ret = self.executor.submit(self.build_func, inp, self.tmp_dir, **build_kwargs)
                 futures.append(ret)
 
             for future in futures:
@@ -256,6 +290,24 @@ class RPCRunner(Runner):
     module_loader : ModuleLoader
         If given, a context manager that loads the module to be timed into the remote runtime.
         If not given, default_module_loader is used.
+    target_rel_error: float, optional
+        If set, the measurement is adaptive: batches of `repeat` costs are taken until the
+        95% confidence interval of the mean cost is within this error relative to the mean,
+        or `max_time_ms` runs out. See `tvm.runtime.Module.time_evaluator`.
+    max_time_ms: float, optional
+        The time budget of an adaptive measurement in milliseconds.
+    early_reject_ratio: float, optional
+        If set, each config is first run once as a probe, and is not measured further if the
+        probe is slower than this ratio times the best mean cost of the task so far. Such a
+        config gets a result with error_no CENSORED, whose costs hold the probe time.
+    reuse_sessions: bool, optional
+        Whether the default module loader reuses warm RPC sessions across measurements,
+        see `tvm.rpc.SessionPool`. An idle session keeps its device reserved, so n_parallel
+        should not exceed the number of devices.
+    compression: List[str], optional
+        If set, the default module loader compresses the uploaded modules and the reference
+        inputs with the first of these codecs the device supports, see
+        `tvm.rpc.RPCSession.set_compression`. Worth it on slow links to the devices.
     """
 
     def __init__(
@@ -272,6 +324,11 @@ class RPCRunner(Runner):
         cooldown_interval=0.1,
         enable_cpu_cache_flush=False,
         module_loader=None,
+        target_rel_error=None,
+        max_time_ms=None,
+        early_reject_ratio=None,
+        reuse_sessions=False,
+        compression=None,
     ):
         super(RPCRunner, self).__init__(timeout, n_parallel)
 
@@ -284,11 +341,17 @@ class RPCRunner(Runner):
         self.number = number
         self.repeat = repeat
         self.min_repeat_ms = min_repeat_ms
+        self.target_rel_error = target_rel_error
+        self.max_time_ms = max_time_ms
+        self.early_reject_ratio = early_reject_ratio
+        self.best_cost = None
         self._ref_input = None
 
         self.enable_cpu_cache_flush = enable_cpu_cache_flush
         self.cooldown_interval = cooldown_interval
         self.module_loader = module_loader
+        self.reuse_sessions = reuse_sessions
+        self.compression = compression
 
         self.executor = PopenPoolExecutor(
             timeout=timeout * (self.n_parallel + 1),
@@ -318,6 +381,7 @@ class RPCRunner(Runner):
 
     def set_task(self, task):
         self.task = task
+        self.best_cost = None
 
         if check_remote(task.target, self.key, self.host, self.port):
             logger.info("Get devices for measurement successfully!")
@@ -361,6 +425,9 @@ class RPCRunner(Runner):
         )
 
         for i in range(0, len(measure_inputs), self.n_parallel):
+            reject_cost = None
+            if self.early_reject_ratio is not None and self.best_cost is not None:
+                reject_cost = self.early_reject_ratio * self.best_cost
             futures = []
             for measure_inp, build_res in zip(
                 measure_inputs[i : i + self.n_parallel], build_results[i : i + self.n_parallel]
@@ -368,7 +435,9 @@ class RPCRunner(Runner):
                 module_loader = (
                     self.module_loader
                     if self.module_loader is not None
-                    else default_module_loader()
+                    else default_module_loader(
+                        reuse_sessions=self.reuse_sessions, compression=self.compression
+                    )
                 )
                 ret = self.executor.submit(
                     run_through_rpc,
@@ -382,6 +451,9 @@ class RPCRunner(Runner):
                     self.ref_input,
                     self.enable_cpu_cache_flush,
                     module_loader,
+                    self.target_rel_error,
+                    self.max_time_ms,
+                    reject_cost,
                 )
                 futures.append(ret)
 
@@ -403,6 +475,13 @@ class RPCRunner(Runner):
                         )
                     )
 
+            if self.early_reject_ratio is not None:
+                for res in results[i:]:
+                    if res.error_no == MeasureErrorNo.NO_ERROR:
+                        cost = sum(res.costs) / len(res.costs)
+                        if self.best_cost is None or cost < self.best_cost:
+                            self.best_cost = cost
+
         return results
 
 
@@ -437,6 +516,20 @@ class LocalRunner(RPCRunner):
         its actual latency during end-to-end inference.
         To make this option effective, the argument `number` should also be set to 1.
         This is only has effect on CPU task.
+    target_rel_error: float, optional
+        If set, the measurement is adaptive: batches of `repeat` costs are taken until the
+        95% confidence interval of the mean cost is within this error relative to the mean,
+        or `max_time_ms` runs out. See `tvm.runtime.Module.time_evaluator`.
+    max_time_ms: float, optional
+        The time budget of an adaptive measurement in milliseconds.
+    early_reject_ratio: float, optional
+        If set, each config is first run once as a probe, and is not measured further if the
+        probe is slower than this ratio times the best mean cost of the task so far. Such a
+        config gets a result with error_no CENSORED, whose costs hold the probe time.
+    reuse_sessions: bool, optional
+        Whether the default module loader reuses warm RPC sessions across measurements.
+    compression: List[str], optional
+        If set, the default module loader compresses the transfers with these codecs.
     Note
     ----
     This is a "fake" local mode. We start a silent rpc tracker and rpc server
@@ -452,6 +545,11 @@ class LocalRunner(RPCRunner):
         cooldown_interval=0.1,
         enable_cpu_cache_flush=False,
         module_loader=None,
+        target_rel_error=None,
+        max_time_ms=None,
+        early_reject_ratio=None,
+        reuse_sessions=False,
+        compression=None,
     ):
         super(LocalRunner, self).__init__(
             "",
@@ -466,6 +564,11 @@ class LocalRunner(RPCRunner):
             cooldown_interval=cooldown_interval,
             enable_cpu_cache_flush=enable_cpu_cache_flush,
             module_loader=module_loader,
+            target_rel_error=target_rel_error,
+            max_time_ms=max_time_ms,
+            early_reject_ratio=early_reject_ratio,
+            reuse_sessions=reuse_sessions,
+            compression=compression,
         )
         self.tracker = None
         self.server = None
@@ -493,8 +596,37 @@ class LocalRunner(RPCRunner):
         return server, tracker
 
 
-def _build_func_common(measure_input, runtime=None, check_gpu=None, build_option=None):
-    """Common part for building a configuration"""
+def measure_fingerprint(mod, target):
+    """Get the fingerprint of a lowered program, used as the key of a MeasureCache.
+
+    Parameters
+    ----------
+    mod: IRModule
+        The lowered program
+    target: Target
+        The target the program is built for
+
+    Returns
+    -------
+    fingerprint: str
+        The structural hash of the program together with the target
+    """
+    return "%x:%s" % (tvm.ir.structural_hash(mod), str(target))
+
+
+def _build_func_common(
+    measure_input,
+    runtime=None,
+    check_gpu=None,
+    build_option=None,
+    known_fingerprints=None,
+    lower_only=False,
+):
+    """Common part for building a configuration.
+    If known_fingerprints is not None or lower_only is True, the fingerprint of the lowered
+    program is returned as well, and the program is not compiled when its fingerprint is
+    known or when lower_only is True."""
+    fingerprint = None
     target, task, config = measure_input
     target, task.target_host = Target.canon_target_and_host(target, task.target_host)
 
@@ -520,8 +652,40 @@ def _build_func_common(measure_input, runtime=None, check_gpu=None, build_option
             func = vta.build(s, args, target_host=task.target_host)
         else:
             with tvm.ir.transform.PassContext(config=opts):
-                func = build(s, args, target_host=task.target_host, runtime=runtime)
-    return func, tuple((get_const_tuple(x.shape), x.dtype) for x in args)
+                if known_fingerprints is None and not lower_only:
+                    func = build(s, args, target_host=task.target_host, runtime=runtime)
+                else:
+                    mod = lower(s, args, name="default_function")
+                    fingerprint = measure_fingerprint(mod, target)
+                    if lower_only or fingerprint in known_fingerprints:
+                        func = None
+                    else:
+                        func = build(mod, target_host=task.target_host, runtime=runtime)
+    return func, tuple((get_const_tuple(x.shape), x.dtype) for x in args), fingerprint
+
+
+def _lower_build_func(measure_input, runtime=None, **kwargs):
+    """Lower a configuration without compiling it, to get the fingerprint of its program.
+
+    Parameters
+    ----------
+    measure_input: MeasureInput
+        The input of measurement
+    runtime: Optional[Runtime]
+        The runtime the program would be built for
+    kwargs: dict
+        The build_kwargs of the LocalBuilder
+
+    Returns
+    -------
+    result: BuildResult
+        A build result without a file, which holds the fingerprint of the program
+    """
+    tic = time.time()
+    _, arg_info, fingerprint = _build_func_common(
+        measure_input, runtime, lower_only=True, **kwargs
+    )
+    return BuildResult(None, arg_info, None, time.time() - tic, fingerprint)
 
 
 class _WrappedBuildFunc:
@@ -568,7 +732,12 @@ class _WrappedBuildFunc:
                 tmp_dir, "tmp_func_%0x.%s" % (getrandbits(64), self.build_func.output_format)
             )
             # TODO(tvm-team) consider linline _build_func_common
-            func, arg_info = _build_func_common(measure_input, self.runtime, **kwargs)
+            func, arg_info, fingerprint = _build_func_common(
+                measure_input, self.runtime, **kwargs
+            )
+            if func is None:
+                # the result of an identical program is in the measure cache
+                return BuildResult(None, arg_info, None, time.time() - tic, fingerprint)
             if self.build_func.output_format == ".model-library-format":
                 # Late import to preserve autoTVM with USE_MICRO OFF
                 try:
@@ -581,7 +750,7 @@ class _WrappedBuildFunc:
         except Exception as e:  # pylint: disable=broad-except
             tb = traceback.format_exc()
             return BuildResult(None, None, (tb, e), time.time() - tic)
-        return BuildResult(filename, arg_info, None, time.time() - tic)
+        return BuildResult(filename, arg_info, None, time.time() - tic, fingerprint)
 
 
 ModuleLoader = typing.Callable[
@@ -600,6 +769,9 @@ def run_through_rpc(
     ref_input,
     enable_cpu_cache_flush=False,
     module_loader=None,
+    target_rel_error=None,
+    max_time_ms=None,
+    reject_cost=None,
 ):
     """Run a generated library through rpc
 
@@ -639,6 +811,13 @@ def run_through_rpc(
         This is only has effect on CPU task.
     module_loader: ModuleLoader
         A function that returns a ContextManager used to establish and teardown the remote session.
+    target_rel_error: float, optional
+        If set, measure adaptively until the mean cost is within this relative error.
+    max_time_ms: float, optional
+        The time budget of an adaptive measurement in milliseconds.
+    reject_cost: float, optional
+        If set, run the config once as a probe first, and return a CENSORED result with the
+        probe time if it is slower than reject_cost seconds.
     """
     if isinstance(build_result, MeasureResult):
         return build_result
@@ -663,10 +842,12 @@ def run_through_rpc(
                 repeat=repeat,
                 min_repeat_ms=min_repeat_ms,
                 f_preproc=f_prepare,
+                target_rel_error=target_rel_error,
+                max_time_ms=max_time_ms,
             )
 
             if ref_input:
-                args = [nd.array(x, device=dev) for x in ref_input]
+                args = [remote.upload_array(x, dev) for x in ref_input]
             else:
                 try:
                     random_fill = remote.get_function("tvm.contrib.random.random_fill")
@@ -682,7 +863,16 @@ def run_through_rpc(
                         random_fill(arg)
                 dev.sync()
 
-            costs = time_f(*args).results
+            if reject_cost is not None:
+                probe_f = mod.time_evaluator(
+                    mod.entry_name, dev, number=1, repeat=1, f_preproc=f_prepare
+                )
+                probe_cost = probe_f(*args).results[0]
+                if probe_cost > reject_cost:
+                    errno = MeasureErrorNo.CENSORED
+                    costs = (probe_cost,)
+            if errno == MeasureErrorNo.NO_ERROR:
+                costs = time_f(*args).results
 
         if len(costs) > 2:  # remove largest and smallest value to reduce variance
             costs = list(costs)
@@ -707,27 +897,41 @@ def run_through_rpc(
 class DefaultModuleLoader:
     """See default_module_loader(). A pickleable emulation of the original function closure."""
 
-    def __init__(self, pre_load_function=None) -> None:
+    def __init__(self, pre_load_function=None, reuse_sessions=False, compression=None) -> None:
         self.pre_load_function = pre_load_function
+        self.reuse_sessions = reuse_sessions
+        self.compression = compression
 
     @contextlib.contextmanager
     def __call__(self, remote_kwargs, build_result):
-        remote = request_remote(**remote_kwargs)
-        if self.pre_load_function is not None:
-            self.pre_load_function(remote, build_result)
-
-        remote.upload(build_result.filename)
+        pool = None
+        if self.reuse_sessions:
+            pool, remote = lease_remote(**remote_kwargs)
+        else:
+            remote = request_remote(**remote_kwargs)
+        reuse = False
         try:
-            yield remote, remote.load_module(os.path.split(build_result.filename)[1])
-
+            if self.compression is not None:
+                remote.set_compression(self.compression)
+            if self.pre_load_function is not None:
+                self.pre_load_function(remote, build_result)
+
+            remote.upload(build_result.filename)
+            try:
+                yield remote, remote.load_module(os.path.split(build_result.filename)[1])
+                reuse = True
+            finally:
+                # clean up remote files
+                remote.remove(build_result.filename)
+                remote.remove(os.path.splitext(build_result.filename)[0] + ".so")
+                if pool is None:
+                    remote.remove("")
         finally:
-            # clean up remote files
-            remote.remove(build_result.filename)
-            remote.remove(os.path.splitext(build_result.filename)[0] + ".so")
-            remote.remove("")
+            if pool is not None:
+                pool.release(remote_kwargs["device_key"], remote, reuse=reuse)
 
 
-def default_module_loader(pre_load_function=None):
+def default_module_loader(pre_load_function=None, reuse_sessions=False, compression=None):
     """Returns a default function that can be passed as module_loader to run_through_rpc.
 
     Parameters
@@ -735,6 +939,13 @@ def default_module_loader(pre_load_function=None):
     pre_load_function : Optional[Function[tvm.rpc.Session, tvm.runtime.Module]]
         Invoked after a session is established and before the default code-loading RPC calls are
         issued. Allows performing pre-upload actions, e.g. resetting the remote runtime environment.
+    reuse_sessions : bool
+        Whether to lease the session from the session pool of the tracker, see lease_remote(),
+        instead of requesting a new session for every measurement.
+    compression : Optional[List[str]]
+        The codecs in the order of preference the session compresses the module upload and
+        the reference inputs with, see tvm.rpc.RPCSession.set_compression. If None, the
+        transfers are not compressed.
 
     Returns
     -------
@@ -744,7 +955,7 @@ def default_module_loader(pre_load_function=None):
 
     # This was a function with a closure before but that couldn't be pickled!
     # We need pickle to work for using python's multiprocessing on some platforms.
-    return DefaultModuleLoader(pre_load_function)
+    return DefaultModuleLoader(pre_load_function, reuse_sessions, compression)
 
 
 def request_remote(device_key, host=None, port=None, priority=1, timeout=60):
@@ -778,6 +989,37 @@ def request_remote(device_key, host=None, port=None, priority=1, timeout=60):
     return remote
 
 
+def lease_remote(device_key, host=None, port=None, priority=1, timeout=60):
+    """Lease a warm remote session from the session pool of the tracker in this process
+
+    Parameters
+    ----------
+    device_key: string
+        The device key of registered device in tracker
+    host: host, optional
+        The host address of rpc tracker.
+        If is none, will use environment variable "TVM_TRACKER_HOST"
+    port: int, optional
+        The port of rpc tracker.
+        If is none, will use environment variable "TVM_TRACKER_PORT"
+    priority: int, optional
+        The priority of this request, larger is more prior
+    timeout: float, optional
+        The duration the session is needed for (units: second)
+
+    Returns
+    ------
+    pool: rpc.SessionPool
+        The pool the session must be released to
+    session: RPCSession
+    """
+    host = host or os.environ["TVM_TRACKER_HOST"]
+    port = port or int(os.environ["TVM_TRACKER_PORT"])
+
+    pool = _rpc.session_pool(host, port)
+    return pool, pool.lease(device_key, priority=priority, session_timeout=timeout)
+
+
 def check_remote(target, device_key, host=None, port=None, priority=100, timeout=10):
     """
     Check the availability of a remote device
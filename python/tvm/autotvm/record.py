@@ -35,7 +35,7 @@ from ..contrib import popen_pool
 from .. import __version__
 from . import task
 from .task import ConfigEntity, ApplyHistoryBest
-from .measure import MeasureInput, MeasureResult
+from .measure import MeasureErrorNo, MeasureInput, MeasureResult
 
 AUTOTVM_LOG_VERSION = 0.2
 _old_version_warning = True
@@ -95,7 +95,9 @@ def encode(inp, result, protocol="json"):
             "input": (str(inp.target), inp.task.name, inp.task.args, inp.task.kwargs),
             "config": inp.config.to_json_dict(),
             "result": (
-                result.costs if result.error_no == 0 else (1e9,),
+                result.costs
+                if result.error_no in (MeasureErrorNo.NO_ERROR, MeasureErrorNo.CENSORED)
+                else (1e9,),
                 result.error_no,
                 result.all_cost,
                 result.timestamp,
@@ -316,10 +318,13 @@ e.g. python -m tvm.autotvm.record --mode pick --i collect.log
 
 * Split a log file into separate files, each of which contains only a single wkl
 e.g. python -m tvm.autotvm.record --mode split --i collect.log
+
+* Convert a log file into an indexed record store
+e.g. python -m tvm.autotvm.record --mode convert --i collect.log --o collect.db
 """
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--mode", choices=["read", "pick", "split"], default="read")
+    parser.add_argument("--mode", choices=["read", "pick", "split", "convert"], default="read")
     parser.add_argument("--i", type=str, help="input file")
     parser.add_argument("--o", type=str, default=None, help="output file")
     parser.add_argument("--begin", type=int, default=0)
@@ -353,3 +358,8 @@ if __name__ == "__main__":
                         print(func.imported_modules[0].get_source())
     elif args.mode == "split":
         split_workload(args.i)
+    elif args.mode == "convert":
+        from .record_store import convert_log_to_store  # pylint: disable=import-outside-toplevel
+
+        args.o = args.o or args.i + ".db"
+        convert_log_to_store(args.i, args.o)
@@ -0,0 +1,293 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name
+"""
+Indexed on-disk store of tuning records.
+
+The text log produced by :any:`autotvm.callback.log_to_file` has to be decoded
+row by row before a single query can be answered. A :any:`RecordStore` keeps
+the same encoded rows in a SQLite file together with an index of the best
+record for each (target key, workload) and (target model, workload) pair,
+so that :any:`ApplyHistoryBest` only decodes the rows it is asked for.
+"""
+import json
+import logging
+import os
+import sqlite3
+
+import numpy as np
+
+from .record import encode, decode, load_from_file
+
+logger = logging.getLogger("autotvm")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workload TEXT NOT NULL,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_workload ON records (workload);
+CREATE TABLE IF NOT EXISTS best (
+    kind INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    workload TEXT NOT NULL,
+    cost REAL NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (kind, key, workload)
+);
+"""
+
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# kinds of keys in the best table
+_BY_TARGETKEY = 0
+_BY_MODEL = 1
+
+
+def workload_key(workload):
+    """Get the string key of a workload used by the store
+
+    Parameters
+    ----------
+    workload: tuple
+        The workload of an autotvm task, e.g. ``task.workload``
+
+    Returns
+    -------
+    key: str
+        The canonical string representation of the workload
+    """
+    return json.dumps(workload, default=str)
+
+
+def is_record_store(filename):
+    """Check whether a file is a record store rather than a text log
+
+    Parameters
+    ----------
+    filename: str
+        The filename to check
+
+    Returns
+    -------
+    ret: bool
+        True if the file exists and is a SQLite database
+    """
+    if not os.path.isfile(filename):
+        return False
+    with open(filename, "rb") as f:
+        return f.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+
+class RecordStore(object):
+    """An indexed, append-only store of autotvm tuning records backed by SQLite.
+
+    Parameters
+    ----------
+    filename: str
+        The path of the store file. It is created if it does not exist.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._conn = None
+
+    @property
+    def conn(self):
+        """The lazily opened connection to the store file"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.filename, timeout=60)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        """Close the connection to the store file"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def append(self, records):
+        """Append records to the store and update the best-record index.
+
+        Parameters
+        ----------
+        records: iterator of (autotvm.measure.MeasureInput, autotvm.measure.MeasureResult)
+            The records to append
+        """
+        rows, best = [], []
+        for inp, res in records:
+            wkl = workload_key(inp.task.workload)
+            row = encode(inp, res)
+            rows.append((wkl, row))
+            if res.error_no != 0:
+                continue
+            cost = float(np.mean(res.costs))
+            for k in inp.target.keys:
+                best.append((_BY_TARGETKEY, k, wkl, cost, row))
+            if inp.target.model != "unknown":
+                best.append((_BY_MODEL, inp.target.model, wkl, cost, row))
+
+        with self.conn:
+            self.conn.executemany("INSERT INTO records (workload, row) VALUES (?, ?)", rows)
+            self.conn.executemany(
+                "INSERT INTO best (kind, key, workload, cost, row) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, key, workload) DO UPDATE "
+                "SET cost = excluded.cost, row = excluded.row WHERE excluded.cost < best.cost",
+                best,
+            )
+        return len(rows)
+
+    def _query_best(self, kind, key, workload):
+        ret = self.conn.execute(
+            "SELECT row FROM best WHERE kind = ? AND key = ? AND workload = ?",
+            (kind, key, workload_key(workload)),
+        ).fetchone()
+        if ret is None:
+            return None
+        return decode(ret[0])
+
+    def best_by_targetkey(self, target_key, workload):
+        """Get the best record of a workload for a target key.
+
+        Parameters
+        ----------
+        target_key: str
+            One of the keys of a target, e.g. "cpu"
+        workload: tuple
+            The workload of the task
+
+        Returns
+        -------
+        ret: tuple(autotvm.measure.MeasureInput, autotvm.measure.MeasureResult), or None
+            The best record, or None if the store has no valid record for the pair.
+        """
+        return self._query_best(_BY_TARGETKEY, target_key, workload)
+
+    def best_by_model(self, model, workload):
+        """Get the best record of a workload for a target model.
+
+        Parameters
+        ----------
+        model: str
+            The model of a target
+        workload: tuple
+            The workload of the task
+
+        Returns
+        -------
+        ret: tuple(autotvm.measure.MeasureInput, autotvm.measure.MeasureResult), or None
+            The best record, or None if the store has no valid record for the pair.
+        """
+        return self._query_best(_BY_MODEL, model, workload)
+
+    def load(self, workload=None):
+        """Generator: load records from the store in insertion order.
+
+        Parameters
+        ----------
+        workload: tuple, optional
+            If given, only yield the records of this workload
+
+        Yields
+        ------
+        input: autotvm.measure.MeasureInput
+        result: autotvm.measure.MeasureResult
+        """
+        if workload is None:
+            cursor = self.conn.execute("SELECT row FROM records ORDER BY id")
+        else:
+            cursor = self.conn.execute(
+                "SELECT row FROM records WHERE workload = ? ORDER BY id",
+                (workload_key(workload),),
+            )
+        for (row,) in cursor:
+            ret = decode(row)
+            if ret is not None:
+                yield ret
+
+
+def convert_log_to_store(in_file, out_file, batch_size=4096):
+    """Convert a text log file into an indexed record store.
+    If out_file already exists, the records are appended to it.
+
+    Parameters
+    ----------
+    in_file: str
+        The filename of the text log
+    out_file: str
+        The filename of the store
+    batch_size: int
+        The number of records inserted per transaction
+
+    Returns
+    -------
+    store: RecordStore
+        The store the records were appended to
+    """
+    store = RecordStore(out_file)
+    existed = os.path.isfile(out_file) and len(store) > 0
+    counter = 0
+    batch = []
+    for rec in load_from_file(in_file):
+        batch.append(rec)
+        if len(batch) >= batch_size:
+            counter += store.append(batch)
+            batch = []
+    counter += store.append(batch)
+    logger.info(
+        "%s %d records from %s to %s",
+        "Append" if existed else "Convert",
+        counter,
+        in_file,
+        out_file,
+    )
+    return store
+
+
+def log_to_store(store):
+    """Log the tuning records into an indexed record store.
+    This is the counterpart of :any:`autotvm.callback.log_to_file`.
+
+    Parameters
+    ----------
+    store: str or RecordStore
+        The store or the filename of the store
+
+    Returns
+    -------
+    callback : callable
+        Callback function to do the logging.
+    """
+    if isinstance(store, str):
+        store = RecordStore(store)
+
+    def _callback(_, inputs, results):
+        """Callback implementation"""
+        store.append(zip(inputs, results))
+
+    _callback.store = store
+    return _callback
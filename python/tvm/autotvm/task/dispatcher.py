@@ -238,12 +238,15 @@ class ApplyHistoryBest(DispatchContext):
 
     Parameters
     ----------
-    records : str, list of str, or iterator of (autotvm.measure.MeasureInput,\
-                                                autotvm.measure.MeasureResult)
+    records : str, list of str, RecordStore, or iterator of (autotvm.measure.MeasureInput,\
+                                                              autotvm.measure.MeasureResult)
         Collection of tuning records.
-        If is str, then it should be the filename of a records log file.
-        Each row of this file is an encoded record pair. If it is a list, it can either be
+        If is str, then it should be the filename of a records log file or of a
+        :any:`autotvm.record_store.RecordStore`.
+        Each row of a log file is an encoded record pair. If it is a list, it can either be
         a list of paths to log files that will be loaded jointly or an iterator or records.
+        Record stores are not loaded eagerly; the best record of a workload is looked up
+        in them the first time it is queried.
     """
 
     def __init__(self, records):
@@ -252,6 +255,8 @@ class ApplyHistoryBest(DispatchContext):
         self.best_by_targetkey = {}
         self.best_by_model = {}
         self._best_user_defined = {}
+        self._stores = []
+        self._store_queried = set()
 
         if records:
             self.load(records)
@@ -261,27 +266,35 @@ class ApplyHistoryBest(DispatchContext):
 
         Parameters
         ----------
-        records : str, list of str, or iterator of (autotvm.measure.MeasureInput,\
-                                                    autotvm.measure.MeasureResult)
+        records : str, list of str, RecordStore, or iterator of (autotvm.measure.MeasureInput,\
+                                                                  autotvm.measure.MeasureResult)
             Collection of tuning records.
-            If is str, then it should be the filename of a records log file.
-            Each row of this file is an encoded record pair. If it is a list
+            If is str, then it should be the filename of a records log file or of a
+            :any:`autotvm.record_store.RecordStore`.
+            Each row of a log file is an encoded record pair. If it is a list
             it can either be a list of paths to logs that will be loaded jointly or
             an iterator of measurement results.
         """
         # pylint: disable=import-outside-toplevel
         from pathlib import Path
         from ..record import load_from_file
+        from ..record_store import RecordStore, is_record_store
 
         joint_records = []
-        if not isinstance(records, Iterable) or isinstance(records, str):
+        if isinstance(records, (str, Path, RecordStore)) or not isinstance(records, Iterable):
             records = [records]
 
         for rec in records:
             if isinstance(rec, Path):
                 rec = str(rec)
 
-            if isinstance(rec, str):
+            if isinstance(rec, str) and is_record_store(rec):
+                rec = RecordStore(rec)
+
+            if isinstance(rec, RecordStore):
+                self._stores.append(rec)
+                self._store_queried.clear()
+            elif isinstance(rec, str):
                 rec = load_from_file(rec)
                 joint_records += rec
             else:
@@ -322,6 +335,23 @@ class ApplyHistoryBest(DispatchContext):
 
         logger.debug("Finish loading %d records", counter)
 
+    def _load_from_stores(self, best_map, key, by_model):
+        """Merge the best record of key found in the record stores into best_map.
+        Each key is only looked up once per store."""
+        if not self._stores or (by_model, key) in self._store_queried:
+            return
+        self._store_queried.add((by_model, key))
+
+        for store in self._stores:
+            if by_model:
+                ret = store.best_by_model(*key)
+            else:
+                ret = store.best_by_targetkey(*key)
+            if ret is None:
+                continue
+            if key not in best_map or np.mean(best_map[key][1].costs) > np.mean(ret[1].costs):
+                best_map[key] = ret
+
     def _query_inside(self, target, workload):
         if target is None:
             raise RuntimeError(
@@ -334,6 +364,8 @@ class ApplyHistoryBest(DispatchContext):
         key = (target.model, workload)
         if key in self._best_user_defined:
             return self._best_user_defined[key]
+        if target.model != "unknown":
+            self._load_from_stores(self.best_by_model, key, by_model=True)
         if key in self.best_by_model:
             inp, _ = self.best_by_model[key]
             return inp.config
@@ -343,6 +375,7 @@ class ApplyHistoryBest(DispatchContext):
             key = (k, workload)
             if key in self._best_user_defined:
                 return self._best_user_defined[key]
+            self._load_from_stores(self.best_by_targetkey, key, by_model=False)
             if key in self.best_by_targetkey:
                 inp, _ = self.best_by_targetkey[key]
                 return inp.config
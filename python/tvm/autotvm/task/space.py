@@ -34,7 +34,7 @@ import numpy as np
 
 from tvm.te import schedule, thread_axis
 from tvm.tir import expr
-from tvm.autotvm.utils import get_const_int
+from tvm.autotvm.utils import get_const_int, sample_ints
 
 Axis = namedtuple("Axis", ["space", "index"])
 
@@ -228,11 +228,17 @@ class SplitSpace(TransformSpace):
             # Enforce the product of all split factors equals to the axis length
             no_tail = kwargs.get("no_tail", policy == "factors")
 
-            # Generate split entity by enumerating candidate factors.
             self.factors = factors
-            self._generate_space(0, [None] * (self.num_output - 1), enforce_no_tail=no_tail)
+            if "filter" in kwargs:
+                # Generate split entity by enumerating candidate factors.
+                self._generate_space(0, [None] * (self.num_output - 1), enforce_no_tail=no_tail)
+            else:
+                # Without a filter, the entities can be counted and indexed without
+                # enumerating them, which matters for long axes split many times.
+                self.entities = _SplitEntities(factors, self.product, self.num_output, no_tail)
 
-        self.entities = list(filter(fil, self.entities))
+        if "filter" in kwargs or policy == "candidate":
+            self.entities = list(filter(fil, self.entities))
 
     def _generate_space(self, now, tmp_stack, enforce_no_tail=False):
         """Generate space by DFS"""
@@ -260,6 +266,72 @@ class SplitSpace(TransformSpace):
         )
 
 
+class _SplitEntities(object):
+    """The entities of a SplitSpace, enumerated lazily in the same order as
+    SplitSpace._generate_space. An entity is located by counting the entities
+    under each prefix of factors, so it is not necessary to build the whole list.
+
+    Parameters
+    ----------
+    factors: List[int]
+        The candidate factors of each split
+    product: int
+        The length of the axis to split
+    num_output: int
+        The number of axes after the split
+    enforce_no_tail: bool
+        Whether the product of the factors must divide the axis length
+    """
+
+    def __init__(self, factors, product, num_output, enforce_no_tail):
+        self.factors = factors
+        self.product = product
+        self.num_output = num_output
+        self.enforce_no_tail = enforce_no_tail
+        # (number of chosen factors, product of chosen factors) -> number of entities
+        self._counts = {}
+        self._length = self._count(0, 1)
+
+    def _count(self, now, prod):
+        """The number of entities whose first `now` factors multiply to `prod`"""
+        if prod > self.product:
+            return 0
+        if now == self.num_output - 1:
+            if self.product % prod == 0 or (not self.enforce_no_tail and prod < self.product):
+                return 1
+            return 0
+        key = (now, prod)
+        if key not in self._counts:
+            self._counts[key] = sum(self._count(now + 1, prod * f) for f in self.factors)
+        return self._counts[key]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of range: size {}, got index {}".format(len(self), index))
+        stack, prod = [], 1
+        for now in range(self.num_output - 1):
+            for factor in self.factors:
+                count = self._count(now + 1, prod * factor)
+                if index < count:
+                    break
+                index -= count
+            stack.append(factor)
+            prod *= factor
+        return SplitEntity([-1] + stack[::-1])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
 class SplitEntity(object):
     """
     A split operation with detailed parameters
@@ -839,10 +911,100 @@ class ConfigSpace(object):
         return [Axis(None, i) for i in range(space_class.get_num_output(axes, policy, **kwargs))]
 
     def __len__(self):
+        return self.range_length
+
+    @property
+    def range_length(self):
+        """The number of configs in this space. Unlike ``len()``, this is an
+        arbitrary-precision int, which also works for spaces of more than 2^63 configs."""
         if self._length is None:
-            self._length = int(np.prod([len(x) for x in self.space_map.values()]))
+            self._length = functools.reduce(lambda x, y: x * y, self.dims, 1)
         return self._length
 
+    @property
+    def index_dtype(self):
+        """The dtype of numpy arrays of indices in this space. The indices of a space of more
+        than 2^63 configs do not fit in int64, so they are stored as python ints."""
+        return np.int64 if self.range_length <= np.iinfo(np.int64).max else object
+
+    @property
+    def dims(self):
+        """The number of candidates of each knob, in the order of space_map"""
+        return [len(x) for x in self.space_map.values()]
+
+    def sample_indices(self, m):
+        """Sample m different indices from this space uniformly, without replacement.
+
+        Parameters
+        ----------
+        m: int
+            The number of indices
+
+        Returns
+        -------
+        indices: numpy.ndarray
+            The sampled indices, of :any:`index_dtype`
+        """
+        return np.array(sample_ints(0, self.range_length, m), dtype=self.index_dtype)
+
+    def _knob_strides(self):
+        dims = np.array(self.dims, dtype=self.index_dtype)
+        strides = np.ones_like(dims)
+        strides[1:] = np.cumprod(dims[:-1])
+        return dims, strides
+
+    def point2knob(self, points):
+        """Convert a batch of indices in this space to knob form.
+
+        Parameters
+        ----------
+        points: Array of int
+            indices in the space
+
+        Returns
+        -------
+        knobs: numpy.ndarray
+            A (len(points), number of knobs) int64 matrix. Row i holds the index of the
+            chosen candidate of each knob for points[i].
+        """
+        dims, strides = self._knob_strides()
+        points = np.asarray(points, dtype=self.index_dtype).reshape(-1, 1)
+        return ((points // strides) % dims).astype(np.int64)
+
+    def knob2point(self, knobs):
+        """Convert a batch of configs in knob form to indices in this space.
+        This is the inverse of :any:`point2knob`.
+
+        Parameters
+        ----------
+        knobs: Array of Array of int
+            A (n, number of knobs) matrix of candidate indices
+
+        Returns
+        -------
+        points: numpy.ndarray
+            The indices in the space, of :any:`index_dtype`
+        """
+        _, strides = self._knob_strides()
+        knobs = np.atleast_2d(np.asarray(knobs, dtype=self.index_dtype))
+        return knobs.dot(strides)
+
+    def is_index_valid(self, points):
+        """Check whether a batch of indices are valid configs in this space.
+
+        Parameters
+        ----------
+        points: Array of int
+            indices in the space
+
+        Returns
+        -------
+        valid: numpy.ndarray
+            A boolean mask, True where the index is in the space
+        """
+        points = np.asarray(points, dtype=self.index_dtype)
+        return (points >= 0) & (points < self.range_length)
+
     def get(self, index):
         """Get a config entity with detailed parameters from this space
 
@@ -851,8 +1013,11 @@ class ConfigSpace(object):
         index: int
             index in the space
         """
-        if index < 0 or index >= len(self):
-            raise IndexError("Index out of range: size {}, got index {}".format(len(self), index))
+        index = int(index)
+        if index < 0 or index >= self.range_length:
+            raise IndexError(
+                "Index out of range: size {}, got index {}".format(self.range_length, index)
+            )
         entities = OrderedDict()
         t = index
         for name, space in self.space_map.items():
@@ -861,6 +1026,36 @@ class ConfigSpace(object):
         ret = ConfigEntity(index, self.code_hash, entities, self._constraints)
         return ret
 
+    def get_batch(self, indices):
+        """Get the config entities of a batch of indices in this space.
+        This is equivalent to ``[self.get(i) for i in indices]``, but decodes all the
+        indices at once.
+
+        Parameters
+        ----------
+        indices: Array of int
+            indices in the space
+
+        Returns
+        -------
+        configs: List[ConfigEntity]
+            The config entities, in the order of indices
+        """
+        indices = np.asarray(indices, dtype=self.index_dtype).reshape(-1)
+        valid = self.is_index_valid(indices)
+        if not np.all(valid):
+            bad = indices[~valid][0]
+            raise IndexError(
+                "Index out of range: size {}, got index {}".format(self.range_length, bad)
+            )
+        knobs = self.point2knob(indices).tolist()
+        spaces = list(self.space_map.items())
+        ret = []
+        for index, knob in zip(indices.tolist(), knobs):
+            entities = OrderedDict((name, space[k]) for (name, space), k in zip(spaces, knob))
+            ret.append(ConfigEntity(index, self.code_hash, entities, self._constraints))
+        return ret
+
     def __iter__(self):
         return self._entity_map.__iter__()
 
@@ -876,7 +1071,7 @@ class ConfigSpace(object):
         return self._entity_map[name]
 
     def __repr__(self):
-        res = "ConfigSpace (len=%d, space_map=\n" % len(self)
+        res = "ConfigSpace (len=%d, space_map=\n" % self.range_length
         for i, (name, space) in enumerate(self.space_map.items()):
             res += "  %2d %s: %s\n" % (i, name, space)
         return res + ")"
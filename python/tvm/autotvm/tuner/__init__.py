@@ -28,3 +28,4 @@ from .tuner import Tuner
 from .index_based_tuner import GridSearchTuner, RandomTuner
 from .ga_tuner import GATuner
 from .xgboost_tuner import XGBTuner
+from .model_based_tuner import DiskFeatureCache
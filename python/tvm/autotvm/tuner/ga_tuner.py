@@ -21,7 +21,7 @@
 import numpy as np
 
 from .tuner import Tuner
-from .model_based_tuner import knob2point, point2knob
+from ..measure import MeasureErrorNo
 
 
 class GATuner(Tuner):
@@ -59,89 +59,84 @@ class GATuner(Tuner):
 
         self.visited = set([])
 
-        # current generation
-        self.genes = []
+        # current generation, one gene in knob form per row
+        self.genes = np.empty((0, len(self.dims)), dtype=np.int64)
         self.scores = []
-        self.elites = []
+        self.elites = np.empty((0, len(self.dims)), dtype=np.int64)
         self.elite_scores = []
         self.trial_pt = 0
 
         # random initialization
-        self.pop_size = min(self.pop_size, len(self.space))
+        self.pop_size = min(self.pop_size, self.space.range_length)
         self.elite_num = min(self.pop_size, self.elite_num)
-        for _ in range(self.pop_size):
-            tmp_gene = point2knob(np.random.randint(len(self.space)), self.dims)
-            while knob2point(tmp_gene, self.dims) in self.visited:
-                tmp_gene = point2knob(np.random.randint(len(self.space)), self.dims)
-
-            self.genes.append(tmp_gene)
-            self.visited.add(knob2point(tmp_gene, self.dims))
+        points = self.space.sample_indices(self.pop_size)
+        self.genes = self.space.point2knob(points)
+        self.visited.update(points.tolist())
 
     def next_batch(self, batch_size):
-        ret = []
-        for _ in range(batch_size):
-            gene = self.genes[self.trial_pt % self.pop_size]
-            self.trial_pt += 1
-            ret.append(self.space.get(knob2point(gene, self.dims)))
-
-        return ret
+        # a batch does not cross generations, as the scores of a generation are matched to its
+        # genes by position. So a pipelined tune gets no configs until the generation is scored.
+        batch_size = min(batch_size, len(self.genes) - self.trial_pt)
+        indices = np.arange(self.trial_pt, self.trial_pt + batch_size)
+        self.trial_pt += batch_size
+        return self.space.get_batch(self.space.knob2point(self.genes[indices]))
 
     def update(self, inputs, results):
         for inp, res in zip(inputs, results):
-            if res.error_no == 0:
+            if res.error_no in (MeasureErrorNo.NO_ERROR, MeasureErrorNo.CENSORED):
                 y = inp.task.flop / np.mean(res.costs)
                 self.scores.append(y)
             else:
                 self.scores.append(0.0)
 
-        if len(self.scores) >= len(self.genes) and len(self.visited) < len(self.space):
-            genes = self.genes + self.elites
+        if len(self.scores) >= len(self.genes) and len(self.visited) < self.space.range_length:
+            genes = np.concatenate([self.genes, self.elites])
             scores = np.array(self.scores[: len(self.genes)] + self.elite_scores)
 
             # reserve elite
-            self.elites, self.elite_scores = [], []
             elite_indexes = np.argpartition(scores, -self.elite_num)[-self.elite_num :]
-            for ind in elite_indexes:
-                self.elites.append(genes[ind])
-                self.elite_scores.append(scores[ind])
+            self.elites = genes[elite_indexes]
+            self.elite_scores = scores[elite_indexes].tolist()
 
             # cross over
             indices = np.arange(len(genes))
             scores += 1e-8
             scores /= np.max(scores)
             probs = scores / np.sum(scores)
-            tmp_genes = []
-            for _ in range(self.pop_size):
-                p1, p2 = np.random.choice(indices, size=2, replace=False, p=probs)
-                p1, p2 = genes[p1], genes[p2]
-                point = np.random.randint(len(self.dims))
-                tmp_gene = p1[:point] + p2[point:]
-                tmp_genes.append(tmp_gene)
+            parents = np.array(
+                [
+                    np.random.choice(indices, size=2, replace=False, p=probs)
+                    for _ in range(self.pop_size)
+                ]
+            )
+            points = np.random.randint(len(self.dims), size=(self.pop_size, 1))
+            tmp_genes = np.where(
+                np.arange(len(self.dims)) < points, genes[parents[:, 0]], genes[parents[:, 1]]
+            )
 
             # mutation
+            dims = np.array(self.dims, dtype=np.int64)
+            mutation = np.random.random(tmp_genes.shape) < self.mutation_prob
+            new_values = (np.random.random(tmp_genes.shape) * dims).astype(np.int64)
+            tmp_genes = np.where(mutation, new_values, tmp_genes)
+
             next_genes = []
-            for tmp_gene in tmp_genes:
-                for j, dim in enumerate(self.dims):
-                    if np.random.random() < self.mutation_prob:
-                        tmp_gene[j] = np.random.randint(dim)
-
-                if len(self.visited) < len(self.space):
-                    while knob2point(tmp_gene, self.dims) in self.visited:
-                        j = np.random.randint(len(self.dims))
-                        tmp_gene[j] = np.random.randint(
-                            self.dims[j]  # pylint: disable=invalid-sequence-index
-                        )
-                    next_genes.append(tmp_gene)
-                    self.visited.add(knob2point(tmp_gene, self.dims))
-                else:
+            for tmp_gene, point in zip(tmp_genes, self.space.knob2point(tmp_genes).tolist()):
+                if len(self.visited) >= self.space.range_length:
                     break
-
-            self.genes = next_genes
+                while point in self.visited:
+                    j = np.random.randint(len(self.dims))
+                    tmp_gene[j] = np.random.randint(dims[j])
+                    point = int(self.space.knob2point(tmp_gene)[0])
+                next_genes.append(tmp_gene)
+                self.visited.add(point)
+
+            self.genes = np.array(next_genes, dtype=np.int64).reshape(-1, len(self.dims))
             self.trial_pt = 0
             self.scores = []
 
     def has_next(self):
-        return len(self.visited) - (len(self.genes) - self.trial_pt) < len(self.space)
+        return len(self.visited) - (len(self.genes) - self.trial_pt) < self.space.range_length
 
     def load_history(self, data_set, min_seed_records=500):
         pass
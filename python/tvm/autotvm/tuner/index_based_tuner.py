@@ -17,7 +17,7 @@
 # pylint: disable=abstract-method
 """Grid search tuner and random tuner"""
 
-import numpy as np
+from random import randrange
 
 from .tuner import Tuner
 
@@ -41,7 +41,7 @@ class IndexBaseTuner(Tuner):
             range_idx, tuple
         ), "range_idx must be None or (int, int)"
 
-        self.range_length = len(self.task.config_space)
+        self.range_length = self.task.config_space.range_length
         self.index_offset = 0
         if range_idx is not None:
             assert range_idx[1] > range_idx[0], "Index range must be positive"
@@ -99,7 +99,7 @@ class RandomTuner(IndexBaseTuner):
                 break
 
             # Random an indirect index.
-            index_ = np.random.randint(self.rand_max)
+            index_ = randrange(self.rand_max)
             self.rand_max -= 1
 
             # Use the indirect index to get a direct index.
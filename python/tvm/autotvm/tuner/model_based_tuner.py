@@ -20,11 +20,18 @@ This type of tuner will fit a cost model and use some optimization methods to
 find optimums points of cost model in space.
 """
 import gc
+import hashlib
+import json
+import os
+import uuid
+from random import randrange
 
 import numpy as np
 
 from .tuner import Tuner
 from ..env import GLOBAL_SCOPE
+from ..measure import MeasureErrorNo
+from ..record_store import workload_key
 
 
 class FeatureCache(object):
@@ -77,6 +84,161 @@ class FeatureCache(object):
         self.feature_cache[key] = {}
         gc.collect()
 
+    def flush(self):
+        """Write the pending features to persistent storage. The in-memory cache has none."""
+
+
+def feature_cache_key(fea_type, task, target):
+    """Get the key of the features of a task in a feature cache
+
+    Parameters
+    ----------
+    fea_type: str
+        The feature type
+    task: autotvm.task.Task
+        The tuning task
+    target: tvm.target.Target
+        The target the features are extracted for
+
+    Returns
+    -------
+    key: str
+    """
+    digest = hashlib.sha1(workload_key([task.workload, str(target)]).encode()).hexdigest()
+    return "%s-%s" % (fea_type, digest[:20])
+
+
+class DiskFeatureCache(FeatureCache):
+    """Feature cache that also stores the features in a directory, so that they can be
+    reused by later tuning sessions and by :any:`CostModel.fit_log`.
+
+    The features of a key are written in segments of `flush_size` configs. Each segment is a
+    numpy file of padded features, which is memory-mapped when loaded, and a json index of
+    the config indices and feature lengths. Several processes can share one directory.
+
+    Parameters
+    ----------
+    directory: str
+        The directory of the cache. It is created if it does not exist.
+    flush_size: int
+        The number of new features kept in memory before they are written to a segment
+    """
+
+    def __init__(self, directory, flush_size=4096):
+        super(DiskFeatureCache, self).__init__()
+        self.directory = directory
+        self.flush_size = flush_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key):
+        if key not in self.feature_cache:
+            self.feature_cache[key] = _DiskFeatureDict(
+                os.path.join(self.directory, key), self.flush_size
+            )
+        return self.feature_cache[key]
+
+    def size(self, key):
+        """Get the number of features of a key which are not written to disk yet
+
+        Parameters
+        ----------
+        key: str
+            The key of a feature type
+
+        Returns
+        -------
+        n: int
+        """
+        if key not in self.feature_cache:
+            return 0
+        return self.feature_cache[key].num_pending()
+
+    def clear(self, key):
+        """Release the features of a key from memory. The features on disk are kept.
+
+        Parameters
+        ----------
+        key: str
+            The key of a feature type
+        """
+        if key in self.feature_cache:
+            self.feature_cache.pop(key).flush()
+        gc.collect()
+
+    def flush(self):
+        for fea_dict in self.feature_cache.values():
+            fea_dict.flush()
+
+
+class _DiskFeatureDict(object):
+    """The features of one key of a DiskFeatureCache, used as a dict of
+    config index -> feature (or None if the extraction failed)"""
+
+    def __init__(self, path, flush_size):
+        self.path = path
+        self.flush_size = flush_size
+        self._pending = {}
+        # config index -> (features of a segment, row, length)
+        self._rows = {}
+        os.makedirs(path, exist_ok=True)
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                self._load_segment(name[: -len(".json")])
+
+    def _load_segment(self, name):
+        with open(os.path.join(self.path, name + ".json")) as f:
+            meta = json.load(f)
+        mmap_mode = "r" if meta["width"] > 0 else None
+        feas = np.load(os.path.join(self.path, name + ".npy"), mmap_mode=mmap_mode)
+        for row, (index, length) in enumerate(zip(meta["indexes"], meta["lengths"])):
+            self._rows[index] = (feas, row, length)
+
+    def flush(self):
+        """Write the pending features into a new segment"""
+        if not self._pending:
+            return
+        indexes = list(self._pending.keys())
+        lengths = [-1 if x is None else len(x) for x in self._pending.values()]
+        width = max(lengths + [0])
+        feas = np.zeros((len(indexes), width), dtype=np.float32)
+        for row, fea in enumerate(self._pending.values()):
+            if fea is not None:
+                feas[row, : len(fea)] = fea
+
+        # write the index last, so a segment is only visible once it is complete
+        name = uuid.uuid4().hex
+        np.save(os.path.join(self.path, name + ".npy"), feas)
+        tmp = os.path.join(self.path, name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"indexes": [int(x) for x in indexes], "lengths": lengths, "width": width}, f)
+        os.replace(tmp, os.path.join(self.path, name + ".json"))
+
+        self._pending = {}
+        self._load_segment(name)
+
+    def __contains__(self, index):
+        return index in self._pending or index in self._rows
+
+    def __getitem__(self, index):
+        if index in self._pending:
+            return self._pending[index]
+        feas, row, length = self._rows[index]
+        if length < 0:
+            return None
+        return feas[row, :length]
+
+    def __setitem__(self, index, fea):
+        self._pending[int(index)] = fea
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def num_pending(self):
+        """The number of features not written to disk yet"""
+        return len(self._pending)
+
+    def __len__(self):
+        return len(self._pending) + len(self._rows)
+
 
 class CostModel(object):
     """Cost model to predict the speed of a config"""
@@ -208,7 +370,7 @@ class ModelBasedTuner(Tuner):
         self.target = task.target
         self.plan_size = plan_size
         self.space = task.config_space
-        self.space_len = len(task.config_space)
+        self.space_len = task.config_space.range_length
         self.dims = [len(x) for x in self.space.space_map.values()]
 
         self.cost_model = cost_model
@@ -236,7 +398,7 @@ class ModelBasedTuner(Tuner):
 
         counter = 0
         while counter < batch_size:
-            if len(self.visited) >= len(self.space):
+            if len(self.visited) >= self.space_len:
                 break
 
             while self.trial_pt < len(self.trials):
@@ -248,9 +410,9 @@ class ModelBasedTuner(Tuner):
             if self.trial_pt >= len(self.trials) - int(0.05 * self.plan_size):
                 # if the trial list is empty or
                 # the tuner is doing the last 5% trials (e-greedy), choose randomly
-                index = np.random.randint(len(self.space))
+                index = randrange(self.space_len)
                 while index in self.visited:
-                    index = np.random.randint(len(self.space))
+                    index = randrange(self.space_len)
 
             ret.append(self.space.get(index))
             self.visited.add(index)
@@ -261,7 +423,11 @@ class ModelBasedTuner(Tuner):
     def update(self, inputs, results):
         for inp, res in zip(inputs, results):
             index = inp.config.index
-            if res.error_no == 0:
+            # a screened config is not measured, so it is no training data, while a censored
+            # result is rejected by a probe run, whose time is still a fair label
+            if res.error_no == MeasureErrorNo.SCREENED:
+                pass
+            elif res.error_no in (MeasureErrorNo.NO_ERROR, MeasureErrorNo.CENSORED):
                 self.xs.append(index)
                 flops = inp.task.flop / np.mean(res.costs)
                 self.flops_max = max(self.flops_max, flops)
@@ -284,7 +450,7 @@ class ModelBasedTuner(Tuner):
                     self.cost_model, self.plan_size * self.diversity_filter_ratio, self.visited
                 )
                 scores = self.cost_model.predict(candidate)
-                knobs = [point2knob(x, self.dims) for x in candidate]
+                knobs = self.space.point2knob(candidate).tolist()
                 pick_index = submodular_pick(0 * scores, knobs, self.plan_size, knob_weight=1)
                 maximums = np.array(candidate)[pick_index]
             else:
@@ -319,7 +485,7 @@ class ModelBasedTuner(Tuner):
         GLOBAL_SCOPE.in_tuning = False
 
     def has_next(self):
-        return len(self.visited) < len(self.space)
+        return len(self.visited) < self.space_len
 
 
 def point2knob(p, dims):
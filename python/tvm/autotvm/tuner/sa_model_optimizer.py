@@ -25,7 +25,6 @@ import time
 
 import numpy as np
 
-from ..utils import sample_ints
 from .model_based_tuner import ModelOptimizer, knob2point, point2knob
 
 logger = logging.getLogger("autotvm")
@@ -67,7 +66,7 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         self.n_iter = n_iter
         self.temp = temp
         self.persistent = persistent
-        self.parallel_size = min(parallel_size, len(self.task.config_space))
+        self.parallel_size = min(parallel_size, self.task.config_space.range_length)
         self.early_stop = early_stop or 1e9
         self.log_interval = log_interval
         self.points = None
@@ -84,7 +83,7 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
         if self.persistent and self.points is not None:
             points = self.points
         else:
-            points = np.array(sample_ints(0, len(self.task.config_space), self.parallel_size))
+            points = self.task.config_space.sample_indices(self.parallel_size)
 
         scores = model.predict(points)
 
@@ -111,9 +110,7 @@ class SimulatedAnnealingOptimizer(ModelOptimizer):
             cool = 0
 
         while k < n_iter and k < k_last_modify + early_stop:
-            new_points = np.empty_like(points)
-            for i, p in enumerate(points):
-                new_points[i] = random_walk(p, self.dims)
+            new_points = random_walk_batch(points, self.task.config_space)
 
             new_scores = model.predict(new_points)
 
@@ -186,3 +183,38 @@ def random_walk(p, dims):
 
     # transform to index form
     return knob2point(new, dims)
+
+
+def random_walk_batch(points, space):
+    """random walk as local transition for a batch of points at once.
+    Each point mutates one of its knobs to a different value, with the same distribution
+    as :any:`random_walk`.
+
+    Parameters
+    ----------
+    points: numpy.ndarray
+        indices of the ConfigEntity
+    space: ConfigSpace
+        the space of the points
+
+    Returns
+    -------
+    new_points: numpy.ndarray
+        new neighborhood indices
+    """
+    dims = np.array(space.dims, dtype=np.int64)
+    # random_walk picks a knob uniformly and retries if the value does not change,
+    # so knob i is eventually mutated with probability proportional to (dims[i] - 1) / dims[i]
+    weights = (dims - 1) / dims
+    if weights.sum() == 0:
+        return np.array(points, dtype=np.int64)
+
+    knobs = space.point2knob(points)
+    rows = np.arange(len(knobs))
+    from_i = np.random.choice(len(dims), size=len(knobs), p=weights / weights.sum())
+    old = knobs[rows, from_i]
+    # draw a value uniformly from the other dims[i] - 1 candidates
+    to_v = (np.random.random(len(knobs)) * (dims[from_i] - 1)).astype(np.int64)
+    to_v += to_v >= old
+    knobs[rows, from_i] = to_v
+    return space.knob2point(knobs)
@@ -18,16 +18,23 @@
 """Base class of tuner"""
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from ..measure import MeasureInput, create_measure_batch
+from ..database import SQLiteDatabase
+from ..measure import MeasureErrorNo, MeasureInput, create_measure_batch
 from ..utils import format_si_prefix
 
 from ..env import GLOBAL_SCOPE
 
 logger = logging.getLogger("autotvm")
 
+# The results saved to and served from the database of Tuner.tune. Other failures may be
+# transient, e.g. a timeout, and their costs do not survive the record encoding. SCREENED
+# configs were never measured, so they are left to be measured by a later session.
+CACHED_ERROR_NOS = (MeasureErrorNo.NO_ERROR, MeasureErrorNo.CENSORED)
+
 
 class Tuner(object):
     """Base class for tuners
@@ -90,7 +97,16 @@ class Tuner(object):
             result for measurement
         """
 
-    def tune(self, n_trial, measure_option, early_stopping=None, callbacks=(), si_prefix="G"):
+    def tune(
+        self,
+        n_trial,
+        measure_option,
+        early_stopping=None,
+        callbacks=(),
+        si_prefix="G",
+        database=None,
+        pipeline=False,
+    ):
         """Begin tuning
 
         Parameters
@@ -109,7 +125,22 @@ class Tuner(object):
             every measurement pair. See autotvm/tuner/callback.py for some examples.
         si_prefix: str
             One of tvm.autotvm.utils.SI_PREFIXES. The SI prefix to use when reporting FLOPS.
+        database: autotvm.database.Database or str, optional
+            A cache of measurement results. Configs that already have a result in it are not
+            measured again, and new results are saved to it. If it is a str, then it is the
+            filename of an autotvm.database.SQLiteDatabase. Cached results still count as
+            trials and are passed to the callbacks. Failed measurements are not cached, so
+            they are measured again by a later session.
+        pipeline: bool
+            If True, the next batch is proposed and built while the current batch runs on
+            the device. The tuner is then updated with the results of a batch only after the
+            next batch is proposed, so a proposal does not see the results of the batch
+            before it. A tuner that needs those results, e.g. GATuner at the end of a
+            generation, proposes no configs until it is updated. When early stopping, the
+            batch already built is discarded.
         """
+        if isinstance(database, str):
+            database = SQLiteDatabase(database)
         measure_batch = create_measure_batch(self.task, measure_option)
         n_parallel = getattr(measure_batch, "n_parallel", 1)
         early_stopping = early_stopping or 1e9
@@ -124,14 +155,41 @@ class Tuner(object):
         GLOBAL_SCOPE.in_tuning = True
         i = error_ct = 0
         errors = []
-        while i < n_trial:
-            if not self.has_next():
-                break
-
-            configs = self.next_batch(min(n_parallel, n_trial - i))
 
+        def build(configs):
+            """Look up a batch in the database, and build the rest if pipelined"""
             inputs = [MeasureInput(self.task.target, self.task, config) for config in configs]
-            results = measure_batch(inputs)
+            results = [None] * len(inputs)
+            if database is not None:
+                results = [database.load(inp) for inp in inputs]
+                # e.g. a timeout saved by an older version is measured again
+                results = [
+                    res if res is not None and res.error_no in CACHED_ERROR_NOS else None
+                    for res in results
+                ]
+            unsaved = [inp for inp, res in zip(inputs, results) if res is None]
+            build_results = measure_batch.build(unsaved) if pipeline and unsaved else None
+            return inputs, results, unsaved, build_results
+
+        def run(batch):
+            """Measure the configs of a batch that are not in the database"""
+            _, _, unsaved, build_results = batch
+            if not unsaved:
+                return []
+            if build_results is None:
+                return measure_batch(unsaved)
+            return measure_batch.run(unsaved, build_results)
+
+        def update(batch, new_results):
+            """Record the results of a batch and update the tuner. Returns whether to stop."""
+            nonlocal i, error_ct
+            inputs, results, _, _ = batch
+            new_results = iter(new_results)
+            for k, res in enumerate(results):
+                if res is None:
+                    results[k] = next(new_results)
+                    if database is not None and results[k].error_no in CACHED_ERROR_NOS:
+                        database.save(inputs[k], results[k])
 
             # keep best config
             for k, (inp, res) in enumerate(zip(inputs, results)):
@@ -140,6 +198,11 @@ class Tuner(object):
                     flops = inp.task.flop / np.mean(res.costs)
                     error_ct = 0
                     result_msg = res
+                elif res.error_no in (MeasureErrorNo.CENSORED, MeasureErrorNo.SCREENED):
+                    # rejected by its probe run or by the screening, so it is neither a
+                    # candidate nor an error
+                    flops = 0
+                    result_msg = res
                 else:
                     flops = 0
                     error_ct += 1
@@ -173,10 +236,6 @@ class Tuner(object):
             for callback in callbacks:
                 callback(self, inputs, results)
 
-            if i >= self.best_iter + early_stopping:
-                logger.debug("Early stopped. Best iter: %d.", self.best_iter)
-                break
-
             if error_ct > self.error_ct_threshold:
                 logging.basicConfig()
                 logger.warning("Too many errors happen in the tuning. Switching to debug mode.")
@@ -184,6 +243,42 @@ class Tuner(object):
             else:
                 logger.setLevel(old_level)
 
+            if i >= self.best_iter + early_stopping:
+                logger.debug("Early stopped. Best iter: %d.", self.best_iter)
+                return True
+            return False
+
+        if not pipeline:
+            while i < n_trial:
+                if not self.has_next():
+                    break
+                batch = build(self.next_batch(min(n_parallel, n_trial - i)))
+                if update(batch, run(batch)):
+                    break
+        else:
+            n_proposed = 0
+            pending = None  # (batch, future of its results) running on the device
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                while True:
+                    batch = future = None
+                    if n_proposed < n_trial and self.has_next():
+                        configs = self.next_batch(min(n_parallel, n_trial - n_proposed))
+                        n_proposed += len(configs)
+                        if configs:
+                            batch = build(configs)
+                            # queued behind the batch on the device, so that the device does
+                            # not wait for the update of the tuner
+                            future = executor.submit(run, batch)
+                    if pending is None and batch is None:
+                        break
+                    if pending is not None and update(pending[0], pending[1].result()):
+                        if future is not None:
+                            future.cancel()
+                        break
+                    # the tuner may propose nothing while it waits for the results of the
+                    # pending batch, e.g. GATuner at the end of a generation
+                    pending = (batch, future) if batch is not None else None
+
         if error_ct == i:
             _, f = tempfile.mkstemp(prefix="tvm_tuning_errors_", suffix=".log", text=True)
             with open(f, "w") as file:
@@ -25,14 +25,19 @@ import numpy as np
 from tvm.contrib.popen_pool import PopenPoolExecutor, StatusKind
 
 from .. import feature
+from ..measure import MeasureErrorNo
 from ..utils import get_rank
 from .metric import max_curve, recall_curve, cover_curve
-from .model_based_tuner import CostModel, FeatureCache
+from .model_based_tuner import CostModel, FeatureCache, DiskFeatureCache, feature_cache_key
 
 xgb = None
 
 logger = logging.getLogger("autotvm")
 
+# The results labeled by their throughput. A censored result is labeled by the time of the probe
+# run that rejected it, which ranks it below the configs it was compared to.
+_LABELED_ERROR_NO = (MeasureErrorNo.NO_ERROR, MeasureErrorNo.CENSORED)
+
 
 class XGBoostCostModel(CostModel):
     """XGBoost as cost model
@@ -68,10 +73,26 @@ class XGBoostCostModel(CostModel):
         If is not none, the cost model will print training log every `log_interval` iterations.
     upper_model: XGBoostCostModel, optional
         The upper model used in transfer learning
+    feature_cache: str or FeatureCache, optional
+        The cache of extracted features. If is a str, use a :any:`DiskFeatureCache` in this
+        directory, so that features are reused by later runs and by `fit_log`.
+        The cache of the upper model is used if upper_model is given.
+    shared_memory_threshold: int, optional
+        Feature extraction tasks and results of at least this number of bytes are passed to
+        and from the extraction processes through shared memory, see
+        `tvm.contrib.popen_pool.PopenPoolExecutor`. If None, pipes are always used.
     """
 
     def __init__(
-        self, task, feature_type, loss_type, num_threads=None, log_interval=25, upper_model=None
+        self,
+        task,
+        feature_type,
+        loss_type,
+        num_threads=None,
+        log_interval=25,
+        upper_model=None,
+        feature_cache=None,
+        shared_memory_threshold=None,
     ):
         global xgb
         super(XGBoostCostModel, self).__init__()
@@ -93,6 +114,7 @@ class XGBoostCostModel(CostModel):
         self.loss_type = loss_type
         self.num_threads = num_threads
         self.log_interval = log_interval
+        self.shared_memory_threshold = shared_memory_threshold
 
         if loss_type == "reg":
             self.xgb_params = {
@@ -135,8 +157,13 @@ class XGBoostCostModel(CostModel):
 
         if upper_model:  # share a same feature cache with upper model
             self.feature_cache = upper_model.feature_cache
+        elif isinstance(feature_cache, str):
+            self.feature_cache = DiskFeatureCache(feature_cache)
+        elif feature_cache is not None:
+            self.feature_cache = feature_cache
         else:
             self.feature_cache = FeatureCache()
+        self.fea_key = feature_cache_key(feature_type, task, self.target)
         self.upper_model = upper_model
         self.feature_extra_ct = 0
         self.pool = None
@@ -158,6 +185,7 @@ class XGBoostCostModel(CostModel):
             max_workers=self.num_threads,
             initializer=_extract_popen_initializer,
             initargs=(space, target, task),
+            shared_memory_threshold=self.shared_memory_threshold,
         )
 
     def _close_pool(self):
@@ -217,8 +245,9 @@ class XGBoostCostModel(CostModel):
             time.time() - tic,
             len(xs),
             len(xs) - np.sum(valid_index),
-            self.feature_cache.size(self.fea_type),
+            self.feature_cache.size(self.fea_key),
         )
+        self.feature_cache.flush()
 
     def fit_log(self, records, plan_size, min_seed_records=500):
         tic = time.time()
@@ -226,7 +255,8 @@ class XGBoostCostModel(CostModel):
         # filter data, only pick the data with a same task
         data = []
         for inp, res in records:
-            if inp.task.name == self.task.name:
+            # the screened configs are not measured
+            if inp.task.name == self.task.name and res.error_no != MeasureErrorNo.SCREENED:
                 data.append((inp, res))
 
         logger.debug("XGB load %d entries from history log file", len(data))
@@ -242,22 +272,25 @@ class XGBoostCostModel(CostModel):
             feature_extract_func = _extract_curve_feature_log
         else:
             raise RuntimeError("Invalid feature type: " + self.fea_type)
-        result = pool.map_with_error_catching(feature_extract_func, data)
-        result = list(result)  # store results so we can iterate through them twice
+        if isinstance(self.feature_cache, DiskFeatureCache):
+            result = self._extract_log_features(feature_extract_func, data)
+        else:
+            result = pool.map_with_error_catching(feature_extract_func, data)
+            result = [res.value if res.status == StatusKind.COMPLETE else None for res in result]
 
         # get maximum feature length
         fea_len = -1
         for res in result:
-            if res.status != StatusKind.COMPLETE:
+            if res is None:
                 continue
-            x, _ = res.value
+            x, _ = res
             fea_len = max(fea_len, x.shape[0])
 
         xs, ys = [], []
         for res in result:
-            if res.status != StatusKind.COMPLETE:
+            if res is None:
                 continue
-            x, y = res.value
+            x, y = res
             # Features may not be the same size, pad them until they are
             if fea_len > len(x):
                 xs.append(np.pad(x, (0, fea_len - len(x))))
@@ -300,6 +333,43 @@ class XGBoostCostModel(CostModel):
 
         return True
 
+    def _extract_log_features(self, feature_extract_func, data):
+        """Get the (feature, label) of log records. The features already in the
+        feature cache are not extracted again, and the new ones are added to it."""
+        ret = [None] * len(data)
+        keys = [feature_cache_key(self.fea_type, inp.task, inp.target) for inp, _ in data]
+        flops = {}
+        need_extract = []
+        for i, ((inp, res), key) in enumerate(zip(data, keys)):
+            fea_cache = self.feature_cache.get(key)
+            if inp.config.index not in fea_cache:
+                need_extract.append(i)
+                continue
+            x = fea_cache[inp.config.index]
+            if x is None:
+                continue
+            if res.error_no not in _LABELED_ERROR_NO:
+                ret[i] = (x, 0.0)
+                continue
+            if key not in flops:
+                with inp.target:
+                    inp.task.instantiate(inp.config)
+                flops[key] = inp.task.flop
+            ret[i] = (x, flops[key] / np.mean(res.costs))
+
+        pool = self._get_pool()
+        result = pool.map_with_error_catching(feature_extract_func, [data[i] for i in need_extract])
+        for i, res in zip(need_extract, result):
+            inp = data[i][0]
+            fea_cache = self.feature_cache.get(keys[i])
+            if res.status == StatusKind.COMPLETE:
+                ret[i] = res.value
+                fea_cache[inp.config.index] = res.value[0]
+            else:
+                fea_cache[inp.config.index] = None
+        self.feature_cache.flush()
+        return ret
+
     def predict(self, xs, output_margin=False):
         feas = self._get_feature(xs)
         dtest = xgb.DMatrix(feas)
@@ -324,10 +394,10 @@ class XGBoostCostModel(CostModel):
     def _get_feature(self, indexes):
         """get features for indexes, run extraction if we do not have cache for them"""
         # free feature cache
-        if self.feature_cache.size(self.fea_type) >= 100000:
-            self.feature_cache.clear(self.fea_type)
+        if self.feature_cache.size(self.fea_key) >= 100000:
+            self.feature_cache.clear(self.fea_key)
 
-        fea_cache = self.feature_cache.get(self.fea_type)
+        fea_cache = self.feature_cache.get(self.fea_key)
 
         indexes = np.array(indexes)
         need_extract = [x for x in indexes if x not in fea_cache]
@@ -388,7 +458,7 @@ def _extract_itervar_feature_log(arg):
     fea = feature.get_itervar_feature_flatten(sch, args, take_log=True)
     x = np.concatenate((fea, list(config.get_other_option().values())))
 
-    if res.error_no == 0:
+    if res.error_no in _LABELED_ERROR_NO:
         y = inp.task.flop / np.mean(res.costs)
     else:
         y = 0.0
@@ -408,7 +478,7 @@ def _extract_knob_feature_log(arg):
     config = inp.config
     x = config.get_flatten_feature()
 
-    if res.error_no == 0:
+    if res.error_no in _LABELED_ERROR_NO:
         with inp.target:  # necessary, for calculating flops of this task
             inp.task.instantiate(config)
         y = inp.task.flop / np.mean(res.costs)
@@ -437,7 +507,7 @@ def _extract_curve_feature_log(arg):
     fea = feature.get_buffer_curve_sample_flatten(sch, args, sample_n=20)
     x = np.concatenate((fea, list(config.get_other_option().values())))
 
-    if res.error_no == 0:
+    if res.error_no in _LABELED_ERROR_NO:
         y = inp.task.flop / np.mean(res.costs)
     else:
         y = 0.0
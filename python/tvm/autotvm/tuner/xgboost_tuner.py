@@ -70,6 +70,10 @@ class XGBTuner(ModelBasedTuner):
         The verbose level.
         If is 0, output nothing.
         Otherwise, output debug information every `verbose` iterations.
+
+    feature_cache: str or FeatureCache, optional
+        The cache of extracted features.
+        If is a str, features are stored in this directory and reused by later runs.
     """
 
     def __init__(
@@ -82,6 +86,7 @@ class XGBTuner(ModelBasedTuner):
         optimizer="sa",
         diversity_filter_ratio=None,
         log_interval=50,
+        feature_cache=None,
     ):
         cost_model = XGBoostCostModel(
             task,
@@ -89,6 +94,7 @@ class XGBTuner(ModelBasedTuner):
             loss_type=loss_type,
             num_threads=num_threads,
             log_interval=log_interval // 2,
+            feature_cache=feature_cache,
         )
         if optimizer == "sa":
             optimizer = SimulatedAnnealingOptimizer(task, log_interval=log_interval)
@@ -0,0 +1,308 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A farm of build workers reached through the RPC tracker.
+
+A build worker is an RPC server registered to the tracker under a key,
+e.g. "build", whose sessions can run python functions. A :any:`BuildFarm`
+requests one session per worker and shards the tasks of a map over them.
+Each task runs in a popen worker process of the session, so that a crash
+or a timeout only fails that task.
+
+Build workers are started with
+
+.. code-block:: bash
+
+    python -m tvm.exec.build_worker --tracker=<tracker host>:<tracker port> --key=build
+"""
+# pylint: disable=invalid-name
+import logging
+import pickle
+import queue
+import threading
+
+import tvm._ffi
+from tvm import rpc
+
+from .popen_pool import MapResult, PopenWorker, StatusKind
+
+logger = logging.getLogger("BuildFarm")
+
+
+def _run_task(data):
+    """Run a pickled task in the worker process and return its pickled status and value."""
+    # pylint: disable=import-outside-toplevel
+    import cloudpickle
+
+    try:
+        fn, args = cloudpickle.loads(data)
+        ret = (StatusKind.COMPLETE, fn(*args))
+    # pylint: disable=broad-except
+    except Exception as exception:
+        ret = (StatusKind.EXCEPTION, exception)
+    try:
+        return cloudpickle.dumps(ret, protocol=pickle.HIGHEST_PROTOCOL)
+    # pylint: disable=broad-except
+    except Exception:
+        # e.g. an exception that can not be pickled
+        return cloudpickle.dumps((StatusKind.EXCEPTION, RuntimeError(str(ret[1]))))
+
+
+# The worker process of the session, restarted after a task crashes or times out
+_WORKER = None
+
+
+def _run(data, timeout):
+    """Run a task sent by BuildFarm in the worker process of the session.
+
+    Parameters
+    ----------
+    data : bytearray
+        The cloudpickled (fn, args) of the task.
+
+    timeout : float
+        The timeout of the task in seconds, or a non-positive number for no timeout.
+
+    Returns
+    -------
+    result : bytearray
+        The cloudpickled (status, value) of the task.
+    """
+    # pylint: disable=import-outside-toplevel
+    import cloudpickle
+
+    global _WORKER
+    if _WORKER is None:
+        _WORKER = PopenWorker()
+    _WORKER.send(_run_task, (bytes(data),), timeout=timeout if timeout > 0 else None)
+    try:
+        out = _WORKER.recv()
+    except TimeoutError:
+        out = cloudpickle.dumps((StatusKind.TIMEOUT, TimeoutError()))
+    except ChildProcessError as err:
+        out = cloudpickle.dumps((StatusKind.EXCEPTION, err))
+    return bytearray(out)
+
+
+def _init_build_worker():
+    """The server_init_callback of build workers, which registers tvm.contrib.build_farm.run
+    in the server only, since it runs the tasks it is sent."""
+    tvm._ffi.register_func("tvm.contrib.build_farm.run", _run, override=True)
+
+
+def start_build_worker(
+    tracker_addr, key="build", host="0.0.0.0", port=9190, port_end=9290, custom_addr=None
+):
+    """Start a build worker and register it to the tracker.
+
+    Parameters
+    ----------
+    tracker_addr : Tuple[str, int]
+        The address of the RPC tracker.
+
+    key : str
+        The key of the build workers in the tracker.
+
+    host : str
+        The host url of the worker.
+
+    port : int
+        The port to be bind to.
+
+    port_end : int
+        The end port to search.
+
+    custom_addr : Optional[str]
+        The IP address of the worker reported to the tracker.
+
+    Returns
+    -------
+    server : tvm.rpc.Server
+        The RPC server of the worker.
+    """
+    return rpc.Server(
+        host=host,
+        port=port,
+        port_end=port_end,
+        tracker_addr=tracker_addr,
+        key=key,
+        custom_addr=custom_addr,
+        server_init_callback=_init_build_worker,
+    )
+
+
+class BuildFarm(object):
+    """A pool of the build workers registered to an RPC tracker.
+
+    Parameters
+    ----------
+    tracker_host : str
+        The host of the RPC tracker.
+
+    tracker_port : int
+        The port of the RPC tracker.
+
+    key : str
+        The key of the build workers in the tracker.
+
+    max_workers : Optional[int]
+        The number of workers to use at the same time. If None, use all the workers
+        registered under the key when map is called.
+
+    timeout : Optional[float]
+        The timeout of each task in seconds.
+
+    priority : int
+        The priority of the session requests.
+
+    max_retry : int
+        The number of times a task is sent again when its session is lost.
+    """
+
+    def __init__(
+        self,
+        tracker_host,
+        tracker_port,
+        key="build",
+        max_workers=None,
+        timeout=None,
+        priority=1,
+        max_retry=1,
+    ):
+        self.tracker_host = tracker_host
+        self.tracker_port = int(tracker_port)
+        self.key = key
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.priority = priority
+        self.max_retry = max_retry
+
+    def num_workers(self):
+        """Get the number of the build workers registered under the key.
+
+        Returns
+        -------
+        num : int
+            The number of workers.
+        """
+        tracker = rpc.connect_tracker(self.tracker_host, self.tracker_port)
+        try:
+            summary = tracker.summary()
+        finally:
+            tracker.close()
+        return sum(1 for info in summary["server_info"] if info["key"] == "server:" + self.key)
+
+    def _no_worker(self):
+        return RuntimeError(
+            "BuildFarm: no build worker with key %s is registered to the tracker %s:%d"
+            % (self.key, self.tracker_host, self.tracker_port)
+        )
+
+    def _serve(self, tasks, results):
+        """Run tasks in one session until the queue is empty."""
+        # pylint: disable=import-outside-toplevel
+        import cloudpickle
+
+        tracker = None
+        sess = None
+        try:
+            tracker = rpc.connect_tracker(self.tracker_host, self.tracker_port)
+            while True:
+                try:
+                    idx, data, retry = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                if sess is None and self.num_workers() == 0:
+                    # the request would wait until a worker registers, fail the task instead
+                    results[idx] = MapResult(status=StatusKind.EXCEPTION, value=self._no_worker())
+                    continue
+                try:
+                    if sess is None:
+                        sess = tracker.request(self.key, priority=self.priority)
+                    out = sess.get_function("tvm.contrib.build_farm.run")(data, self.timeout or 0)
+                except (RuntimeError, tvm.TVMError, OSError) as err:
+                    # the worker is lost, send the task again through another session
+                    sess = None
+                    if retry < self.max_retry:
+                        tasks.put((idx, data, retry + 1))
+                    else:
+                        results[idx] = MapResult(status=StatusKind.EXCEPTION, value=err)
+                    continue
+                status, value = cloudpickle.loads(bytes(out))
+                results[idx] = MapResult(status=status, value=value)
+        except (RuntimeError, OSError) as err:
+            logger.warning("BuildFarm: cannot connect to the tracker: %s", err)
+        finally:
+            if tracker is not None:
+                tracker.close()
+
+    def map_with_error_catching(self, fn, iterator):
+        """Run fn on every item of the iterator on the build workers.
+
+        The tasks are taken by the workers from a shared queue, so faster workers run more
+        of them. The function and the items are cloudpickled, and fn must be importable or
+        picklable on the workers.
+
+        Parameters
+        ----------
+        fn : function
+            The function to be invoked.
+
+        iterator : Iterator
+            Input iterator.
+
+        Returns
+        -------
+        out : List[MapResult]
+            The results in the order of the inputs.
+
+        Raises
+        ------
+        RuntimeError
+            If no build worker is registered under the key. A task whose session is lost
+            after all the workers are gone fails instead of waiting for a new worker.
+        """
+        # pylint: disable=import-outside-toplevel
+        import cloudpickle
+
+        tasks = queue.Queue()
+        num = 0
+        for item in iterator:
+            data = cloudpickle.dumps((fn, (item,)), protocol=pickle.HIGHEST_PROTOCOL)
+            tasks.put((num, bytearray(data), 0))
+            num += 1
+        results = [None] * num
+        if num == 0:
+            return results
+
+        num_workers = self.num_workers()
+        if num_workers == 0:
+            raise self._no_worker()
+        max_workers = self.max_workers if self.max_workers is not None else num_workers
+        threads = [
+            threading.Thread(target=self._serve, args=(tasks, results), daemon=True)
+            for _ in range(max(min(max_workers, num), 1))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i, res in enumerate(results):
+            if res is None:
+                results[i] = MapResult(status=StatusKind.EXCEPTION, value=self._no_worker())
+        return results
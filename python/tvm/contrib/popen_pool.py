@@ -22,12 +22,15 @@ with additional timeout support.
 """
 import os
 import sys
+import time
+import atexit
 import struct
 import threading
 import subprocess
+import uuid
 import concurrent.futures
 from enum import IntEnum
-from collections import namedtuple
+from collections import deque, namedtuple
 import pickle
 
 
@@ -79,6 +82,241 @@ class MapResult(namedtuple("MapResult", ["status", "value"])):
     __slots__ = []
 
 
+class TaskTiming(namedtuple("TaskTiming", ["queue", "startup", "transfer", "compute"])):
+    """The time in seconds a task of PopenPoolExecutor spent in each phase.
+
+    Parameters
+    ----------
+    queue : float
+        Waiting for a free worker after submission.
+
+    startup : float
+        Starting and initializing the worker process, if it was not running.
+
+    transfer : float
+        Serializing and sending the task and its result.
+
+    compute : float
+        Running the function in the worker process.
+    """
+
+    __slots__ = []
+
+
+def _new_shared_memory_name():
+    """A fresh name for a shared memory block of _write_message."""
+    return "tvm_" + uuid.uuid4().hex[:16]
+
+
+def _write_message(writer, data, shared_memory_threshold=None, shared_memory_name=None):
+    """Write a message of bytes to a pipe.
+
+    Messages of at least shared_memory_threshold bytes are put in a shared memory block named
+    shared_memory_name, and only the name of the block is written to the pipe. The reader
+    unlinks the block. The pipe is used if multiprocessing.shared_memory is not available.
+    """
+    shared_memory = None
+    if shared_memory_threshold is not None and len(data) >= shared_memory_threshold:
+        try:
+            # pylint: disable=import-outside-toplevel
+            from multiprocessing import shared_memory
+        except ImportError:
+            # Python < 3.8
+            pass
+
+    if shared_memory is None:
+        writer.write(struct.pack("<i", len(data)))
+        writer.write(data)
+    else:
+        shm = shared_memory.SharedMemory(name=shared_memory_name, create=True, size=len(data))
+        shm.buf[: len(data)] = data
+        shm.close()
+        if os.name == "posix":
+            # pylint: disable=import-outside-toplevel, protected-access
+            from multiprocessing import resource_tracker
+
+            # the block is unlinked by the reader, or by PopenWorker.kill if the worker is
+            # killed before it is read, so do not let this process track it
+            resource_tracker.unregister(shm._name, "shared_memory")
+        desc = ("%s:%d" % (shm.name, len(data))).encode()
+        writer.write(struct.pack("<i", -len(desc)))
+        writer.write(desc)
+    writer.flush()
+
+
+def _read_message(reader):
+    """Read a message written by _write_message. Returns None if the pipe is closed."""
+    len_data = reader.read(4)
+    if len(len_data) != 4:
+        return None
+    size = struct.unpack("<i", len_data)[0]
+    if size >= 0:
+        return reader.read(size)
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    name, nbytes = reader.read(-size).decode().rsplit(":", 1)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[: int(nbytes)])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _unlink_shared_memory(name):
+    """Unlink a shared memory block of _write_message, if it was not read."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=name)
+    except (ImportError, FileNotFoundError):
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _launch_worker_process():
+    """Start a popen_worker process connected by a pair of pipes.
+
+    Returns
+    -------
+    proc, reader, writer
+        The process, and the pipes to read from and write to it.
+    """
+    main_read, worker_write = os.pipe()
+    worker_read, main_write = os.pipe()
+
+    cmd = [sys.executable, "-m", "tvm.exec.popen_worker"]
+    if sys.platform == "win32":
+        # pylint: disable=import-outside-toplevel
+        import msvcrt
+
+        worker_read_handle = msvcrt.get_osfhandle(worker_read)
+        worker_write_handle = msvcrt.get_osfhandle(worker_write)
+        os.set_handle_inheritable(worker_read_handle, True)
+        os.set_handle_inheritable(worker_write_handle, True)
+        cmd += [str(worker_read_handle), str(worker_write_handle)]
+        proc = subprocess.Popen(cmd, close_fds=False)
+    else:
+        cmd += [str(worker_read), str(worker_write)]
+        proc = subprocess.Popen(cmd, pass_fds=(worker_read, worker_write))
+
+    # close worker side of the pipe
+    os.close(worker_read)
+    os.close(worker_write)
+    return proc, os.fdopen(main_read, "rb"), os.fdopen(main_write, "wb")
+
+
+class _WarmWorkerReserve:
+    """Worker processes started ahead of need.
+
+    A popen_worker process imports tvm before it reads its first task, which takes most
+    of the startup time of a worker. The reserve keeps spare processes that have done so
+    in the background, and hands them to PopenWorkers which start or restart.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._spares = deque()
+        # the number of spares of each reservation that is not released yet
+        self._reservations = []
+        self._target = 0
+        self._refilling = False
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        # the spares and the refill thread belong to the parent of a forked process
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._spares = deque()
+            self._reservations = []
+            self._target = 0
+            self._refilling = False
+
+    def reserve(self, num):
+        """Keep at least num spare processes until the reservation is released."""
+        with self._cond:
+            self._check_fork()
+            self._reservations.append(num)
+            self._target = max(self._reservations)
+            self._refill_locked()
+
+    def release(self, num):
+        """Release a reservation of num spare processes, and stop the spares not needed
+        by the other reservations."""
+        with self._cond:
+            self._check_fork()
+            if num not in self._reservations:
+                return
+            self._reservations.remove(num)
+            self._target = max(self._reservations, default=0)
+            surplus = []
+            while len(self._spares) > self._target:
+                surplus.append(self._spares.pop())
+        self._stop(surplus)
+
+    def acquire(self):
+        """Take a spare process, or None if there is none ready."""
+        with self._cond:
+            self._check_fork()
+            spare = None
+            while self._spares and spare is None:
+                spare = self._spares.popleft()
+                if spare[0].poll() is not None:
+                    spare = None
+            self._refill_locked()
+            return spare
+
+    def _refill_locked(self):
+        if not self._refilling and len(self._spares) < self._target:
+            self._refilling = True
+            threading.Thread(target=self._refill, daemon=True).start()
+
+    def _refill(self):
+        while True:
+            with self._cond:
+                if len(self._spares) >= self._target:
+                    self._refilling = False
+                    return
+            spare = _launch_worker_process()
+            with self._cond:
+                # the reservations may have been released meanwhile
+                surplus = len(self._spares) >= self._target
+                if not surplus:
+                    self._spares.append(spare)
+            if surplus:
+                self._stop([spare])
+
+    def shutdown(self):
+        """Stop all the spare processes."""
+        with self._cond:
+            self._check_fork()
+            spares, self._spares = self._spares, deque()
+            self._reservations = []
+            self._target = 0
+        self._stop(spares)
+
+    @staticmethod
+    def _stop(spares):
+        for proc, reader, writer in spares:
+            # the worker exits when its input is closed
+            for pipe in (writer, reader):
+                try:
+                    pipe.close()
+                except IOError:
+                    pass
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
+
+_WARM_RESERVE = _WarmWorkerReserve()
+atexit.register(_WARM_RESERVE.shutdown)
+
+
 class PopenWorker:
     """A subprocess worker via Popen.
 
@@ -97,14 +335,37 @@ class PopenWorker:
         The maximum number of times a process can be used before being recycled,
         i.e. killed and restarted. If `None`, the process will be reused until
         an operation times out.
+
+    warm_start: bool
+        If True, (re)start from a spare process kept by the reserve of warm workers
+        when one is ready, instead of starting a new interpreter.
+
+    shared_memory_threshold: Optional[int]
+        Tasks and results of at least this number of bytes once pickled are passed through
+        shared memory instead of the pipes, on Python 3.8 or later. If `None`, the pipes are
+        always used.
     """
 
-    def __init__(self, initializer=None, initargs=(), maximum_uses=None):
+    def __init__(
+        self,
+        initializer=None,
+        initargs=(),
+        maximum_uses=None,
+        warm_start=False,
+        shared_memory_threshold=None,
+    ):
         self._proc = None
         self._initializer = initializer
         self._initargs = initargs
         self._maximum_uses = maximum_uses
         self._remaining_uses = None
+        self._warm_start = warm_start
+        self._shared_memory_threshold = shared_memory_threshold
+        # the names of the shared memory blocks of the task in flight, unlinked if it is killed
+        self._shared_memory_names = ()
+        # seconds spent in starting the process by the last send, and in the last function
+        self.last_startup_secs = 0.0
+        self.last_compute_secs = None
 
         if self._initializer is not None and not callable(self._initializer):
             raise TypeError("initializer must be callable for PopenWorker")
@@ -147,35 +408,19 @@ class PopenWorker:
             self._proc = None
             self._remaining_uses = None
 
+        for name in self._shared_memory_names:
+            _unlink_shared_memory(name)
+        self._shared_memory_names = ()
+
     def _start(self):
         """Start a new subprocess if nothing is available"""
         if self._proc is not None:
             return
 
-        # connect subprocess with a pair of pipes
-        main_read, worker_write = os.pipe()
-        worker_read, main_write = os.pipe()
-
-        cmd = [sys.executable, "-m", "tvm.exec.popen_worker"]
-        if sys.platform == "win32":
-            # pylint: disable=import-outside-toplevel
-            import msvcrt
-
-            worker_read_handle = msvcrt.get_osfhandle(worker_read)
-            worker_write_handle = msvcrt.get_osfhandle(worker_write)
-            os.set_handle_inheritable(worker_read_handle, True)
-            os.set_handle_inheritable(worker_write_handle, True)
-            cmd += [str(worker_read_handle), str(worker_write_handle)]
-            self._proc = subprocess.Popen(cmd, close_fds=False)
-        else:
-            cmd += [str(worker_read), str(worker_write)]
-            self._proc = subprocess.Popen(cmd, pass_fds=(worker_read, worker_write))
-
-        # close worker side of the pipe
-        os.close(worker_read)
-        os.close(worker_write)
-        self._reader = os.fdopen(main_read, "rb")
-        self._writer = os.fdopen(main_write, "wb")
+        started = _WARM_RESERVE.acquire() if self._warm_start else None
+        if started is None:
+            started = _launch_worker_process()
+        self._proc, self._reader, self._writer = started
 
     def join(self, timeout=None):
         """Join the current process worker before it terminates.
@@ -229,7 +474,9 @@ class PopenWorker:
             # Time to recycle the process.
             self.kill()
 
+        startup_secs = 0.0
         if self._proc is None:
+            tic = time.time()
             self._start()
             # init
             if self._initializer is not None:
@@ -238,12 +485,20 @@ class PopenWorker:
 
             # N.B. The initializer doesn't count as a "use"
             self._remaining_uses = self._maximum_uses
+            startup_secs = time.time() - tic
+        self.last_startup_secs = startup_secs
+        self.last_compute_secs = None
         kwargs = {} if not kwargs else kwargs
-        data = cloudpickle.dumps((fn, args, kwargs, timeout), protocol=pickle.HIGHEST_PROTOCOL)
+        task_name = result_name = None
+        if self._shared_memory_threshold is not None:
+            task_name, result_name = _new_shared_memory_name(), _new_shared_memory_name()
+            self._shared_memory_names = (task_name, result_name)
+        data = cloudpickle.dumps(
+            (fn, args, kwargs, timeout, self._shared_memory_threshold, result_name),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
         try:
-            self._writer.write(struct.pack("<i", len(data)))
-            self._writer.write(data)
-            self._writer.flush()
+            _write_message(self._writer, data, self._shared_memory_threshold, task_name)
         except IOError:
             pass
 
@@ -274,18 +529,16 @@ class PopenWorker:
         import cloudpickle
 
         try:
-            len_data = self._reader.read(4)
+            data = _read_message(self._reader)
         except IOError:
             raise self._child_process_error()
 
-        if len(len_data) == 0:
+        if data is None:
             raise self._child_process_error()
+        # the worker has read the task, and its result is read
+        self._shared_memory_names = ()
 
-        try:
-            recv_bytes = struct.unpack("<i", len_data)[0]
-            status, value = cloudpickle.loads(self._reader.read(recv_bytes))
-        except IOError:
-            raise self._child_process_error()
+        status, value, self.last_compute_secs = cloudpickle.loads(data)
 
         if status == StatusKind.COMPLETE:
             return value
@@ -319,11 +572,26 @@ class PopenPoolExecutor:
         i.e. killed and restarted. If `None`, processes will be reused until an
         operation times out.
 
+    warm_workers: Optional[int]
+        The number of spare worker processes, with tvm already imported, to keep started
+        in the background. Workers of this pool start from a spare process when one is
+        ready, e.g. when the pool is created or a worker is recycled. The spares are shared
+        by all the pools of the process, and are kept until the pool is deleted.
+        If `None`, keep max_workers spares.
+
+    shared_memory_threshold: Optional[int]
+        Tasks and results of at least this number of bytes once pickled are passed through
+        shared memory instead of pipes, on Python 3.8 or later. If `None`, pipes are always
+        used.
+
     Note
     ----
     If max_workers is NONE then the number returned by
     os.cpu_count() is used. This method aligns with the
     behavior of multiprocessing.pool().
+
+    The timings of the latest tasks are kept in `task_timings`, a deque of
+    :any:`TaskTiming` in the order the tasks finish.
     """
 
     def __init__(
@@ -333,6 +601,8 @@ class PopenPoolExecutor:
         initializer=None,
         initargs=(),
         maximum_process_uses=None,
+        warm_workers=0,
+        shared_memory_threshold=None,
     ):
         if max_workers is None:
             max_workers = os.cpu_count()
@@ -344,9 +614,16 @@ class PopenPoolExecutor:
         self._initializer = initializer
         self._initargs = initargs
         self._maximum_process_uses = maximum_process_uses
+        self._warm_start = warm_workers != 0
+        self._shared_memory_threshold = shared_memory_threshold
+        self.task_timings = deque(maxlen=4096)
 
         if self._initializer is not None and not callable(self._initializer):
             raise TypeError("initializer must be callable for PopenPoolExecutor")
+        self._num_warm_workers = 0
+        if self._warm_start:
+            self._num_warm_workers = max_workers if warm_workers is None else warm_workers
+            _WARM_RESERVE.reserve(self._num_warm_workers)
 
     def __del__(self):
         self._lock.acquire()
@@ -357,25 +634,48 @@ class PopenPoolExecutor:
                 pass
         self._lock.release()
         self._threadpool.shutdown()
+        if getattr(self, "_num_warm_workers", 0):
+            _WARM_RESERVE.release(self._num_warm_workers)
+            self._num_warm_workers = 0
 
-    def _worker_run(self, fn, args, kwargs):
+    def _worker_run(self, fn, args, kwargs, submit_time):
         """Internal thread runner."""
+        start_time = time.time()
         self._lock.acquire()
         tid = threading.get_ident()
         if tid not in self._worker_map:
-            proc = PopenWorker(self._initializer, self._initargs, self._maximum_process_uses)
+            proc = PopenWorker(
+                self._initializer,
+                self._initargs,
+                self._maximum_process_uses,
+                self._warm_start,
+                self._shared_memory_threshold,
+            )
             self._worker_map[tid] = proc
         else:
             proc = self._worker_map[tid]
         self._lock.release()
 
-        proc.send(fn, args, kwargs, self._timeout)
-        return proc.recv()
-
-    def _worker_run_with_error_catching(self, fn, args, kwargs) -> MapResult:
+        try:
+            proc.send(fn, args, kwargs, self._timeout)
+            return proc.recv()
+        finally:
+            compute = proc.last_compute_secs or 0.0
+            self.task_timings.append(
+                TaskTiming(
+                    queue=start_time - submit_time,
+                    startup=proc.last_startup_secs,
+                    transfer=max(time.time() - start_time - proc.last_startup_secs - compute, 0.0),
+                    compute=compute,
+                )
+            )
+
+    def _worker_run_with_error_catching(self, fn, args, kwargs, submit_time) -> MapResult:
         # pylint: disable=broad-except
         try:
-            return MapResult(status=StatusKind.COMPLETE, value=self._worker_run(fn, args, kwargs))
+            return MapResult(
+                status=StatusKind.COMPLETE, value=self._worker_run(fn, args, kwargs, submit_time)
+            )
         except TimeoutError as exception:
             return MapResult(status=StatusKind.TIMEOUT, value=exception)
         except Exception as exception:
@@ -402,7 +702,7 @@ class PopenPoolExecutor:
         """
         # pylint: disable=unnecessary-lambda
         worker = lambda *args: self._worker_run(*args)
-        return self._threadpool.submit(worker, fn, args, kwargs)
+        return self._threadpool.submit(worker, fn, args, kwargs, time.time())
 
     def map_with_error_catching(self, fn, iterator):
         """Same as map, but catches exceptions and return them instead.
@@ -420,5 +720,6 @@ class PopenPoolExecutor:
         out_iter : Iterator[MapResult]
             The result iterator.
         """
-        worker = lambda x: self._worker_run_with_error_catching(fn, (x,), None)
+        submit_time = time.time()
+        worker = lambda x: self._worker_run_with_error_catching(fn, (x,), None, submit_time)
         return self._threadpool.map(worker, iterator)
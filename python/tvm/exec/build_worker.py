@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name, invalid-name
+"""Start a build worker of a build farm"""
+import argparse
+import logging
+from ..contrib import build_farm
+
+
+def main(args):
+    """Main function
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        parsed args from command-line invocation
+    """
+    url, port = args.tracker.rsplit(":", 1)
+    server = build_farm.start_build_worker(
+        (url, int(port)),
+        key=args.key,
+        host=args.host,
+        port=args.port,
+        port_end=args.port_end,
+        custom_addr=args.custom_addr,
+    )
+    server.proc.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--host", type=str, default="0.0.0.0", help="The host IP address the worker binds to"
+    )
+    parser.add_argument("--port", type=int, default=9190, help="The port of the worker")
+    parser.add_argument(
+        "--port-end", type=int, default=9290, help="The end search port of the worker"
+    )
+    parser.add_argument(
+        "--tracker",
+        type=str,
+        required=True,
+        help="The address of RPC tracker in host:port format. e.g. (10.77.1.234:9190)",
+    )
+    parser.add_argument(
+        "--key", type=str, default="build", help="The key of the build workers in tracker."
+    )
+    parser.add_argument(
+        "--custom-addr", type=str, help="Custom IP Address to Report to RPC Tracker"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    main(args)
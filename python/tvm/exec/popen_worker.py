@@ -18,14 +18,14 @@
 """Internal PopenWorker for PopenPool."""
 import sys
 import os
-import struct
+import time
 import threading
 import traceback
 import pickle
 import logging
 import cloudpickle
 
-from tvm.contrib.popen_pool import StatusKind
+from tvm.contrib.popen_pool import StatusKind, _read_message, _write_message
 
 
 class TimeoutStatus:
@@ -54,48 +54,46 @@ def main():
 
     lock = threading.Lock()
 
-    def _respond(ret_value):
-        """Send data back to the client."""
+    def _respond(ret_value, shared_memory_threshold=None, shared_memory_name=None):
+        """Send (status, value, compute seconds) back to the client."""
         data = cloudpickle.dumps(ret_value, protocol=pickle.HIGHEST_PROTOCOL)
-        writer.write(struct.pack("<i", len(data)))
-        writer.write(data)
-        writer.flush()
+        _write_message(writer, data, shared_memory_threshold, shared_memory_name)
 
-    def _cancel_run(status):
+    def _cancel_run(status, timeout):
         lock.acquire()
         if status.status == StatusKind.RUNNING:
-            _respond((StatusKind.TIMEOUT, TimeoutError()))
+            _respond((StatusKind.TIMEOUT, TimeoutError(), timeout))
             status.status = StatusKind.TIMEOUT
         lock.release()
 
     while True:
-        raw_bytes_size = reader.read(4)
-        if len(raw_bytes_size) != 4:
+        data = _read_message(reader)
+        if data is None:
             # the parent exited
             return
-        bytes_size = struct.unpack("<i", raw_bytes_size)[0]
-        fn, args, kwargs, timeout = cloudpickle.loads(reader.read(bytes_size))
+        fn, args, kwargs, timeout, shared_memory_threshold, result_name = cloudpickle.loads(data)
         status = TimeoutStatus()
 
         if timeout is not None:
-            watcher = threading.Timer(timeout, _cancel_run, [status])
+            watcher = threading.Timer(timeout, _cancel_run, [status, timeout])
             watcher.daemon = True
             watcher.start()
 
         # pylint: disable=broad-except
+        tic = time.time()
         try:
             result = fn(*args, **kwargs)
-            ret_value = (StatusKind.COMPLETE, result)
+            ret_value = (StatusKind.COMPLETE, result, time.time() - tic)
         except Exception as exception:
             msg = traceback.format_exc()
-            ret_value = (StatusKind.EXCEPTION, type(exception)(msg))
+            ret_value = (StatusKind.EXCEPTION, type(exception)(msg), time.time() - tic)
 
         if timeout is not None:
             watcher.cancel()
 
         lock.acquire()
         if status.status == StatusKind.RUNNING:
-            _respond(ret_value)
+            _respond(ret_value, shared_memory_threshold, result_name)
             status.status = StatusKind.COMPLETE
         lock.release()
 
@@ -49,6 +49,7 @@ def main(args):
         custom_addr=args.custom_addr,
         silent=args.silent,
         no_fork=not args.fork,
+        cache_dir=args.cache_dir,
     )
     server.proc.join()
 
@@ -90,6 +91,11 @@ if __name__ == "__main__":
     parser.add_argument(
         "--custom-addr", type=str, help="Custom IP Address to Report to RPC Tracker"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="The directory of the cache of uploaded files, kept across restarts of the server.",
+    )
 
     parser.set_defaults(fork=True)
     args = parser.parse_args()
@@ -18,12 +18,19 @@
 """Tool to start RPC tracker"""
 import logging
 import argparse
-from ..rpc.tracker import Tracker
+from ..rpc.tracker import FairShareScheduler, PriorityScheduler, Tracker
 
 
 def main(args):
     """Main function"""
-    tracker = Tracker(args.host, port=args.port, port_end=args.port_end, silent=args.silent)
+    scheduler = {"priority": PriorityScheduler, "fair-share": FairShareScheduler}[args.scheduler]
+    tracker = Tracker(
+        args.host,
+        port=args.port,
+        port_end=args.port_end,
+        silent=args.silent,
+        scheduler=scheduler,
+    )
     tracker.proc.join()
 
 
@@ -35,6 +42,14 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=9190, help="The port of the RPC")
     parser.add_argument("--port-end", type=int, default=9199, help="The end search port of the RPC")
     parser.add_argument("--silent", action="store_true", help="Whether run in silent mode.")
+    parser.add_argument(
+        "--scheduler",
+        type=str,
+        choices=["priority", "fair-share"],
+        default="priority",
+        help="How the requests of each key are scheduled. "
+        "fair-share shares the devices between the users and avoids unhealthy devices.",
+    )
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
     main(args)
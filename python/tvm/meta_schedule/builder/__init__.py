@@ -21,3 +21,4 @@ and then export
 """
 from .builder import Builder, BuilderInput, BuilderResult, PyBuilder
 from .local_builder import LocalBuilder
+from .remote_builder import RemoteBuilder
@@ -18,12 +18,13 @@
 import logging
 import os
 import tempfile
-from typing import Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 from tvm._ffi import register_func
 from tvm.ir import IRModule
 from tvm.runtime import Module, NDArray, load_param_dict, save_param_dict
 from tvm.target import Target
+from tvm.tir import PrimFunc
 
 from ...contrib.popen_pool import MapResult, PopenPoolExecutor, StatusKind
 from ..utils import (
@@ -33,6 +34,9 @@ from ..utils import (
 )
 from .builder import BuilderInput, BuilderResult, PyBuilder
 
+if TYPE_CHECKING:
+    from ...utils import RooflineScreening
+
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
@@ -74,6 +78,10 @@ class LocalBuilder(PyBuilder):
     f_export : Union[None, str, T_EXPORT]
         Name of the export function to be used.
         Defaults to `meta_schedule.builder.default_export`.
+    screening : Optional[RooflineScreening]
+        The screening of the inputs of a batch before they are built.
+    warm_workers : int
+        The number of spare Popen workers to keep started in the background during a build.
 
     Attributes
     ----------
@@ -110,6 +118,9 @@ class LocalBuilder(PyBuilder):
     initializer: Optional[Callable[[], None]]
     f_build: Union[None, str, T_BUILD]
     f_export: Union[None, str, T_EXPORT]
+    screening: Optional["RooflineScreening"]
+    warm_workers: int
+    shared_memory_threshold: Optional[int]
 
     def __init__(
         self,
@@ -119,6 +130,9 @@ class LocalBuilder(PyBuilder):
         f_build: Union[None, str, T_BUILD] = None,
         f_export: Union[None, str, T_EXPORT] = None,
         initializer: Optional[Callable[[], None]] = None,
+        screening: Optional["RooflineScreening"] = None,
+        warm_workers: int = 0,
+        shared_memory_threshold: Optional[int] = None,
     ) -> None:
         """Constructor.
 
@@ -137,6 +151,18 @@ class LocalBuilder(PyBuilder):
             Defaults to `meta_schedule.builder.default_export`.
         initializer : Optional[Callable[[], None]]
             The initializer to be used for the worker processes.
+        screening : Optional[tvm.utils.RooflineScreening]
+            If given, the inputs of a batch are lowered and ranked by the run time a roofline
+            model estimates from their features, and only the fastest `screening.ratio` of
+            them are built. The others get a builder error starting with "Screened", so that
+            they are not run nor used to train the cost model.
+        warm_workers : int
+            The number of spare worker processes, with tvm already imported, to keep
+            started in the background during a build, see PopenPoolExecutor.
+        shared_memory_threshold : Optional[int]
+            Build inputs and results of at least this number of bytes are passed to and from
+            the worker processes through shared memory, see PopenPoolExecutor. If None, they
+            are always passed through pipes.
         """
         super().__init__()
 
@@ -149,6 +175,9 @@ class LocalBuilder(PyBuilder):
         self.initializer = initializer
         self.f_build = f_build
         self.f_export = f_export
+        self.screening = screening
+        self.warm_workers = warm_workers
+        self.shared_memory_threshold = shared_memory_threshold
         self._sanity_check()
 
     def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
@@ -162,8 +191,24 @@ class LocalBuilder(PyBuilder):
             max_workers=self.max_workers,
             timeout=self.timeout_sec,
             initializer=self.initializer,
+            warm_workers=self.warm_workers,
+            shared_memory_threshold=self.shared_memory_threshold,
         )
 
+        selected = list(range(len(build_inputs)))
+        if self.screening is not None:
+            estimates = [
+                map_result.value if map_result.status == StatusKind.COMPLETE else float("inf")
+                for map_result in pool.map_with_error_catching(
+                    lambda x: _estimate_worker_func(*x),
+                    [
+                        (self.screening, build_input.mod, build_input.target)
+                        for build_input in build_inputs
+                    ],
+                )
+            ]
+            selected = self.screening.select(estimates)
+
         # Dispatch the build inputs to the worker processes.
         for map_result in pool.map_with_error_catching(
             lambda x: _worker_func(*x),
@@ -171,11 +216,11 @@ class LocalBuilder(PyBuilder):
                 (
                     self.f_build,
                     self.f_export,
-                    build_input.mod,
-                    build_input.target,
-                    _serialize_params(build_input.params),
+                    build_inputs[i].mod,
+                    build_inputs[i].target,
+                    _serialize_params(build_inputs[i].params),
                 )
-                for build_input in build_inputs
+                for i in selected
             ],
         ):
             if map_result.status == StatusKind.COMPLETE:
@@ -197,6 +242,18 @@ class LocalBuilder(PyBuilder):
             else:
                 raise ValueError("Unreachable: unexpected result: {map_result}")
         del pool
+        if len(selected) < len(build_inputs):
+            built = dict(zip(selected, results))
+            results = [
+                built.get(
+                    i,
+                    BuilderResult(
+                        None,
+                        f"Screened: estimated run time {estimates[i]:.3g} s by the roofline model",
+                    ),
+                )
+                for i in range(len(build_inputs))
+            ]
         return results
 
     def _sanity_check(self) -> None:
@@ -238,6 +295,21 @@ def _worker_func(
     return artifact_path
 
 
+def _estimate_worker_func(
+    screening: "RooflineScreening",
+    mod: IRModule,
+    target: Target,
+) -> float:
+    # pylint: disable=import-outside-toplevel
+    from tvm.driver import lower
+
+    with target:
+        mod = lower(mod)
+    return sum(
+        screening.estimate(func) for func in mod.functions.values() if isinstance(func, PrimFunc)
+    )
+
+
 @register_func("meta_schedule.builder.default_build")
 def default_build(mod: IRModule, target: Target, _params: Optional[Dict[str, NDArray]]) -> Module:
     """Default build function.
@@ -0,0 +1,173 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Remote builder that compile on the build workers of a build farm"""
+import os
+import tempfile
+from typing import List, Optional, Tuple, Union
+
+from tvm.ir import IRModule
+from tvm.target import Target
+
+from ...contrib.popen_pool import MapResult, StatusKind
+from ..runner.config import RPCConfig
+from ..utils import derived_object
+from .builder import BuilderInput, BuilderResult, PyBuilder
+from .local_builder import T_BUILD, T_EXPORT, _serialize_params, _worker_func
+
+
+@derived_object
+class RemoteBuilder(PyBuilder):
+    """A builder that builds the given input on the build workers registered to an RPC tracker.
+
+    The build inputs are sharded over the workers, and the exported artifacts are sent back
+    and saved on the local host.
+
+    Parameters
+    ----------
+    rpc_config : RPCConfig
+        The configuration of the RPC tracker. Its tracker_key is the key of the build workers.
+    max_workers: Optional[int]
+        The max number of build workers used at the same time.
+    timeout_sec : float
+        The timeout in seconds for the build.
+    f_build : Union[None, str, T_BUILD]
+        Name of the build function to be used.
+        Defaults to `meta_schedule.builder.default_build`.
+    f_export : Union[None, str, T_EXPORT]
+        Name of the export function to be used.
+        Defaults to `meta_schedule.builder.default_export`.
+
+    Note
+    ----
+    The build workers are started by `python -m tvm.exec.build_worker`. Functions given by
+    name should be registered in the workers, while callables are sent to them.
+    """
+
+    rpc_config: RPCConfig
+    max_workers: Optional[int]
+    timeout_sec: float
+    f_build: Union[None, str, T_BUILD]
+    f_export: Union[None, str, T_EXPORT]
+
+    def __init__(
+        self,
+        rpc_config: Optional[RPCConfig] = None,
+        *,
+        max_workers: Optional[int] = None,
+        timeout_sec: float = 30.0,
+        f_build: Union[None, str, T_BUILD] = None,
+        f_export: Union[None, str, T_EXPORT] = None,
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        rpc_config : Optional[RPCConfig]
+            The configuration of the RPC tracker. The key of the build workers
+            defaults to "build".
+        max_workers : Optional[int]
+            The maximum number of build workers to be used.
+            Defaults to the number of workers registered to the tracker.
+        timeout_sec : float
+            The timeout in seconds for the build.
+        f_build : T_BUILD
+            Name of the build function to be used.
+            Defaults to `meta_schedule.builder.default_build`.
+        f_export : T_EXPORT
+            Name of the export function to be used.
+            Defaults to `meta_schedule.builder.default_export`.
+        """
+        super().__init__()
+        if rpc_config is None:
+            rpc_config = RPCConfig()
+        if rpc_config.tracker_key is None:
+            rpc_config = rpc_config._replace(tracker_key="build")
+        self.rpc_config = RPCConfig._normalized(rpc_config)  # pylint: disable=protected-access
+        self.max_workers = max_workers
+        self.timeout_sec = timeout_sec
+        self.f_build = f_build
+        self.f_export = f_export
+
+    def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
+        results: List[BuilderResult] = []
+        map_result: MapResult
+
+        # pylint: disable=import-outside-toplevel
+        from ...contrib.build_farm import BuildFarm
+
+        farm = BuildFarm(
+            self.rpc_config.tracker_host,
+            self.rpc_config.tracker_port,
+            key=self.rpc_config.tracker_key,
+            max_workers=self.max_workers,
+            timeout=self.timeout_sec,
+            priority=self.rpc_config.session_priority,
+        )
+        for map_result in farm.map_with_error_catching(
+            lambda x: _remote_worker_func(*x),
+            [
+                (
+                    self.f_build,
+                    self.f_export,
+                    build_input.mod,
+                    build_input.target,
+                    _serialize_params(build_input.params),
+                )
+                for build_input in build_inputs
+            ],
+        ):
+            if map_result.status == StatusKind.COMPLETE:
+                file_name, data = map_result.value
+                artifact_path = os.path.join(tempfile.mkdtemp(), file_name)
+                with open(artifact_path, "wb") as out_file:
+                    out_file.write(data)
+                results.append(BuilderResult(artifact_path, None))
+            elif map_result.status == StatusKind.TIMEOUT:
+                results.append(
+                    BuilderResult(
+                        None,
+                        f"RemoteBuilder: Timeout, killed after {self.timeout_sec} seconds",
+                    )
+                )
+            elif map_result.status == StatusKind.EXCEPTION:
+                results.append(
+                    BuilderResult(
+                        None,
+                        "RemoteBuilder: An exception occurred\n" + str(map_result.value),
+                    )
+                )
+            else:
+                raise ValueError(f"Unreachable: unexpected result: {map_result}")
+        return results
+
+
+def _remote_worker_func(
+    _f_build: Union[None, str, T_BUILD],
+    _f_export: Union[None, str, T_EXPORT],
+    mod: IRModule,
+    target: Target,
+    params: Optional[bytearray],
+) -> Tuple[str, bytes]:
+    artifact_path = _worker_func(_f_build, _f_export, mod, target, params)
+    with open(artifact_path, "rb") as in_file:
+        data = in_file.read()
+    os.remove(artifact_path)
+    try:
+        os.rmdir(os.path.dirname(artifact_path))
+    except OSError:
+        pass
+    return os.path.basename(artifact_path), data
@@ -20,6 +20,7 @@ XGBoost-based cost model
 import logging
 import os
 import tempfile
+import time
 from collections import OrderedDict
 from itertools import chain as itertools_chain
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
@@ -27,8 +28,10 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optiona
 import numpy as np  # type: ignore
 
 from ...contrib.tar import tar, untar
-from ...runtime import NDArray
+from ...target import Target
+from ...tir import Schedule
 from ..cost_model import PyCostModel
+from ..database import Database, TuningRecord
 from ..feature_extractor import FeatureExtractor
 from ..runner import RunnerResult
 from ..search_strategy import MeasureCandidate
@@ -298,6 +301,14 @@ class XGBModel(PyCostModel):
         The verbose level when doing evaluation.
     average_peak_n : int
         The number to calculate average peak score.
+    incremental : bool
+        Whether to continue boosting the previous model on the new samples instead of training
+        a new model on all the samples in every update.
+    full_refit_interval : int
+        In incremental mode, the number of incremental updates between two full refits.
+    replay_buffer_size : int
+        In incremental mode, the maximum number of old samples randomly drawn and trained
+        together with the new samples, so that the model does not forget them.
     """
 
     # feature extractor
@@ -310,10 +321,16 @@ class XGBModel(PyCostModel):
     early_stopping_rounds: int
     verbose_eval: int
     average_peak_n: int
+    # incremental training
+    incremental: bool
+    full_refit_interval: int
+    replay_buffer_size: int
     # states
     data: Dict[str, FeatureGroup]
     data_size: int
     booster: Optional["xgb.Booster"]
+    num_incremental_updates: int
+    full_train_secs_per_sample: Optional[float]
 
     def __init__(
         self,
@@ -328,6 +345,10 @@ class XGBModel(PyCostModel):
         early_stopping_rounds: int = 50,
         verbose_eval: int = 25,
         average_peak_n: int = 32,
+        # incremental training
+        incremental: bool = False,
+        full_refit_interval: int = 10,
+        replay_buffer_size: int = 1024,
     ):
         super().__init__()
         # feature extractor
@@ -343,10 +364,16 @@ class XGBModel(PyCostModel):
         self.early_stopping_rounds = early_stopping_rounds
         self.verbose_eval = verbose_eval
         self.average_peak_n = average_peak_n
+        # incremental training
+        self.incremental = incremental
+        self.full_refit_interval = full_refit_interval
+        self.replay_buffer_size = replay_buffer_size
         # states
         self.data = OrderedDict()
         self.data_size = 0
         self.booster = None
+        self.num_incremental_updates = 0
+        self.full_train_secs_per_sample = None
 
     def load(self, path: str) -> None:
         """Load the cost model from given file location.
@@ -384,7 +411,7 @@ class XGBModel(PyCostModel):
                 booster = xgb.Booster()
                 booster.load_model(model_path)
             else:
-                self.booster = None
+                booster = None
         self.data = data
         self.data_size = data_size
         self.booster = booster
@@ -455,16 +482,8 @@ class XGBModel(PyCostModel):
         group = self.data.get(new_group_hash, None)
 
         # Step 2. Extract features
-        def _feature(x: NDArray) -> np.ndarray:
-            return x.numpy().astype("float32")
-
-        def _mean_cost(x: RunnerResult) -> float:
-            if not x.run_secs:
-                return 1e10
-            return float(np.median([float(s) for s in x.run_secs]))
-
-        new_features = [_feature(x) for x in self.extractor.extract_from(context, candidates)]
-        new_mean_costs = np.array([_mean_cost(x) for x in results]).astype("float32")
+        new_features = self._extract_features(context, candidates)
+        new_mean_costs = np.array([_mean_cost(x.run_secs) for x in results]).astype("float32")
 
         # Steps 3. Run validation
         if group is not None and self.booster is not None:
@@ -480,18 +499,108 @@ class XGBModel(PyCostModel):
             )
 
         # Step 4. Add the features into the data points
-        if group is None:
-            group = FeatureGroup(
-                group_hash=new_group_hash,
-                features=new_features,
-                costs=new_mean_costs,
+        group = self._add_to_group(new_group_hash, new_features, new_mean_costs)
+
+        # Step 5. Re-train the model
+        tic = time.time()
+        # A loaded model, e.g. a pre-trained one, is fine-tuned incrementally right away
+        if (
+            self.incremental
+            and self.booster is not None
+            and self.num_incremental_updates < self.full_refit_interval
+        ):
+            num_replayed = self._train_incremental(group, len(new_features))
+            train_secs = time.time() - tic
+            self.num_incremental_updates += 1
+            logger.info(
+                "XGB incremental update on %d new and %d replayed samples took %.2f s",
+                len(new_features),
+                num_replayed,
+                train_secs,
             )
+            if self.full_train_secs_per_sample is not None:
+                logger.info(
+                    "XGB incremental update took %.2f s less than an estimated full refit",
+                    self.full_train_secs_per_sample * self.data_size - train_secs,
+                )
         else:
-            group.append(new_features, new_mean_costs)
-        self.data[new_group_hash] = group
-        self.data_size += len(new_features)
+            self._train_full()
 
-        # Step 5. Re-train the model
+    def pretrain(self, database: Database, target: Optional[Target] = None) -> None:
+        """Pre-train the cost model on the tuning records of all the workloads in a database.
+
+        The scores of the records are normalized per workload, so that the model learns which
+        schedules are relatively fast across workloads. Saved by `save`, the pre-trained model
+        ranks the candidates of a new workload from the first trials on, and is fine-tuned on
+        its measurements online.
+
+        Parameters
+        ----------
+        database : Database
+            The database whose tuning records are the training data.
+        target : Optional[Target]
+            If given, only the records measured on a target of the same kind are used.
+        """
+        from ..tune_context import TuneContext  # pylint: disable=import-outside-toplevel
+
+        groups: Dict[str, List[TuningRecord]] = OrderedDict()
+        for record in database.get_all_tuning_records():
+            if record.target is None:
+                continue
+            if target is not None and record.target.kind.name != target.kind.name:
+                continue
+            groups.setdefault(shash2hex(record.workload.mod), []).append(record)
+
+        for group_hash, records in groups.items():
+            mod = records[0].workload.mod
+            candidates = []
+            for record in records:
+                sch = Schedule(mod)
+                record.trace.apply_to_schedule(sch, remove_postproc=False)
+                candidates.append(MeasureCandidate(sch, record.args_info or []))
+            context = TuneContext(
+                mod=mod,
+                target=records[0].target,
+                num_threads=self.config.nthread,
+            )
+            self._add_to_group(
+                group_hash,
+                self._extract_features(context, candidates),
+                np.array([_mean_cost(r.run_secs) for r in records]).astype("float32"),
+            )
+        logger.info(
+            "XGB pre-training on %d records of %d workloads", self.data_size, len(self.data)
+        )
+        if self.data_size > 0:
+            self._train_full()
+
+    def _extract_features(
+        self,
+        context: "TuneContext",
+        candidates: List[MeasureCandidate],
+    ) -> List[np.ndarray]:
+        return [
+            x.numpy().astype("float32") for x in self.extractor.extract_from(context, candidates)
+        ]
+
+    def _add_to_group(
+        self,
+        group_hash: str,
+        features: List[np.ndarray],
+        costs: np.ndarray,
+    ) -> FeatureGroup:
+        group = self.data.get(group_hash, None)
+        if group is None:
+            group = FeatureGroup(group_hash=group_hash, features=features, costs=costs)
+        else:
+            group.append(features, costs)
+        self.data[group_hash] = group
+        self.data_size += len(features)
+        return group
+
+    def _train_full(self) -> None:
+        """Train a new model on all the samples."""
+        tic = time.time()
         self._train(
             xs=list(itertools_chain.from_iterable([g.features for g in self.data.values()])),
             ys=np.concatenate(
@@ -499,6 +608,28 @@ class XGBModel(PyCostModel):
                 axis=0,
             ),
         )
+        self.num_incremental_updates = 0
+        self.full_train_secs_per_sample = (time.time() - tic) / self.data_size
+
+    def _train_incremental(self, group: FeatureGroup, num_new: int) -> int:
+        """Continue boosting the model on the newest samples of a group and a random sample of
+        the other samples. Returns the number of the other samples."""
+        old_xs: List[np.ndarray] = []
+        old_ys: List[np.ndarray] = []
+        for g in self.data.values():
+            num_old = len(g.features) - num_new if g is group else len(g.features)
+            old_xs.extend(g.features[:num_old])
+            old_ys.append(g.min_cost / g.costs[:num_old])
+        replay = np.random.choice(
+            len(old_xs), min(len(old_xs), self.replay_buffer_size), replace=False
+        )
+        ys = np.concatenate(old_ys, axis=0)[replay]
+        self._train(
+            xs=[old_xs[i] for i in replay] + group.features[-num_new:],
+            ys=np.concatenate([ys, group.min_cost / group.costs[-num_new:]], axis=0),
+            booster=self.booster,
+        )
+        return len(replay)
 
     def predict(
         self,
@@ -520,15 +651,7 @@ class XGBModel(PyCostModel):
             The predicted normalized score.
         """
         if self.data_size >= self.num_warmup_samples and self.booster is not None:
-            ret = self._predict(
-                xs=[
-                    x.numpy().astype("float32")
-                    for x in self.extractor.extract_from(
-                        context,
-                        candidates,
-                    )
-                ]
-            )
+            ret = self._predict(xs=self._extract_features(context, candidates))
         else:
             ret = np.random.uniform(
                 low=0,
@@ -541,10 +664,14 @@ class XGBModel(PyCostModel):
         self,
         xs: List[np.ndarray],
         ys: np.ndarray,
+        booster: Optional["xgb.Booster"] = None,
     ) -> None:
         import xgboost as xgb  # type: ignore # pylint: disable=import-outside-toplevel
 
         self.d_train = PackSum(xs=xs, ys=ys)
+        if booster is not None:
+            # forget the early stopping state of the previous training
+            booster.set_attr(best_score=None, best_iteration=None, best_msg=None)
 
         def obj(ys_pred: np.ndarray, d_train: "xgb.DMatrix"):  # type: ignore # pylint: disable = unused-argument
             return self.d_train.obj_square_error(ys_pred)
@@ -559,6 +686,7 @@ class XGBModel(PyCostModel):
             self.config.to_dict(),
             self.d_train.dmatrix,
             num_boost_round=10000,
+            xgb_model=booster,
             obj=obj,
             callbacks=[
                 custom_callback(
@@ -622,6 +750,14 @@ class XGBModel(PyCostModel):
         return eval_result
 
 
+def _mean_cost(run_secs: Optional[List[float]]) -> float:
+    """The cost of a measurement, or a huge cost if it failed. Censored results, rejected
+    early by the runner, carry the time of their probe run."""
+    if not run_secs:
+        return 1e10
+    return float(np.median([float(s) for s in run_secs]))
+
+
 def custom_callback(
     early_stopping_rounds: int,
     verbose_eval: int,
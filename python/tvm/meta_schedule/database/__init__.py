@@ -20,3 +20,4 @@ The database that stores serialized tuning records and workloads
 """
 from .database import Database, PyDatabase, TuningRecord, Workload
 from .json_database import JSONDatabase
+from .sqlite_database import SQLiteDatabase
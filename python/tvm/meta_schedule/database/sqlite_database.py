@@ -0,0 +1,190 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A database that stores tuning records in a local SQLite file"""
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from tvm.ir import IRModule, structural_equal
+
+from ..utils import derived_object, shash2hex
+from .database import PyDatabase, TuningRecord, Workload
+
+# Keep consistent with `SortTuningRecordByMeanRunSecs::kMaxMeanTime` on the C++ side
+_MAX_MEAN_TIME = 1e10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workloads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shash TEXT NOT NULL,
+    workload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workloads_shash ON workloads (shash);
+CREATE TABLE IF NOT EXISTS tuning_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workload_id INTEGER NOT NULL REFERENCES workloads (id),
+    mean_run_secs REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tuning_records_top_k
+    ON tuning_records (workload_id, mean_run_secs);
+"""
+
+
+@derived_object
+class SQLiteDatabase(PyDatabase):
+    """A database backed by a local SQLite file.
+
+    Workloads are indexed by their structural hash and tuning records by (workload, mean run
+    time), so `get_top_k` is answered by an indexed query instead of sorting all the records
+    in memory. Only the workloads are cached in memory. The file is opened in WAL mode, which
+    allows several tuning processes on the same host to commit to one database concurrently.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file. It is created if it does not exist.
+    timeout : float
+        The number of seconds to wait for the lock held by another writer.
+    """
+
+    path: str
+    timeout: float
+
+    def __init__(self, path: str, timeout: float = 60.0) -> None:
+        super().__init__()
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        # shash => [(workload id, workload)]
+        self._workloads: Dict[str, List[Tuple[int, Workload]]] = {}
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,  # transactions are managed explicitly
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _lookup_workload(self, mod: IRModule, shash: str) -> Optional[Tuple[int, Workload]]:
+        """Find the workload structurally equal to `mod`, first in memory then on disk."""
+        for workload_id, workload in self._workloads.get(shash, []):
+            if structural_equal(workload.mod, mod):
+                return workload_id, workload
+        known = {workload_id for workload_id, _ in self._workloads.get(shash, [])}
+        rows = self._conn.execute(
+            "SELECT id, workload FROM workloads WHERE shash = ? ORDER BY id", (shash,)
+        ).fetchall()
+        for workload_id, json_str in rows:
+            if workload_id in known:
+                continue
+            workload = Workload.from_json(json.loads(json_str))
+            self._workloads.setdefault(shash, []).append((workload_id, workload))
+            if structural_equal(workload.mod, mod):
+                return workload_id, workload
+        return None
+
+    def has_workload(self, mod: IRModule) -> bool:
+        with self._lock:
+            return self._lookup_workload(mod, shash2hex(mod)) is not None
+
+    def commit_workload(self, mod: IRModule) -> Workload:
+        shash = shash2hex(mod)
+        with self._lock:
+            ret = self._lookup_workload(mod, shash)
+            if ret is not None:
+                return ret[1]
+            # Take the write lock before checking again, so that two processes committing
+            # the same workload do not both insert it.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                ret = self._lookup_workload(mod, shash)
+                if ret is None:
+                    workload = Workload(mod)
+                    cursor = self._conn.execute(
+                        "INSERT INTO workloads (shash, workload) VALUES (?, ?)",
+                        (shash, json.dumps(workload.as_json())),
+                    )
+                    ret = (cursor.lastrowid, workload)
+                    self._workloads.setdefault(shash, []).append(ret)
+                self._conn.execute("COMMIT")
+            except:  # pylint: disable=bare-except
+                self._conn.execute("ROLLBACK")
+                raise
+            return ret[1]
+
+    def commit_tuning_record(self, record: TuningRecord) -> None:
+        json_obj = record.as_json()
+        run_secs = json_obj[1]
+        mean_run_secs = sum(run_secs) / len(run_secs) if run_secs else _MAX_MEAN_TIME
+        mod = record.workload.mod
+        with self._lock:
+            ret = self._lookup_workload(mod, shash2hex(mod))
+            if ret is None:
+                raise ValueError("The workload of the tuning record is not committed")
+            self._conn.execute(
+                "INSERT INTO tuning_records (workload_id, mean_run_secs, record) VALUES (?, ?, ?)",
+                (ret[0], mean_run_secs, json.dumps(json_obj)),
+            )
+
+    def get_top_k(self, workload: Workload, top_k: int) -> List[TuningRecord]:
+        top_k = int(top_k)
+        if top_k < 0:
+            raise ValueError("top_k must be non-negative")
+        if top_k == 0:
+            return []
+        with self._lock:
+            ret = self._lookup_workload(workload.mod, shash2hex(workload.mod))
+            if ret is None:
+                return []
+            workload_id, workload = ret
+            rows = self._conn.execute(
+                "SELECT record FROM tuning_records WHERE workload_id = ? "
+                "ORDER BY mean_run_secs, id LIMIT ?",
+                (workload_id, top_k),
+            ).fetchall()
+        return [TuningRecord.from_json(json.loads(json_str), workload) for (json_str,) in rows]
+
+    def get_all_tuning_records(self) -> List[TuningRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT workloads.shash, workloads.id, tuning_records.record "
+                "FROM tuning_records JOIN workloads ON tuning_records.workload_id = workloads.id "
+                "ORDER BY tuning_records.id"
+            ).fetchall()
+            workloads: Dict[int, Workload] = {}
+            for shash, workload_id, _ in rows:
+                if workload_id not in workloads:
+                    for known_id, workload in self._workloads.get(shash, []):
+                        workloads[known_id] = workload
+                if workload_id not in workloads:
+                    (json_str,) = self._conn.execute(
+                        "SELECT workload FROM workloads WHERE id = ?", (workload_id,)
+                    ).fetchone()
+                    workload = Workload.from_json(json.loads(json_str))
+                    self._workloads.setdefault(shash, []).append((workload_id, workload))
+                    workloads[workload_id] = workload
+        return [
+            TuningRecord.from_json(json.loads(json_str), workloads[workload_id])
+            for _, workload_id, json_str in rows
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tuning_records").fetchone()[0]
@@ -21,4 +21,5 @@ from .measure_callback import MeasureCallback, PyMeasureCallback
 from .add_to_database import AddToDatabase
 from .echo_statistics import EchoStatistics
 from .remove_build_artifact import RemoveBuildArtifact
+from .save_checkpoint import SaveCheckpoint, load_checkpoint
 from .update_cost_model import UpdateCostModel
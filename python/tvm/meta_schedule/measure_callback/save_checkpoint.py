@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A measure callback that periodically saves a checkpoint of the tuning session"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..builder import BuilderResult
+from ..runner import RunnerResult
+from ..search_strategy import MeasureCandidate
+from ..utils import derived_object, shash2hex
+from .measure_callback import PyMeasureCallback
+
+if TYPE_CHECKING:
+    from ..task_scheduler import TaskScheduler
+
+CHECKPOINT_STATE = "state.json"
+
+
+@derived_object
+class SaveCheckpoint(PyMeasureCallback):
+    """A measure callback that periodically saves a checkpoint of the tuning session.
+
+    The checkpoint directory holds `state.json`, the number of trials measured for each task,
+    and the saved cost model. Both are replaced atomically, so the checkpoint is consistent
+    whenever the process is killed. The tuning records themselves are kept by the database.
+
+    Parameters
+    ----------
+    checkpoint_dir : str
+        The directory to save the checkpoint in.
+    interval_sec : float
+        The minimum number of seconds between two checkpoints.
+    trials : Optional[List[int]]
+        The number of trials of each task measured before, e.g. restored from a checkpoint.
+    """
+
+    checkpoint_dir: str
+    interval_sec: float
+    trials: Dict[int, int]
+
+    def __init__(
+        self,
+        checkpoint_dir: str,
+        interval_sec: float = 600.0,
+        trials: Optional[List[int]] = None,
+    ) -> None:
+        super().__init__()
+        self.checkpoint_dir = checkpoint_dir
+        self.interval_sec = interval_sec
+        self.trials = dict(enumerate(trials)) if trials is not None else {}
+        self._last_save = time.time()
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def apply(
+        self,
+        task_scheduler: "TaskScheduler",
+        task_id: int,
+        measure_candidates: List[MeasureCandidate],
+        builder_results: List[BuilderResult],
+        runner_results: List[RunnerResult],
+    ) -> None:
+        self.trials[task_id] = self.trials.get(task_id, 0) + len(measure_candidates)
+        if time.time() - self._last_save >= self.interval_sec:
+            self.save(task_scheduler)
+
+    def save(self, task_scheduler: "TaskScheduler") -> None:
+        """Save a checkpoint of the task scheduler now.
+
+        Parameters
+        ----------
+        task_scheduler : TaskScheduler
+            The task scheduler being checkpointed.
+        """
+        state: Dict[str, Any] = {
+            "time": time.time(),
+            "num_trials": sum(self.trials.values()),
+            "tasks": [
+                {
+                    "task_name": str(task.task_name),
+                    "shash": shash2hex(task.mod),
+                    "trials": self.trials.get(task_id, 0),
+                }
+                for task_id, task in enumerate(task_scheduler.tasks)
+            ],
+            "cost_model": None,
+        }
+        tmp_dir = tempfile.mkdtemp(dir=self.checkpoint_dir)
+        try:
+            if task_scheduler.cost_model is not None:
+                # The cost model may add an extension to the path it is given, e.g. ".npy"
+                task_scheduler.cost_model.save(os.path.join(tmp_dir, "cost_model"))
+                (file_name,) = os.listdir(tmp_dir)
+                os.replace(
+                    os.path.join(tmp_dir, file_name), os.path.join(self.checkpoint_dir, file_name)
+                )
+                state["cost_model"] = file_name
+            with open(os.path.join(tmp_dir, CHECKPOINT_STATE), "w", encoding="utf-8") as out_file:
+                json.dump(state, out_file)
+            os.replace(
+                os.path.join(tmp_dir, CHECKPOINT_STATE),
+                os.path.join(self.checkpoint_dir, CHECKPOINT_STATE),
+            )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._last_save = time.time()
+
+
+def load_checkpoint(checkpoint_dir: str) -> Optional[Dict[str, Any]]:
+    """Load the state of a tuning session saved by SaveCheckpoint.
+
+    Parameters
+    ----------
+    checkpoint_dir : str
+        The directory the checkpoint is saved in.
+
+    Returns
+    -------
+    state : Optional[Dict[str, Any]]
+        The state of the session, or None if there is no checkpoint. The path of the saved
+        cost model, if any, is given by `state["cost_model"]`.
+    """
+    path = os.path.join(checkpoint_dir, CHECKPOINT_STATE)
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as in_file:
+        state = json.load(in_file)
+    if state["cost_model"] is not None:
+        state["cost_model"] = os.path.join(checkpoint_dir, state["cost_model"])
+    return state
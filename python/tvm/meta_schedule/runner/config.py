@@ -36,6 +36,19 @@ class EvaluatorConfig(NamedTuple):
         increase the number of runs to the given time (in ms) to reduce the measurement error.
     enable_cpu_cache_flush: bool
         Whether to flush the cache on CPU.
+    target_rel_error: Optional[float]
+        If set, the evaluation is adaptive: batches of `repeat` runs are taken until the
+        confidence interval of the mean latency is within this error relative to the mean.
+    max_time_ms: Optional[float]
+        The time budget of an adaptive evaluation in ms.
+    early_reject_ratio: Optional[float]
+        If set, each candidate is first timed by a single probe run, and is not timed further
+        if the probe is slower than this ratio times the fastest candidate measured so far with
+        the same device and arguments. The probe time of a rejected candidate is reported as a
+        censored result, whose error message starts with "Censored".
+    reject_above_secs: Optional[float]
+        The probe time in seconds above which the candidate is rejected, which is set by the
+        runners for each candidate from early_reject_ratio.
 
     Note
     ----
@@ -47,6 +60,10 @@ class EvaluatorConfig(NamedTuple):
     repeat: int = 1
     min_repeat_ms: int = 100
     enable_cpu_cache_flush: bool = False
+    target_rel_error: Optional[float] = None
+    max_time_ms: Optional[float] = None
+    early_reject_ratio: Optional[float] = None
+    reject_above_secs: Optional[float] = None
 
     @staticmethod
     def _normalized(config: Optional["EvaluatorConfig"]) -> "EvaluatorConfig":
@@ -57,6 +74,10 @@ class EvaluatorConfig(NamedTuple):
             repeat=config.repeat,
             min_repeat_ms=config.min_repeat_ms,
             enable_cpu_cache_flush=config.enable_cpu_cache_flush,
+            target_rel_error=config.target_rel_error,
+            max_time_ms=config.max_time_ms,
+            early_reject_ratio=config.early_reject_ratio,
+            reject_above_secs=config.reject_above_secs,
         )
         return config
 
@@ -29,6 +29,8 @@ from .runner import PyRunner, RunnerFuture, RunnerInput, RunnerResult, PyRunnerF
 from .utils import (
     T_ARGUMENT_LIST,
     T_ARG_INFO_JSON_OBJ_LIST,
+    EarlyRejection,
+    RunCensored,
     alloc_argument_common,
     run_evaluator_common,
 )
@@ -74,7 +76,7 @@ class LocalRunnerFuture(PyRunnerFuture):
     Note
     ----
     Only one of the parameters should be None upon the creation
-    of LocalRunnerFuture object
+    of LocalRunnerFuture object, except for a censored result, which has both
     """
 
     res: Optional[List[float]]
@@ -99,7 +101,9 @@ class LocalRunnerFuture(PyRunnerFuture):
 
         # sanity check upon the creation of LocalRunnerFuture object
         if (res is None and error_message is None) or (
-            res is not None and error_message is not None
+            res is not None
+            and error_message is not None
+            and not error_message.startswith("Censored")
         ):
             raise AttributeError(
                 "Only one of the two parameters should be None upon the creation"
@@ -275,25 +279,33 @@ class LocalRunner(PyRunner):
             timeout=timeout_sec,
             initializer=initializer,
         )
+        self._early_rejection = EarlyRejection(self.evaluator_config.early_reject_ratio)
         self._sanity_check()
 
     def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
         results: List[RunnerFuture] = []
         for runner_input in runner_inputs:
+            device_type = str(runner_input.device_type)
+            args_info = tuple(arg_info.as_json() for arg_info in runner_input.args_info)
+            key = EarlyRejection.key(device_type, args_info)
             future = self.pool.submit(
                 _worker_func,
                 self.f_alloc_argument,
                 self.f_run_evaluator,
                 self.f_cleanup,
-                self.evaluator_config,
+                self._early_rejection.config(self.evaluator_config, key),
                 self.alloc_repeat,
                 str(runner_input.artifact_path),
-                str(runner_input.device_type),
-                tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+                device_type,
+                args_info,
             )
             try:
                 result: List[float] = future.result()
                 error_message: str = None
+                self._early_rejection.update(key, result)
+            except RunCensored as censored:
+                result = censored.run_secs
+                error_message = str(censored)
             except TimeoutError:
                 result = None
                 error_message = f"LocalRunner: Timeout, killed after {self.timeout_sec} seconds\n"
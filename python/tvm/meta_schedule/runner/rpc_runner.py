@@ -17,9 +17,13 @@
 """RPC Runner"""
 import logging
 import concurrent.futures
+import functools
+import json
 import os.path as osp
+import tarfile
+import tempfile
 from contextlib import contextmanager
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from tvm.contrib.popen_pool import PopenPoolExecutor
 from tvm.rpc import RPCSession
@@ -35,6 +39,8 @@ from .runner import PyRunner, PyRunnerFuture, RunnerFuture, RunnerInput, RunnerR
 from .utils import (
     T_ARG_INFO_JSON_OBJ_LIST,
     T_ARGUMENT_LIST,
+    EarlyRejection,
+    RunCensored,
     alloc_argument_common,
     run_evaluator_common,
 )
@@ -117,6 +123,8 @@ class RPCRunnerFuture(PyRunnerFuture):
     def result(self) -> RunnerResult:
         try:
             run_secs: List[float] = self.future.result()
+        except RunCensored as censored:
+            return RunnerResult(censored.run_secs, error_msg=str(censored))
         except TimeoutError:
             return RunnerResult(
                 None,
@@ -156,6 +164,8 @@ class RPCRunner(PyRunner):
         The function name to cleanup the session or the function itself.
     pool: PopenPoolExecutor
         The popen pool executor.
+    batch_size: int
+        The maximum number of candidates measured in one RPC session.
 
     Attributes
     ----------
@@ -230,6 +240,7 @@ class RPCRunner(PyRunner):
     f_cleanup: Union[T_CLEANUP, str, None]
 
     pool: PopenPoolExecutor
+    batch_size: int
 
     def __init__(
         self,
@@ -244,6 +255,7 @@ class RPCRunner(PyRunner):
         f_cleanup: Union[T_CLEANUP, str, None] = None,
         max_workers: int = 1,
         initializer: Optional[Callable[[], None]] = None,
+        batch_size: int = 1,
     ) -> None:
         """Constructor
 
@@ -271,6 +283,12 @@ class RPCRunner(PyRunner):
             The maximum number of connections. Defaults to 1.
         initializer: Optional[Callable[[], None]]
             The initializer function.
+        batch_size: int = 1
+            The maximum number of candidates measured in one RPC session. If it is larger
+            than 1, the candidates of a device are measured in batches: all the artifacts of a
+            batch are uploaded in one archive, the arguments are allocated once for the
+            candidates with the same argument information, and the session timeout applies
+            to each candidate of the batch. Defaults to 1.
         """
         super().__init__()
         self.rpc_config = RPCConfig._normalized(rpc_config)
@@ -282,36 +300,100 @@ class RPCRunner(PyRunner):
         self.f_alloc_argument = f_alloc_argument
         self.f_run_evaluator = f_run_evaluator
         self.f_cleanup = f_cleanup
+        self.batch_size = batch_size
+        self._early_rejection = EarlyRejection(self.evaluator_config.early_reject_ratio)
         logger.info("RPCRunner: max_workers = %d", max_workers)
         self.pool = PopenPoolExecutor(
             max_workers=max_workers,
-            timeout=rpc_config.session_timeout_sec,
+            timeout=self.rpc_config.session_timeout_sec * batch_size,
             initializer=initializer,
         )
         self._sanity_check()
 
     def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+        if self.batch_size > 1:
+            return self._run_batched(runner_inputs)
         results: List[RunnerFuture] = []
         for runner_input in runner_inputs:
-            future = RPCRunnerFuture(
-                future=self.pool.submit(
-                    _worker_func,
+            device_type = str(runner_input.device_type)
+            args_info = tuple(arg_info.as_json() for arg_info in runner_input.args_info)
+            key = EarlyRejection.key(device_type, args_info)
+            future = self.pool.submit(
+                _worker_func,
+                self.f_create_session,
+                self.f_upload_module,
+                self.f_alloc_argument,
+                self.f_run_evaluator,
+                self.f_cleanup,
+                self.rpc_config,
+                self._early_rejection.config(self.evaluator_config, key),
+                self.alloc_repeat,
+                str(runner_input.artifact_path),
+                device_type,
+                args_info,
+            )
+            future.add_done_callback(functools.partial(self._update_incumbent, key))
+            results.append(
+                RPCRunnerFuture(  # type: ignore
+                    future=future,
+                    timeout_sec=self.rpc_config.session_timeout_sec,
+                )
+            )
+        return results
+
+    def _update_incumbent(self, key: str, future: concurrent.futures.Future) -> None:
+        if future.exception() is None:
+            self._early_rejection.update(key, future.result())
+
+    def _run_batched(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+        futures: List[concurrent.futures.Future] = [
+            concurrent.futures.Future() for _ in runner_inputs
+        ]
+        # device type => indices of the runner inputs
+        groups: Dict[str, List[int]] = {}
+        for i, runner_input in enumerate(runner_inputs):
+            groups.setdefault(str(runner_input.device_type), []).append(i)
+        keys = [
+            EarlyRejection.key(
+                str(runner_input.device_type),
+                tuple(arg_info.as_json() for arg_info in runner_input.args_info),
+            )
+            for runner_input in runner_inputs
+        ]
+        for i, future in enumerate(futures):
+            future.add_done_callback(functools.partial(self._update_incumbent, keys[i]))
+        for device_type, indices in groups.items():
+            for begin in range(0, len(indices), self.batch_size):
+                batch = indices[begin : begin + self.batch_size]
+                batch_future = self.pool.submit(
+                    _worker_func_batched,
                     self.f_create_session,
                     self.f_upload_module,
                     self.f_alloc_argument,
                     self.f_run_evaluator,
                     self.f_cleanup,
                     self.rpc_config,
-                    self.evaluator_config,
                     self.alloc_repeat,
-                    str(runner_input.artifact_path),
-                    str(runner_input.device_type),
-                    tuple(arg_info.as_json() for arg_info in runner_input.args_info),
-                ),
-                timeout_sec=self.rpc_config.session_timeout_sec,
+                    device_type,
+                    [
+                        (
+                            str(runner_inputs[i].artifact_path),
+                            tuple(arg_info.as_json() for arg_info in runner_inputs[i].args_info),
+                            self._early_rejection.config(self.evaluator_config, keys[i]),
+                        )
+                        for i in batch
+                    ],
+                )
+                batch_future.add_done_callback(
+                    functools.partial(_set_batch_results, [futures[i] for i in batch])
+                )
+        return [
+            RPCRunnerFuture(  # type: ignore
+                future=future,
+                timeout_sec=self.rpc_config.session_timeout_sec * self.batch_size,
             )
-            results.append(future)  # type: ignore
-        return results
+            for future in futures
+        ]
 
     def _sanity_check(self) -> None:
         def _check(
@@ -403,6 +485,121 @@ def _worker_func(
     return costs
 
 
+def _set_batch_results(
+    futures: List[concurrent.futures.Future],
+    batch_future: concurrent.futures.Future,
+) -> None:
+    """Distribute the results of a batch to the futures of its candidates."""
+    try:
+        results: List[Tuple[Optional[List[float]], Optional[str]]] = batch_future.result()
+    except Exception as exception:  # pylint: disable=broad-except
+        for future in futures:
+            future.set_exception(exception)
+        return
+    for future, (costs, error_msg) in zip(futures, results):
+        if error_msg is None:
+            future.set_result(costs)
+        elif costs is not None:
+            future.set_exception(RunCensored(costs))
+        else:
+            future.set_exception(RuntimeError(error_msg))
+
+
+def _upload_batch(session: RPCSession, local_paths: List[str], remote_paths: List[str]) -> None:
+    """Upload the artifacts of a batch in one archive, if the server can extract it."""
+    try:
+        f_untar = session.get_function("tvm.rpc.server.untar")
+    except AttributeError:
+        for local_path, remote_path in zip(local_paths, remote_paths):
+            session.upload(local_path, remote_path)
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = osp.join(tmp_dir, "batch.tar")
+        with tarfile.open(archive, "w") as tar_file:
+            for local_path, remote_path in zip(local_paths, remote_paths):
+                tar_file.add(local_path, arcname=remote_path)
+        session.upload(archive, "batch.tar")
+    f_untar("batch.tar")
+
+
+def _worker_func_batched(
+    _f_create_session: Union[T_CREATE_SESSION, str, None],
+    _f_upload_module: Union[T_UPLOAD_MODULE, str, None],
+    _f_alloc_argument: Union[T_ALLOC_ARGUMENT, str, None],
+    _f_run_evaluator: Union[T_RUN_EVALUATOR, str, None],
+    _f_cleanup: Union[T_CLEANUP, str, None],
+    rpc_config: RPCConfig,
+    alloc_repeat: int,
+    device_type: str,
+    inputs: List[Tuple[str, T_ARG_INFO_JSON_OBJ_LIST, EvaluatorConfig]],
+) -> List[Tuple[Optional[List[float]], Optional[str]]]:
+    # Step 0. Get the registered functions
+    f_create_session: T_CREATE_SESSION = get_global_func_with_default_on_worker(
+        _f_create_session, default_create_session
+    )
+    f_upload_module: T_UPLOAD_MODULE = get_global_func_with_default_on_worker(
+        _f_upload_module, default_upload_module
+    )
+    f_alloc_argument: T_ALLOC_ARGUMENT = get_global_func_with_default_on_worker(
+        _f_alloc_argument, default_alloc_argument
+    )
+    f_run_evaluator: T_RUN_EVALUATOR = get_global_func_with_default_on_worker(
+        _f_run_evaluator, default_run_evaluator
+    )
+    f_cleanup: T_CLEANUP = get_global_func_with_default_on_worker(_f_cleanup, default_cleanup)
+    # Managed resources
+    session: Optional[RPCSession] = None
+    remote_paths: List[str] = []
+
+    @contextmanager
+    def resource_handler():
+        try:
+            yield
+        finally:
+            # Final step. Always clean up
+            for remote_path in remote_paths or [None]:
+                f_cleanup(session, remote_path)
+
+    results: List[Tuple[Optional[List[float]], Optional[str]]] = []
+    with resource_handler():
+        # Step 1. Create one session for the batch
+        session = f_create_session(
+            rpc_config._replace(session_timeout_sec=rpc_config.session_timeout_sec * len(inputs))
+        )
+        device = session.device(dev_type=device_type, dev_id=0)
+        # Step 2. Upload all the modules before any of them is cleaned up
+        local_paths = [artifact_path for artifact_path, _, _ in inputs]
+        remote_paths = [f"{i}_{osp.basename(path)}" for i, path in enumerate(local_paths)]
+        if _f_upload_module is None:
+            _upload_batch(session, local_paths, remote_paths)
+        # argument info => input arguments
+        args_cache: Dict[str, List[T_ARGUMENT_LIST]] = {}
+        for (local_path, args_info, evaluator_config), remote_path in zip(inputs, remote_paths):
+            try:
+                if _f_upload_module is None:
+                    rt_mod: Module = session.load_module(remote_path)
+                else:
+                    rt_mod = f_upload_module(session, local_path, remote_path)
+                # Step 3: Allocate input arguments, once for the same argument info
+                key = json.dumps(args_info)
+                if key not in args_cache:
+                    args_cache[key] = f_alloc_argument(session, device, args_info, alloc_repeat)
+                # Step 4: Run time_evaluator
+                costs: List[float] = f_run_evaluator(
+                    session,
+                    rt_mod,
+                    device,
+                    evaluator_config,
+                    args_cache[key],
+                )
+                results.append((costs, None))
+            except RunCensored as censored:
+                results.append((censored.run_secs, str(censored)))
+            except Exception as exception:  # pylint: disable=broad-except
+                results.append((None, str(exception)))
+    return results
+
+
 def default_create_session(rpc_config: RPCConfig) -> RPCSession:
     """Default function to create the session
 
@@ -16,7 +16,8 @@
 # under the License.
 """Runner utility functions"""
 import itertools
-from typing import Any, Callable, Dict, List
+import json
+from typing import Any, Callable, Dict, List, Optional
 
 from ...runtime import Device, Module, ndarray
 from .config import EvaluatorConfig
@@ -27,6 +28,57 @@ T_ARGUMENT = Any  # pylint: disable=invalid-name
 T_ARGUMENT_LIST = List[T_ARGUMENT]  # pylint: disable=invalid-name
 
 
+class RunCensored(Exception):
+    """Raised by the evaluator when the probe run of a candidate is too slow to time it further.
+
+    Parameters
+    ----------
+    run_secs: List[float]
+        The time of the probe run in seconds.
+    """
+
+    def __init__(self, run_secs: List[float]) -> None:
+        super().__init__(run_secs)
+        self.run_secs = run_secs
+
+    def __str__(self) -> str:
+        return f"Censored: rejected after a probe run of {self.run_secs[0]:.6g} seconds"
+
+
+class EarlyRejection:
+    """The incumbents a runner compares the probe runs of the candidates to.
+
+    Parameters
+    ----------
+    ratio: Optional[float]
+        The `early_reject_ratio` of the evaluator config, or None to time every candidate.
+    """
+
+    def __init__(self, ratio: Optional[float]) -> None:
+        self.ratio = ratio
+        # (device type, argument info) => the fastest mean run time in seconds
+        self.best: Dict[str, float] = {}
+
+    @staticmethod
+    def key(device_type: str, args_info: T_ARG_INFO_JSON_OBJ_LIST) -> str:
+        """Get the key of the incumbent of a candidate."""
+        return json.dumps([device_type, args_info])
+
+    def config(self, evaluator_config: EvaluatorConfig, key: str) -> EvaluatorConfig:
+        """Get the evaluator config of a candidate, with its rejection threshold."""
+        best = self.best.get(key)
+        if self.ratio is None or best is None:
+            return evaluator_config
+        return evaluator_config._replace(reject_above_secs=best * self.ratio)
+
+    def update(self, key: str, run_secs: Optional[List[float]]) -> None:
+        """Update the incumbent with the run time of a candidate timed to completion."""
+        if self.ratio is None or not run_secs:
+            return
+        mean_secs = sum(run_secs) / len(run_secs)
+        self.best[key] = min(self.best.get(key, mean_secs), mean_secs)
+
+
 def alloc_argument_common(
     f_random_fill: Callable,
     device: Device,
@@ -100,16 +152,34 @@ def run_evaluator_common(
     -------
     costs: List[float]
         The evaluator results
+
+    Raises
+    ------
+    RunCensored
+        If `evaluator_config.reject_above_secs` is set and the probe run is slower.
     """
+    f_preproc = "cache_flush_cpu_non_first_arg" if evaluator_config.enable_cpu_cache_flush else ""
+    if evaluator_config.reject_above_secs is not None and repeated_args:
+        probe = rt_mod.time_evaluator(
+            func_name=rt_mod.entry_name,
+            dev=device,
+            number=1,
+            repeat=1,
+            f_preproc=f_preproc,
+        )
+        device.sync()
+        probe_secs = float(probe(*repeated_args[0]).results[0])
+        if probe_secs > evaluator_config.reject_above_secs:
+            raise RunCensored([probe_secs])
     evaluator = rt_mod.time_evaluator(
         func_name=rt_mod.entry_name,
         dev=device,
         number=evaluator_config.number,
         repeat=evaluator_config.repeat,
         min_repeat_ms=evaluator_config.min_repeat_ms,
-        f_preproc="cache_flush_cpu_non_first_arg"
-        if evaluator_config.enable_cpu_cache_flush
-        else "",
+        f_preproc=f_preproc,
+        target_rel_error=evaluator_config.target_rel_error,
+        max_time_ms=evaluator_config.max_time_ms,
     )
     repeated_costs: List[List[float]] = []
     for args in repeated_args:
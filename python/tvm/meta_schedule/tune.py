@@ -36,7 +36,7 @@ from .cost_model import CostModel, XGBModel
 from .database import Database, JSONDatabase, TuningRecord
 from .extracted_task import ExtractedTask
 from .feature_extractor import PerStoreFeature
-from .measure_callback import MeasureCallback
+from .measure_callback import MeasureCallback, SaveCheckpoint, load_checkpoint
 from .mutator import Mutator
 from .postproc import Postproc
 from .runner import LocalRunner, Runner
@@ -45,7 +45,7 @@ from .search_strategy import EvolutionarySearch, ReplayFunc, ReplayTrace
 from .space_generator import PostOrderApply, SpaceGenerator
 from .task_scheduler import GradientBased, RoundRobin
 from .tune_context import TuneContext
-from .utils import autotvm_silencer, batch_parameterize_config
+from .utils import autotvm_silencer, batch_parameterize_config, shash2hex
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -276,9 +276,14 @@ class Parse:
         return measure_callbacks
 
     @staticmethod
-    def _cost_model(cost_model: Optional[CostModel]) -> CostModel:
+    def _cost_model(cost_model: Union[None, str, CostModel]) -> CostModel:
         if cost_model is None:
             return XGBModel(extractor=PerStoreFeature())  # type: ignore
+        if isinstance(cost_model, str):
+            # fine-tune the saved model by boosting it on the new samples
+            model = XGBModel(extractor=PerStoreFeature(), incremental=True)  # type: ignore
+            model.load(cost_model)
+            return model
         if not isinstance(cost_model, CostModel):
             raise TypeError(f"Expected `cost_model` to be CostModel, but gets: {cost_model}")
         return cost_model
@@ -531,13 +536,15 @@ def tune_extracted_tasks(
     builder: Optional[Builder] = None,
     runner: Optional[Runner] = None,
     database: Optional[Database] = None,
-    cost_model: Optional[CostModel] = None,
+    cost_model: Union[None, str, CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
     num_threads: Optional[int] = None,
+    checkpoint_interval_sec: Optional[float] = None,
+    resume: bool = False,
 ) -> Database:
     """Tune extracted tasks with a given target.
 
@@ -555,8 +562,9 @@ def tune_extracted_tasks(
         The runner to use.
     database : Optional[Database]
         The database to use.
-    cost_model : Optional[CostModel]
-        The cost model to use.
+    cost_model : Union[None, str, CostModel]
+        The cost model to use, or the path of a saved XGBModel, e.g. a pre-trained one,
+        to be fine-tuned online.
     measure_callbacks : Optional[List[MeasureCallback]]
         The callbacks used during tuning.
     task_scheduler : Optional[TaskScheduler]
@@ -571,6 +579,11 @@ def tune_extracted_tasks(
         The probability distribution to use different mutators.
     num_threads : Optional[int]
         The number of threads to use.
+    checkpoint_interval_sec : Optional[float]
+        If given, save a checkpoint of the tuning session to `work_dir/checkpoint` at most
+        every this many seconds.
+    resume : bool
+        Whether to resume the tuning session from the checkpoint in `work_dir/checkpoint`.
 
     Returns
     -------
@@ -602,16 +615,34 @@ def tune_extracted_tasks(
     runner = Parse._runner(runner)
     cost_model = Parse._cost_model(cost_model)
     measure_callbacks = Parse._callbacks(measure_callbacks)
+    # restore the number of trials of each task and the cost model from the checkpoint
+    checkpoint_dir = osp.join(work_dir, "checkpoint")
+    trials = [0 for _ in extracted_tasks]
+    if resume:
+        state = load_checkpoint(checkpoint_dir)
+        if state is None:
+            logger.warning("No checkpoint found in %s, tuning from scratch", checkpoint_dir)
+        else:
+            trials = _restore_checkpoint(state, extracted_tasks, cost_model)
+            logger.info("Resumed from the checkpoint after %d trial(s)", sum(trials))
+    if checkpoint_interval_sec is not None:
+        checkpoint = SaveCheckpoint(checkpoint_dir, checkpoint_interval_sec, trials)
+        measure_callbacks.append(checkpoint)
+    # the remaining budget after the trials already done
+    max_trials_per_task = config.max_trials_per_task
+    if max_trials_per_task is None:
+        max_trials_per_task = config.max_trials_global
     # parse the tuning contexts
     tune_contexts = []
     for i, task in enumerate(extracted_tasks):
         assert len(task.dispatched) == 1, "Only size 1 dispatched task list is supported for now"
+        task_config = config._replace(max_trials_per_task=max(max_trials_per_task - trials[i], 0))
         tune_contexts.append(
             TuneContext(
                 mod=Parse._mod(task.dispatched[0]),
                 target=task.target,
                 space_generator=Parse._space_generator(space),
-                search_strategy=config.create_strategy(),
+                search_strategy=task_config.create_strategy(),
                 sch_rules=Parse._sch_rules(sch_rules, task.target),
                 postprocs=Parse._postproc(postprocs, task.target),
                 mutator_probs=Parse._mutator_probs(mutator_probs, task.target),
@@ -624,7 +655,9 @@ def tune_extracted_tasks(
         )
     # parse the task scheduler
     # pylint: enable=protected-access
-    task_scheduler = config.create_task_scheduler(
+    task_scheduler = config._replace(
+        max_trials_global=max(config.max_trials_global - sum(trials), 0)
+    ).create_task_scheduler(
         tasks=tune_contexts,
         task_weights=[float(t.weight) for t in extracted_tasks],
         builder=builder,
@@ -634,10 +667,29 @@ def tune_extracted_tasks(
         measure_callbacks=measure_callbacks,
     )
     task_scheduler.tune()
+    if checkpoint_interval_sec is not None:
+        checkpoint.save(task_scheduler)
     cost_model.save(osp.join(work_dir, "cost_model.xgb"))
     return database
 
 
+def _restore_checkpoint(
+    state: Dict[str, Any],
+    extracted_tasks: List[ExtractedTask],
+    cost_model: CostModel,
+) -> List[int]:
+    """Restore the cost model from the checkpoint, and return the number of trials done for
+    each task. Tasks are matched by their names and structural hashes."""
+    done = {(task["task_name"], task["shash"]): task["trials"] for task in state["tasks"]}
+    trials = []
+    for task in extracted_tasks:
+        mod = Parse._mod(task.dispatched[0])  # pylint: disable=protected-access
+        trials.append(done.get((task.task_name, shash2hex(mod)), 0))
+    if state["cost_model"] is not None:
+        cost_model.load(state["cost_model"])
+    return trials
+
+
 def tune_tir(
     mod: Union[IRModule, PrimFunc],
     target: Union[str, Target],
@@ -647,7 +699,7 @@ def tune_tir(
     builder: Optional[Builder] = None,
     runner: Optional[Runner] = None,
     database: Optional[Database] = None,
-    cost_model: Optional[CostModel] = None,
+    cost_model: Union[None, str, CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
@@ -655,6 +707,8 @@ def tune_tir(
     mutator_probs: Optional[FnMutatorProb] = None,
     task_name: str = "main",
     num_threads: Optional[int] = None,
+    checkpoint_interval_sec: Optional[float] = None,
+    resume: bool = False,
 ) -> Optional[Schedule]:
     """Tune a TIR IRModule with a given target.
 
@@ -674,10 +728,16 @@ def tune_tir(
         The runner to use.
     database : Optional[Database]
         The database to use.
-    cost_model : Optional[CostModel]
-        The cost model to use.
+    cost_model : Union[None, str, CostModel]
+        The cost model to use, or the path of a saved XGBModel, e.g. a pre-trained one,
+        to be fine-tuned online.
     measure_callbacks : Optional[List[MeasureCallback]]
         The callbacks used during tuning.
+    checkpoint_interval_sec : Optional[float]
+        If given, save a checkpoint of the tuning session to `work_dir/checkpoint` at most
+        every this many seconds.
+    resume : bool
+        Whether to resume the tuning session from the checkpoint in `work_dir/checkpoint`.
 
     Returns
     -------
@@ -719,6 +779,8 @@ def tune_tir(
         postprocs=postprocs,
         mutator_probs=mutator_probs,
         num_threads=num_threads,
+        checkpoint_interval_sec=checkpoint_interval_sec,
+        resume=resume,
     )
     bests: List[TuningRecord] = database.get_top_k(
         database.commit_workload(mod),
@@ -742,13 +804,15 @@ def tune_te(
     builder: Optional[Builder] = None,
     runner: Optional[Runner] = None,
     database: Optional[Database] = None,
-    cost_model: Optional[CostModel] = None,
+    cost_model: Union[None, str, CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
     num_threads: Optional[int] = None,
+    checkpoint_interval_sec: Optional[float] = None,
+    resume: bool = False,
 ) -> Optional[Schedule]:
     """Tune a TE compute DAG with a given target.
 
@@ -772,6 +836,11 @@ def tune_te(
         The database to use.
     measure_callbacks : Optional[List[MeasureCallback]]
         The callbacks used during tuning.
+    checkpoint_interval_sec : Optional[float]
+        If given, save a checkpoint of the tuning session to `work_dir/checkpoint` at most
+        every this many seconds.
+    resume : bool
+        Whether to resume the tuning session from the checkpoint in `work_dir/checkpoint`.
 
     Returns
     -------
@@ -794,6 +863,8 @@ def tune_te(
         postprocs=postprocs,
         mutator_probs=mutator_probs,
         num_threads=num_threads,
+        checkpoint_interval_sec=checkpoint_interval_sec,
+        resume=resume,
     )
 
 
@@ -807,13 +878,15 @@ def tune_relay(
     builder: Optional[Builder] = None,
     runner: Optional[Runner] = None,
     database: Optional[Database] = None,
-    cost_model: Optional[CostModel] = None,
+    cost_model: Union[None, str, CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
     num_threads: Optional[int] = None,
+    checkpoint_interval_sec: Optional[float] = None,
+    resume: bool = False,
 ) -> Module:
     """Tune a TIR IRModule with a given target.
 
@@ -837,8 +910,16 @@ def tune_relay(
         The runner to use.
     database : Optional[Database]
         The database to use.
+    cost_model : Union[None, str, CostModel]
+        The cost model to use, or the path of a saved XGBModel, e.g. a pre-trained one,
+        to be fine-tuned online.
     measure_callbacks : Optional[List[MeasureCallback]]
         The callbacks used during tuning.
+    checkpoint_interval_sec : Optional[float]
+        If given, save a checkpoint of the tuning session to `work_dir/checkpoint` at most
+        every this many seconds.
+    resume : bool
+        Whether to resume the tuning session from the checkpoint in `work_dir/checkpoint`.
 
     Returns
     -------
@@ -869,6 +950,8 @@ def tune_relay(
         postprocs=postprocs,
         mutator_probs=mutator_probs,
         num_threads=num_threads,
+        checkpoint_interval_sec=checkpoint_interval_sec,
+        resume=resume,
     )
     with target, autotvm_silencer(), ApplyHistoryBest(database):
         with PassContext(
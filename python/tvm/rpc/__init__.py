@@ -26,6 +26,7 @@ upload and run remote RPC server, get the result back to verify correctness.
 """
 
 from .server import Server
-from .client import connect, connect_tracker
-from .client import RPCSession, LocalSession, PopenSession, TrackerSession
+from .client import connect, connect_tracker, session_pool, aconnect, aconnect_tracker
+from .client import RPCSession, LocalSession, PopenSession, TrackerSession, SessionPool
+from .client import AsyncFunction, AsyncTrackerSession
 from .minrpc import with_minrpc
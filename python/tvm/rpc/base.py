@@ -17,6 +17,7 @@
 """Base definitions for RPC."""
 # pylint: disable=invalid-name
 
+import asyncio
 import socket
 import time
 import json
@@ -120,6 +121,58 @@ def recvjson(sock):
     return data
 
 
+async def arecvall(reader, nbytes):
+    """Receive all nbytes from an asyncio stream.
+
+    Parameters
+    ----------
+    reader: asyncio.StreamReader
+       The stream reader
+
+    nbytes : int
+       Number of bytes to be received.
+    """
+    try:
+        return await reader.readexactly(nbytes)
+    except asyncio.IncompleteReadError as err:
+        raise IOError("connection reset") from err
+
+
+async def asendjson(writer, data):
+    """send a python value to remote via json over an asyncio stream
+
+    Parameters
+    ----------
+    writer : asyncio.StreamWriter
+        The stream writer
+
+    data : object
+        Python value to be sent.
+    """
+    data = json.dumps(data)
+    writer.write(struct.pack("<i", len(data)))
+    writer.write(data.encode("utf-8"))
+    await writer.drain()
+
+
+async def arecvjson(reader):
+    """receive python value from remote via json over an asyncio stream
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        The stream reader
+
+    Returns
+    -------
+    value : object
+        The value received.
+    """
+    size = struct.unpack("<i", await arecvall(reader, 4))[0]
+    data = json.loads(py_str(await arecvall(reader, size)))
+    return data
+
+
 def random_key(prefix, cmap=None):
     """Generate a random key
 
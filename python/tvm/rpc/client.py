@@ -15,18 +15,75 @@
 # specific language governing permissions and limitations
 # under the License.
 """RPC client tools"""
+import asyncio
+import contextlib
+import functools
+import getpass
+import hashlib
+import json
 import os
 import socket
 import stat
 import struct
+import threading
 import time
 
+import numpy as np
+
 import tvm._ffi
 from tvm._ffi.base import TVMError
 from tvm.contrib import utils
 from tvm.runtime import ndarray as nd
 
-from . import _ffi_api, base, server
+from . import _ffi_api, base, compression, server
+
+# The default number of bytes sent per call by RPCSession.upload and download
+UPLOAD_CHUNK_SIZE = 1 << 22
+
+
+def _default_user():
+    """The user reported to the tracker: TVM_RPC_USER, or user@host."""
+    user = os.environ.get("TVM_RPC_USER")
+    if user:
+        return user
+    try:
+        name = getpass.getuser()
+    except (KeyError, OSError):
+        name = "unknown"
+    return "%s@%s" % (name, socket.gethostname())
+
+
+async def _run_blocking(executor, func, *args, **kwargs):
+    """Run a blocking call, e.g. a remote function call, in the executor, or the default
+    executor of the running event loop if it is None, so that the loop keeps serving other
+    coroutines meanwhile."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+class AsyncFunction(object):
+    """A remote function whose calls are awaitable.
+
+    The call is made in a thread of the executor, and the FFI releases the GIL while it
+    waits for the remote, so many calls on different sessions overlap. The calls on one
+    session are still served one at a time.
+
+    Parameters
+    ----------
+    func : PackedFunc
+        The remote function, e.g. returned by RPCSession.get_function or a remote module.
+
+    executor : Optional[concurrent.futures.Executor]
+        The executor the calls are made in. If None, use the default executor of the event
+        loop, see aconnect for its limit.
+    """
+
+    def __init__(self, func, executor=None):
+        self.func = func
+        self.executor = executor
+
+    async def __call__(self, *args):
+        return await _run_blocking(self.executor, self.func, *args)
 
 
 class RPCSession(object):
@@ -40,6 +97,11 @@ class RPCSession(object):
         self._sess = sess
         self._tbl_index = _ffi_api.SessTableIndex(sess)
         self._remote_funcs = {}
+        self._codec = None
+        self._compress_threshold = compression.COMPRESS_THRESHOLD
+        self._compression_stats = compression.CompressionStats()
+        # the executor of the blocking calls of the async methods, see aconnect
+        self.executor = None
 
     def system_lib(self):
         """Get system-wide library module.
@@ -90,9 +152,68 @@ class RPCSession(object):
         dev._rpc_sess = self
         return dev
 
-    def upload(self, data, target=None):
+    def _optional_function(self, name):
+        """Get a function of the python server environment, or None if the server does not
+        provide it, e.g. a C++ RPC server."""
+        if name not in self._remote_funcs:
+            try:
+                self._remote_funcs[name] = self.get_function("tvm.rpc.server." + name)
+            except AttributeError:
+                self._remote_funcs[name] = None
+        return self._remote_funcs[name]
+
+    def set_compression(
+        self, codecs=compression.DEFAULT_CODECS, threshold=compression.COMPRESS_THRESHOLD
+    ):
+        """Negotiate the compression of the files and arrays transferred by this session.
+
+        The payloads of upload, download, upload_array and download_array of at least
+        threshold bytes are compressed with the first codec of codecs that the server also
+        supports. Servers without the codecs, e.g. C++ RPC servers, get them uncompressed.
+
+        Parameters
+        ----------
+        codecs : List[str], optional
+            The codecs in the order of preference, see tvm.rpc.compression.
+            An empty list disables the compression.
+
+        threshold : int, optional
+            The minimum size in bytes of the payloads to compress.
+
+        Returns
+        -------
+        codec : Optional[str]
+            The negotiated codec, or None if the payloads are not compressed.
+        """
+        self._codec = None
+        self._compress_threshold = threshold
+        supported = self._optional_function("compression_codecs") if codecs else None
+        if supported is not None:
+            self._codec = compression.negotiate(codecs, supported().split(","))
+        return self._codec
+
+    def transfer_stats(self):
+        """Get the statistics of the compressed transfers of this session.
+
+        Returns
+        -------
+        stats : Dict[str, Any]
+            The negotiated codec, the number of messages, the raw and the transferred
+            bytes, their ratio, and the seconds spent compressing and decompressing
+            on the client side.
+        """
+        stats = self._compression_stats.as_dict()
+        stats["codec"] = self._codec
+        return stats
+
+    def upload(self, data, target=None, chunk_size=UPLOAD_CHUNK_SIZE, progress=None):
         """Upload file to remote runtime temp folder
 
+        The file is streamed in chunks, one call per chunk, so at most one chunk is buffered
+        on either side. The SHA-256 of the content is checked against the cache of the server
+        first, and content the server already has is not sent again.
+        Servers without these functions, e.g. C++ RPC servers, get the file in one call.
+
         Parameters
         ----------
         data : str or bytearray
@@ -100,21 +221,72 @@ class RPCSession(object):
 
         target : str, optional
             The path in remote
+
+        chunk_size : int, optional
+            The number of bytes sent per call.
+
+        progress : Callable[[int, int], None], optional
+            Called with the number of bytes uploaded and the total after every chunk.
         """
         if isinstance(data, bytearray):
             if not target:
                 raise ValueError("target must present when file is a bytearray")
-            blob = data
+            size = len(data)
+
+            def read_chunks():
+                for offset in range(0, size, chunk_size):
+                    yield data[offset : offset + chunk_size]
+
         else:
-            blob = bytearray(open(data, "rb").read())
             if not target:
                 target = os.path.basename(data)
-
-        if "upload" not in self._remote_funcs:
-            self._remote_funcs["upload"] = self.get_function("tvm.rpc.server.upload")
-        self._remote_funcs["upload"](target, blob)
-
-    def download(self, path):
+            size = os.path.getsize(data)
+
+            def read_chunks():
+                with open(data, "rb") as in_file:
+                    for chunk in iter(lambda: in_file.read(chunk_size), b""):
+                        yield bytearray(chunk)
+
+        upload_chunk = self._optional_function("upload_chunk")
+        if upload_chunk is None:
+            blob = data if isinstance(data, bytearray) else bytearray().join(read_chunks())
+            if "upload" not in self._remote_funcs:
+                self._remote_funcs["upload"] = self.get_function("tvm.rpc.server.upload")
+            self._remote_funcs["upload"](target, blob)
+            if progress:
+                progress(size, size)
+            return
+
+        digest = hashlib.sha256()
+        for chunk in read_chunks():
+            digest.update(chunk)
+        digest = digest.hexdigest()
+        if self._optional_function("cache_lookup")(digest, target):
+            if progress:
+                progress(size, size)
+            return
+
+        send_chunk = upload_chunk
+        if self._codec is not None:
+            upload_compressed = self._optional_function("upload_chunk_compressed")
+
+            def send_chunk(target, offset, chunk):
+                message = compression.compress(
+                    self._codec, chunk, self._compress_threshold, self._compression_stats
+                )
+                upload_compressed(target, offset, self._codec, message)
+
+        sent = 0
+        for chunk in read_chunks():
+            send_chunk(target, sent, chunk)
+            sent += len(chunk)
+            if progress:
+                progress(sent, size)
+        if sent == 0:
+            send_chunk(target, 0, bytearray())
+        self._optional_function("cache_store")(digest, target)
+
+    def download(self, path, chunk_size=UPLOAD_CHUNK_SIZE, progress=None):
         """Download file from remote temp folder.
 
         Parameters
@@ -122,14 +294,97 @@ class RPCSession(object):
         path : str
             The relative location to remote temp folder.
 
+        chunk_size : int, optional
+            The number of bytes received per call.
+
+        progress : Callable[[int, int], None], optional
+            Called with the number of bytes downloaded and the total after every chunk.
+
         Returns
         -------
         blob : bytearray
             The result blob from the file.
         """
-        if "download" not in self._remote_funcs:
-            self._remote_funcs["download"] = self.get_function("tvm.rpc.server.download")
-        return self._remote_funcs["download"](path)
+        download_chunk = self._optional_function("download_chunk")
+        if download_chunk is None:
+            if "download" not in self._remote_funcs:
+                self._remote_funcs["download"] = self.get_function("tvm.rpc.server.download")
+            blob = self._remote_funcs["download"](path)
+            if progress:
+                progress(len(blob), len(blob))
+            return blob
+
+        recv_chunk = download_chunk
+        if self._codec is not None:
+            download_compressed = self._optional_function("download_chunk_compressed")
+
+            def recv_chunk(path, offset, size):
+                message = download_compressed(
+                    path, offset, size, self._codec, self._compress_threshold
+                )
+                return compression.decompress(self._codec, message, self._compression_stats)
+
+        size = self._optional_function("file_size")(path)
+        blob = bytearray()
+        while len(blob) < size:
+            chunk = recv_chunk(path, len(blob), chunk_size)
+            if not chunk:
+                break
+            blob += chunk
+            if progress:
+                progress(len(blob), size)
+        return blob
+
+    def upload_array(self, arr, dev):
+        """Copy an array to a remote device, compressed if compression is negotiated.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            The array to copy.
+
+        dev : Device
+            The remote device, e.g. returned by RPCSession.device.
+
+        Returns
+        -------
+        ret : NDArray
+            The remote array.
+        """
+        if self._codec is None:
+            return nd.array(arr, dev)
+        message = compression.compress(
+            self._codec, arr.tobytes(), self._compress_threshold, self._compression_stats
+        )
+        return self._optional_function("ndarray_from_message")(
+            message,
+            self._codec,
+            json.dumps(list(arr.shape)),
+            str(arr.dtype),
+            dev.device_type % base.RPC_SESS_MASK,
+            dev.device_id,
+        )
+
+    def download_array(self, arr):
+        """Copy a remote array to a numpy array, compressed if compression is negotiated.
+
+        Parameters
+        ----------
+        arr : NDArray
+            The remote array.
+
+        Returns
+        -------
+        ret : numpy.ndarray
+            The content of the array.
+        """
+        if self._codec is None:
+            return arr.numpy()
+        message = self._optional_function("ndarray_to_message")(
+            arr, self._codec, self._compress_threshold
+        )
+        data = compression.decompress(self._codec, message, self._compression_stats)
+        return np.frombuffer(data, dtype=arr.dtype).reshape(arr.shape)
 
     def remove(self, path):
         """Remove file from remote temp folder.
@@ -195,6 +450,40 @@ class RPCSession(object):
             )
         return self._remote_funcs["download_linked_module"](path)
 
+    async def aget_function(self, name):
+        """Get an awaitable function from the session.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function
+
+        Returns
+        -------
+        f : AsyncFunction
+            The result function, whose calls are awaited.
+        """
+        func = await _run_blocking(self.executor, self.get_function, name)
+        return AsyncFunction(func, self.executor)
+
+    async def aupload(self, data, target=None, chunk_size=UPLOAD_CHUNK_SIZE, progress=None):
+        """Upload file to remote runtime temp folder without blocking the event loop.
+        See upload, the progress callback is called from an executor thread."""
+        await _run_blocking(self.executor, self.upload, data, target, chunk_size, progress)
+
+    async def adownload(self, path, chunk_size=UPLOAD_CHUNK_SIZE, progress=None):
+        """Download file from remote temp folder without blocking the event loop.
+        See download, the progress callback is called from an executor thread."""
+        return await _run_blocking(self.executor, self.download, path, chunk_size, progress)
+
+    async def aremove(self, path):
+        """Remove file from remote temp folder without blocking the event loop."""
+        await _run_blocking(self.executor, self.remove, path)
+
+    async def aload_module(self, path):
+        """Load a remote module without blocking the event loop. See load_module."""
+        return await _run_blocking(self.executor, self.load_module, path)
+
     def cpu(self, dev_id=0):
         """Construct CPU device."""
         return self.device(1, dev_id)
@@ -349,24 +638,48 @@ class TrackerSession(object):
             max_key_len = 0
 
         res += "Queue Status\n"
-        title = ("%%-%ds" % max_key_len + "   total  free  pending\n") % "key"
+        title = ("%%-%ds" % max_key_len + "   total  free  pending  mean-wait  max-wait\n") % "key"
         separate_line = "-" * len(title) + "\n"
         res += separate_line + title + separate_line
         for k in keys:
             total = total_ct.get(k, 0)
             free, pending = queue_info[k]["free"], queue_info[k]["pending"]
+            wait = queue_info[k].get("wait", {"mean": 0.0, "max": 0.0})
             if total or pending:
-                res += ("%%-%ds" % max_key_len + "   %-5d  %-4d  %-7d\n") % (
+                res += ("%%-%ds" % max_key_len + "   %-5d  %-4d  %-7d  %-9.2f  %-8.2f\n") % (
                     k,
                     total,
                     free,
                     pending,
+                    wait["mean"],
+                    wait["max"],
                 )
         res += separate_line
+
+        users = [(k, queue_info[k]["users"]) for k in keys if queue_info[k].get("users")]
+        if users:
+            res += "\nUser Shares\n"
+            res += "------------------------------------------\n"
+            res += "key / user                 pending  share\n"
+            res += "------------------------------------------\n"
+            for k, info in users:
+                for user in sorted(info):
+                    res += "%-25s  %-7d  %.1f\n" % (
+                        k + " / " + user,
+                        info[user]["pending"],
+                        info[user]["share"],
+                    )
+            res += "------------------------------------------\n"
         return res
 
     def request(
-        self, key, priority=1, session_timeout=0, max_retry=5, session_constructor_args=None
+        self,
+        key,
+        priority=1,
+        session_timeout=0,
+        max_retry=5,
+        session_constructor_args=None,
+        user=None,
     ):
         """Request a new connection from the tracker.
 
@@ -390,13 +703,19 @@ class TrackerSession(object):
             List of additional arguments to passed as the remote session constructor.
             The first element of the list is always a string specifying the name of
             the session constructor, the following args are the positional args to that function.
+
+        user : str, optional
+            The user the devices are shared between by a fair-share tracker. Defaults to the
+            environment variable TVM_RPC_USER, or user@host.
         """
+        if user is None:
+            user = _default_user()
         last_err = None
         for _ in range(max_retry):
             try:
                 if self._sock is None:
                     self._connect()
-                base.sendjson(self._sock, [base.TrackerCode.REQUEST, key, "", priority])
+                base.sendjson(self._sock, [base.TrackerCode.REQUEST, key, user, priority])
                 value = base.recvjson(self._sock)
                 if value[0] != base.TrackerCode.SUCCESS:
                     raise RuntimeError("Invalid return value %s" % str(value))
@@ -459,6 +778,366 @@ class TrackerSession(object):
         )
 
 
+class AsyncTrackerSession(object):
+    """Tracker client session for asyncio, see aconnect_tracker.
+
+    The tracker protocol is spoken over asyncio streams, so a coroutine waiting for a device
+    does not hold a thread. Every request in flight gets its own tracker connection, and
+    the connections are kept open for later requests, so that requests can be awaited
+    concurrently, e.g. with asyncio.gather.
+
+    Parameters
+    ----------
+    addr : tuple
+        The address tuple
+
+    executor : Optional[concurrent.futures.Executor]
+        The executor of the blocking calls of the requested sessions, see aconnect.
+    """
+
+    def __init__(self, addr, executor=None):
+        self._addr = addr
+        self._conns = []
+        self.executor = executor
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(*self._addr)
+        writer.write(struct.pack("<i", base.RPC_TRACKER_MAGIC))
+        await writer.drain()
+        magic = struct.unpack("<i", await base.arecvall(reader, 4))[0]
+        if magic != base.RPC_TRACKER_MAGIC:
+            writer.close()
+            raise RuntimeError("%s is not RPC Tracker" % str(self._addr))
+        return reader, writer
+
+    async def _call(self, data):
+        """Send a message to the tracker and receive its reply on an idle connection."""
+        reader, writer = self._conns.pop() if self._conns else await self._connect()
+        try:
+            await base.asendjson(writer, data)
+            value = await base.arecvjson(reader)
+        except:  # pylint: disable=bare-except
+            # e.g. cancelled while waiting, the reply can not be matched any more
+            writer.close()
+            raise
+        self._conns.append((reader, writer))
+        return value
+
+    async def close(self):
+        """Close the tracker connections."""
+        conns, self._conns = self._conns, []
+        for _, writer in conns:
+            writer.close()
+            await writer.wait_closed()
+
+    async def summary(self):
+        """Get the summary dict of the tracker."""
+        value = await self._call([base.TrackerCode.SUMMARY])
+        if value[0] != base.TrackerCode.SUCCESS:
+            raise RuntimeError("Invalid return value %s" % str(value))
+        return value[1]
+
+    async def request(
+        self,
+        key,
+        priority=1,
+        session_timeout=0,
+        max_retry=5,
+        session_constructor_args=None,
+        user=None,
+    ):
+        """Request a new connection from the tracker. See TrackerSession.request.
+
+        Parameters
+        ----------
+        key : str
+            The type key of the device.
+
+        priority : int, optional
+            The priority of the request.
+
+        session_timeout : float, optional
+            The duration of the session, allows server to kill
+            the connection when duration is longer than this value.
+            When duration is zero, it means the request must always be kept alive.
+
+        max_retry : int, optional
+            Maximum number of times to retry before give up.
+
+        session_constructor_args : list, optional
+            List of additional arguments to passed as the remote session constructor.
+
+        user : str, optional
+            The user the devices are shared between by a fair-share tracker.
+
+        Returns
+        -------
+        sess : RPCSession
+            The connected session.
+        """
+        if user is None:
+            user = _default_user()
+        last_err = None
+        for _ in range(max_retry):
+            try:
+                value = await self._call([base.TrackerCode.REQUEST, key, user, priority])
+                if value[0] != base.TrackerCode.SUCCESS:
+                    raise RuntimeError("Invalid return value %s" % str(value))
+                url, port, matchkey = value[1]
+                return await aconnect(
+                    url,
+                    port,
+                    matchkey,
+                    session_timeout,
+                    session_constructor_args=session_constructor_args,
+                    executor=self.executor,
+                )
+            except (OSError, TVMError) as err:
+                last_err = err
+        raise RuntimeError(
+            "Cannot request %s after %d retry, last_error:%s" % (key, max_retry, str(last_err))
+        )
+
+
+class SessionPool(object):
+    """A client-side pool of warm RPC sessions requested from a tracker.
+
+    Sessions are leased per device key and returned to the pool after use, so that
+    back-to-back measurements reuse one server session instead of paying for a tracker
+    round trip and a new server session each. An idle session is health checked before
+    it is leased again, and it is closed, which frees its device in the tracker, after
+    idle_timeout seconds. The tracker connections are kept alive and reused as well.
+
+    Parameters
+    ----------
+    tracker_host : str
+        The host of the RPC tracker.
+
+    tracker_port : int
+        The port of the RPC tracker.
+
+    idle_timeout : float
+        The number of seconds an idle session is kept before it is closed.
+
+    max_lifetime : float
+        The duration of the pooled sessions in seconds, after which the server kills them.
+        A session is not leased again when less than the requested session_timeout is left.
+        When it is zero, the sessions are kept alive as long as they are healthy.
+
+    Note
+    ----
+    A pooled session is requested with a server-side timeout of max_lifetime instead of
+    the session_timeout given to lease, so a hanging run must be timed out by the caller.
+    An idle session keeps its device reserved, so other clients of the tracker may wait
+    for up to idle_timeout seconds.
+    """
+
+    def __init__(self, tracker_host, tracker_port, idle_timeout=30.0, max_lifetime=600.0):
+        self.tracker_host = tracker_host
+        self.tracker_port = int(tracker_port)
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reaper = None
+        self._trackers = []
+        # key => [(session, created time, last used time)]
+        self._idle = {}
+        # id(session) => created time of the leased sessions
+        self._leased = {}
+
+    def _prune(self, now):
+        """Drop the idle sessions that timed out. Must be called with the lock held."""
+        for key in list(self._idle):
+            self._idle[key] = [
+                entry
+                for entry in self._idle[key]
+                if now - entry[2] < self.idle_timeout
+                and not (self.max_lifetime and now - entry[1] >= self.max_lifetime)
+            ]
+            if not self._idle[key]:
+                del self._idle[key]
+
+    def _reap(self):
+        """Close the timed out idle sessions periodically, so their devices are freed."""
+        while True:
+            time.sleep(max(self.idle_timeout / 2, 0.1))
+            with self._lock:
+                if self._closed:
+                    return
+                self._prune(time.time())
+
+    def _pop_idle(self, key, session_timeout):
+        """Pop the most recently used idle session that lives long enough, if any."""
+        with self._lock:
+            now = time.time()
+            self._prune(now)
+            idle = self._idle.get(key, [])
+            while idle:
+                sess, created, _ = idle.pop()
+                remaining = created + self.max_lifetime - now
+                if self.max_lifetime and session_timeout and remaining < session_timeout:
+                    continue
+                return sess, created
+        return None
+
+    @staticmethod
+    def _is_alive(sess):
+        """Check that the session still answers."""
+        try:
+            return bool(sess.cpu(0).exist)
+        except (TVMError, RuntimeError, OSError):
+            return False
+
+    def _request(self, key, priority, session_timeout, session_constructor_args):
+        with self._lock:
+            tracker = self._trackers.pop() if self._trackers else None
+        if tracker is None:
+            tracker = TrackerSession((self.tracker_host, self.tracker_port))
+        sess = tracker.request(
+            key,
+            priority=priority,
+            session_timeout=session_timeout,
+            session_constructor_args=session_constructor_args,
+        )
+        with self._lock:
+            self._trackers.append(tracker)
+        return sess
+
+    def lease(self, key, priority=1, session_timeout=0, session_constructor_args=None):
+        """Lease a session of a device key, reusing an idle one if it is healthy.
+
+        Parameters
+        ----------
+        key : str
+            The type key of the device.
+
+        priority : int, optional
+            The priority of the request if a new session is requested.
+
+        session_timeout : float, optional
+            The duration the session is needed for.
+
+        session_constructor_args : list, optional
+            The remote session constructor, see TrackerSession.request.
+            Such sessions are not pooled.
+
+        Returns
+        -------
+        sess : RPCSession
+            The leased session, which should be given back by release.
+        """
+        if session_constructor_args:
+            return self._request(key, priority, session_timeout, session_constructor_args)
+        while True:
+            entry = self._pop_idle(key, session_timeout)
+            if entry is None:
+                break
+            sess, created = entry
+            if self._is_alive(sess):
+                with self._lock:
+                    self._leased[id(sess)] = created
+                return sess
+        created = time.time()
+        timeout = max(self.max_lifetime, session_timeout) if self.max_lifetime else 0
+        sess = self._request(key, priority, timeout, None)
+        with self._lock:
+            self._leased[id(sess)] = created
+        return sess
+
+    def release(self, key, sess, reuse=True):
+        """Give back a leased session.
+
+        Parameters
+        ----------
+        key : str
+            The type key of the device the session was leased for.
+
+        sess : RPCSession
+            The leased session.
+
+        reuse : bool, optional
+            Whether the session can be leased again. It should be False when the session
+            failed, and it is then closed.
+        """
+        with self._lock:
+            created = self._leased.pop(id(sess), None)
+            if not reuse or created is None or self._closed:
+                return
+            self._idle.setdefault(key, []).append((sess, created, time.time()))
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap, daemon=True)
+                self._reaper.start()
+
+    @contextlib.contextmanager
+    def session(self, key, priority=1, session_timeout=0):
+        """Lease a session for the duration of a with block.
+
+        The session is not reused if the block raises an exception.
+
+        Parameters
+        ----------
+        key : str
+            The type key of the device.
+
+        priority : int, optional
+            The priority of the request if a new session is requested.
+
+        session_timeout : float, optional
+            The duration the session is needed for.
+        """
+        sess = self.lease(key, priority=priority, session_timeout=session_timeout)
+        reuse = False
+        try:
+            yield sess
+            reuse = True
+        finally:
+            self.release(key, sess, reuse=reuse)
+
+    def num_idle(self, key=None):
+        """Get the number of idle sessions, of a device key or in total."""
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, []))
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close(self):
+        """Close the idle sessions and the tracker connections."""
+        with self._lock:
+            self._closed = True
+            self._idle.clear()
+            trackers, self._trackers = self._trackers, []
+        for tracker in trackers:
+            tracker.close()
+
+
+_SESSION_POOLS = {}
+_SESSION_POOLS_LOCK = threading.Lock()
+
+
+def session_pool(tracker_host, tracker_port):
+    """Get the session pool of a tracker shared within this process.
+
+    Parameters
+    ----------
+    tracker_host : str
+        The host of the RPC tracker.
+
+    tracker_port : int
+        The port of the RPC tracker.
+
+    Returns
+    -------
+    pool : SessionPool
+        The pool, created on first use.
+    """
+    addr = (tracker_host, int(tracker_port))
+    with _SESSION_POOLS_LOCK:
+        if addr not in _SESSION_POOLS:
+            _SESSION_POOLS[addr] = SessionPool(*addr)
+        return _SESSION_POOLS[addr]
+
+
 def connect(
     url, port, key="", session_timeout=0, session_constructor_args=None, enable_logging=False
 ):
@@ -542,3 +1221,98 @@ def connect_tracker(url, port):
         The connected tracker session.
     """
     return TrackerSession((url, port))
+
+
+async def aconnect(
+    url,
+    port,
+    key="",
+    session_timeout=0,
+    session_constructor_args=None,
+    enable_logging=False,
+    executor=None,
+):
+    """Connect to RPC Server without blocking the event loop. See connect.
+
+    The connection and the awaitable calls of the session, e.g. aupload and the calls of
+    the functions returned by aget_function, block a thread of the executor while they
+    wait for the remote. The default executor of the event loop has min(32, cpu count + 4)
+    threads, so with more calls in flight than that the extra ones wait for a free thread,
+    whatever the number of devices. Pass an executor with one thread per session that is
+    used at the same time to overlap them all.
+
+    Parameters
+    ----------
+    url : str
+        The url of the host
+
+    port : int
+        The port to connect to
+
+    key : str, optional
+        Additional key to match server
+
+    session_timeout : float, optional
+        The duration of the session in seconds.
+
+    session_constructor_args: List
+        List of additional arguments to passed as the remote session constructor.
+
+    enable_logging: boolean
+        flag to enable/disable logging. Logging is disabled by default.
+
+    executor : Optional[concurrent.futures.Executor]
+        The executor of the blocking calls of the session. If None, use the default
+        executor of the event loop.
+
+    Returns
+    -------
+    sess : RPCSession
+        The connected session.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        async def run(url, port, key):
+            sess = await rpc.aconnect(url, port, key)
+            await sess.aupload("add.so")
+            mod = await sess.aload_module("add.so")
+            await rpc.AsyncFunction(mod["add"])(a, b, c)
+    """
+    sess = await _run_blocking(
+        executor,
+        connect,
+        url,
+        port,
+        key,
+        session_timeout,
+        session_constructor_args=session_constructor_args,
+        enable_logging=enable_logging,
+    )
+    sess.executor = executor
+    return sess
+
+
+async def aconnect_tracker(url, port, executor=None):
+    """Connect to a RPC tracker from asyncio
+
+    Parameters
+    ----------
+    url : str
+        The url of the host
+
+    port : int
+        The port to connect to
+
+    executor : Optional[concurrent.futures.Executor]
+        The executor of the blocking calls of the requested sessions, see aconnect.
+
+    Returns
+    -------
+    sess : AsyncTrackerSession
+        The connected tracker session.
+    """
+    tracker = AsyncTrackerSession((url, port), executor)
+    tracker._conns.append(await tracker._connect())  # pylint: disable=protected-access
+    return tracker
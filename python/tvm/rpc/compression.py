@@ -0,0 +1,207 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Compression of the payloads transferred over RPC.
+
+The codecs are tried in the order of preference zstd, lz4 and zlib. zstd and lz4 are
+used when the python packages `zstandard` and `lz4` are installed, while zlib from the
+standard library is always available. The client and the server agree on the first
+codec of the client's preference that the server supports.
+
+A compressed message is a one byte header followed by the payload. The header is 1 if
+the payload is compressed, and 0 if it is sent as is, e.g. below the size threshold or
+when compression does not make it smaller.
+"""
+import time
+import zlib
+
+# Payloads smaller than this are sent uncompressed
+COMPRESS_THRESHOLD = 1 << 16
+
+# The default preference of the codecs
+DEFAULT_CODECS = ("zstd", "lz4", "zlib")
+
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+def _zstd():
+    # pylint: disable=import-outside-toplevel
+    import zstandard
+
+    return (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+def _lz4():
+    # pylint: disable=import-outside-toplevel
+    import lz4.frame
+
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+def _zlib():
+    return lambda data: zlib.compress(data, 1), zlib.decompress
+
+
+_CODEC_LOADERS = {"zstd": _zstd, "lz4": _lz4, "zlib": _zlib}
+_CODECS = {}
+
+
+def _get_codec(name):
+    """Get the (compress, decompress) functions of a codec, or None if it is unavailable."""
+    if name not in _CODECS:
+        try:
+            _CODECS[name] = _CODEC_LOADERS[name]()
+        except (ImportError, KeyError):
+            _CODECS[name] = None
+    return _CODECS[name]
+
+
+def available_codecs():
+    """Get the codecs available in this process.
+
+    Returns
+    -------
+    codecs : List[str]
+        The names of the codecs in the order of preference.
+    """
+    return [name for name in DEFAULT_CODECS if _get_codec(name) is not None]
+
+
+def negotiate(preferred, supported):
+    """Choose the codec used by both sides.
+
+    Parameters
+    ----------
+    preferred : List[str]
+        The codecs of the client in the order of preference.
+
+    supported : List[str]
+        The codecs the server supports.
+
+    Returns
+    -------
+    codec : Optional[str]
+        The first preferred codec that both sides support, or None.
+    """
+    for name in preferred:
+        if name in supported and _get_codec(name) is not None:
+            return name
+    return None
+
+
+class CompressionStats(object):
+    """Statistics of the payloads compressed and decompressed by one side of a session."""
+
+    def __init__(self):
+        self.messages = 0
+        self.compressed_messages = 0
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+        self.compress_sec = 0.0
+        self.decompress_sec = 0.0
+
+    def as_dict(self):
+        """Get the statistics as a dict, with the overall compression ratio."""
+        return {
+            "messages": self.messages,
+            "compressed_messages": self.compressed_messages,
+            "raw_bytes": self.raw_bytes,
+            "wire_bytes": self.wire_bytes,
+            "ratio": self.raw_bytes / self.wire_bytes if self.wire_bytes else 1.0,
+            "compress_sec": self.compress_sec,
+            "decompress_sec": self.decompress_sec,
+        }
+
+
+def compress(codec, data, threshold=COMPRESS_THRESHOLD, stats=None):
+    """Encode a payload as a message, compressed if it is at least threshold bytes.
+
+    Parameters
+    ----------
+    codec : Optional[str]
+        The codec, or None or "" to send the payload as is.
+
+    data : bytes or bytearray
+        The payload.
+
+    threshold : int
+        The minimum size of the payloads to compress.
+
+    stats : Optional[CompressionStats]
+        The statistics to update.
+
+    Returns
+    -------
+    message : bytearray
+        The encoded message.
+    """
+    tic = time.time()
+    out = None
+    if codec and len(data) >= threshold:
+        compressed = _get_codec(codec)[0](bytes(data))
+        if len(compressed) < len(data):
+            out = bytearray(_COMPRESSED) + compressed
+    if out is None:
+        out = bytearray(_RAW) + data
+    if stats is not None:
+        stats.messages += 1
+        stats.compressed_messages += out[:1] == _COMPRESSED
+        stats.raw_bytes += len(data)
+        stats.wire_bytes += len(out)
+        stats.compress_sec += time.time() - tic
+    return out
+
+
+def decompress(codec, message, stats=None):
+    """Decode a message encoded by compress.
+
+    Parameters
+    ----------
+    codec : Optional[str]
+        The codec the message was encoded with.
+
+    message : bytes or bytearray
+        The encoded message.
+
+    stats : Optional[CompressionStats]
+        The statistics to update.
+
+    Returns
+    -------
+    data : bytearray
+        The payload.
+    """
+    tic = time.time()
+    header, payload = bytes(message[:1]), memoryview(message)[1:]
+    if header == _COMPRESSED:
+        if not codec or _get_codec(codec) is None:
+            raise ValueError("Cannot decompress a message of codec %s" % codec)
+        data = bytearray(_get_codec(codec)[1](bytes(payload)))
+    elif header == _RAW:
+        data = bytearray(payload)
+    else:
+        raise ValueError("Invalid compressed message header %r" % header)
+    if stats is not None:
+        stats.messages += 1
+        stats.compressed_messages += header == _COMPRESSED
+        stats.raw_bytes += len(data)
+        stats.wire_bytes += len(message)
+        stats.decompress_sec += time.time() - tic
+    return data
@@ -26,6 +26,10 @@ Server is TCP based with the following protocol:
 """
 # pylint: disable=invalid-name
 import ctypes
+import hashlib
+import json
+import os
+import shutil
 import socket
 import select
 import struct
@@ -34,6 +38,9 @@ import threading
 import multiprocessing
 import time
 import errno
+
+import numpy as np
+
 import tvm._ffi
 
 from tvm._ffi.base import py_str
@@ -43,6 +50,7 @@ from tvm.contrib import utils
 from tvm.contrib.popen_pool import PopenWorker
 from . import _ffi_api
 from . import base
+from . import compression
 
 # pylint: disable=unused-import
 from . import testing
@@ -50,8 +58,42 @@ from .base import TrackerCode
 
 logger = logging.getLogger("RPCServer")
 
+# The maximum total size of the files kept in the upload cache
+UPLOAD_CACHE_MAX_BYTES = 1 << 30
+
+
+def _sha256(path):
+    """Get the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as in_file:
+        for chunk in iter(lambda: in_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _evict_upload_cache(cache_dir, max_bytes=UPLOAD_CACHE_MAX_BYTES):
+    """Remove the least recently used files of the upload cache beyond max_bytes."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".tmp"):
+            continue
+        try:
+            stat = os.stat(os.path.join(cache_dir, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+        total -= size
+
 
-def _server_env(load_library, work_path=None):
+def _server_env(load_library, work_path=None, cache_dir=None):
     """Server environment function return temp dir"""
     if work_path:
         temp = work_path
@@ -71,6 +113,94 @@ def _server_env(load_library, work_path=None):
         logger.info("load_module %s", path)
         return m
 
+    @tvm._ffi.register_func("tvm.rpc.server.upload_chunk", override=True)
+    def upload_chunk(file_name, offset, data):
+        """Write a chunk of an uploaded file, the chunk at offset 0 creates the file."""
+        path = temp.relpath(file_name)
+        if not offset and os.path.exists(path):
+            os.remove(path)
+        with open(path, "r+b" if offset else "wb") as out_file:
+            out_file.seek(offset)
+            out_file.write(data)
+
+    @tvm._ffi.register_func("tvm.rpc.server.download_chunk", override=True)
+    def download_chunk(file_name, offset, size):
+        """Read a chunk of at most size bytes of a file from the offset."""
+        with open(temp.relpath(file_name), "rb") as in_file:
+            in_file.seek(offset)
+            return bytearray(in_file.read(size))
+
+    @tvm._ffi.register_func("tvm.rpc.server.compression_codecs", override=True)
+    def compression_codecs():
+        return ",".join(compression.available_codecs())
+
+    @tvm._ffi.register_func("tvm.rpc.server.upload_chunk_compressed", override=True)
+    def upload_chunk_compressed(file_name, offset, codec, message):
+        upload_chunk(file_name, offset, compression.decompress(codec, message))
+
+    @tvm._ffi.register_func("tvm.rpc.server.download_chunk_compressed", override=True)
+    def download_chunk_compressed(file_name, offset, size, codec, threshold):
+        return compression.compress(codec, download_chunk(file_name, offset, size), threshold)
+
+    @tvm._ffi.register_func("tvm.rpc.server.ndarray_from_message", override=True)
+    def ndarray_from_message(message, codec, shape, dtype, dev_type, dev_id):
+        """Create an NDArray on the device from the content sent by RPCSession.upload_array."""
+        data = np.frombuffer(compression.decompress(codec, message), dtype=dtype)
+        return tvm.nd.array(data.reshape(json.loads(shape)), tvm.device(dev_type, dev_id))
+
+    @tvm._ffi.register_func("tvm.rpc.server.ndarray_to_message", override=True)
+    def ndarray_to_message(arr, codec, threshold):
+        """Get the content of an NDArray for RPCSession.download_array."""
+        return compression.compress(codec, arr.numpy().tobytes(), threshold)
+
+    @tvm._ffi.register_func("tvm.rpc.server.file_size", override=True)
+    def file_size(file_name):
+        return os.path.getsize(temp.relpath(file_name))
+
+    @tvm._ffi.register_func("tvm.rpc.server.cache_lookup", override=True)
+    def cache_lookup(digest, file_name):
+        """Copy the cached file of the SHA-256 digest to file_name if there is one."""
+        if cache_dir is None:
+            return False
+        cached = os.path.join(cache_dir, digest)
+        try:
+            shutil.copyfile(cached, temp.relpath(file_name))
+            os.utime(cached)
+        except OSError:
+            return False
+        logger.info("upload %s hit the cache", file_name)
+        return True
+
+    @tvm._ffi.register_func("tvm.rpc.server.cache_store", override=True)
+    def cache_store(digest, file_name):
+        """Keep an uploaded file in the cache under its SHA-256 digest."""
+        if cache_dir is None:
+            return
+        path = temp.relpath(file_name)
+        if _sha256(path) != digest:
+            logger.warning("digest mismatch of the upload %s, not cached", file_name)
+            return
+        cached = os.path.join(cache_dir, digest)
+        tmp_path = "%s.%d.tmp" % (cached, os.getpid())
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, cached)
+            _evict_upload_cache(cache_dir)
+        except OSError as err:
+            # the cache is best effort, the upload itself has succeeded
+            logger.warning("cannot cache the upload %s: %s", file_name, err)
+
+    @tvm._ffi.register_func("tvm.rpc.server.untar", override=True)
+    def untar(file_name):
+        """Extract an uploaded tar archive into the temp folder and remove it."""
+        # pylint: disable=import-outside-toplevel
+        from tvm.contrib import tar as _tar
+
+        path = temp.relpath(file_name)
+        _tar.untar(path, temp.temp_dir)
+        os.remove(path)
+        logger.info("untar %s", path)
+
     @tvm._ffi.register_func("tvm.rpc.server.download_linked_module", override=True)
     def download_linked_module(file_name):
         """Load module from remote side."""
@@ -109,10 +239,10 @@ def _server_env(load_library, work_path=None):
     return temp
 
 
-def _serve_loop(sock, addr, load_library, work_path=None):
+def _serve_loop(sock, addr, load_library, work_path=None, cache_dir=None):
     """Server loop"""
     sockfd = sock.fileno()
-    temp = _server_env(load_library, work_path)
+    temp = _server_env(load_library, work_path, cache_dir)
     _ffi_api.ServerLoop(sockfd)
     if not work_path:
         temp.remove()
@@ -128,7 +258,7 @@ def _parse_server_opt(opts):
     return ret
 
 
-def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
+def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr, cache_dir):
     """Listening loop of the server."""
 
     def _accept_conn(listen_sock, tracker_conn, ping_period=2):
@@ -231,7 +361,7 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
         work_path = utils.tempdir()
         logger.info("connection from %s", addr)
         server_proc = multiprocessing.Process(
-            target=_serve_loop, args=(conn, addr, load_library, work_path)
+            target=_serve_loop, args=(conn, addr, load_library, work_path, cache_dir)
         )
 
         server_proc.start()
@@ -254,7 +384,7 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
         work_path.remove()
 
 
-def _connect_proxy_loop(addr, key, load_library):
+def _connect_proxy_loop(addr, key, load_library, cache_dir):
     key = "server:" + key
     retry_count = 0
     max_retry = 5
@@ -278,7 +408,9 @@ def _connect_proxy_loop(addr, key, load_library):
             remote_key = py_str(base.recvall(sock, keylen))
             opts = _parse_server_opt(remote_key.split()[1:])
             logger.info("connected to %s", str(addr))
-            process = multiprocessing.Process(target=_serve_loop, args=(sock, addr, load_library))
+            process = multiprocessing.Process(
+                target=_serve_loop, args=(sock, addr, load_library, None, cache_dir)
+            )
             process.start()
             sock.close()
             process.join(opts.get("timeout", None))
@@ -310,6 +442,7 @@ class PopenRPCServerState(object):
         load_library=None,
         custom_addr=None,
         silent=False,
+        cache_dir=None,
     ):
 
         # start update
@@ -317,6 +450,12 @@ class PopenRPCServerState(object):
         self.port = port
         self.libs = []
         self.custom_addr = custom_addr
+        if cache_dir is None:
+            # keep the cache for the lifetime of the server
+            self.cache_temp = utils.tempdir()
+            cache_dir = self.cache_temp.temp_dir
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
 
         if silent:
             logger.setLevel(logging.ERROR)
@@ -340,12 +479,20 @@ class PopenRPCServerState(object):
             self.sock = sock
             self.thread = threading.Thread(
                 target=_listen_loop,
-                args=(self.sock, self.port, key, tracker_addr, load_library, self.custom_addr),
+                args=(
+                    self.sock,
+                    self.port,
+                    key,
+                    tracker_addr,
+                    load_library,
+                    self.custom_addr,
+                    cache_dir,
+                ),
             )
             self.thread.start()
         else:
             self.thread = threading.Thread(
-                target=_connect_proxy_loop, args=((host, port), key, load_library)
+                target=_connect_proxy_loop, args=((host, port), key, load_library, cache_dir)
             )
             self.thread.start()
 
@@ -362,6 +509,7 @@ def _popen_start_rpc_server(
     silent=False,
     no_fork=False,
     server_init_callback=None,
+    cache_dir=None,
 ):
     if no_fork:
         multiprocessing.set_start_method("spawn")
@@ -373,7 +521,16 @@ def _popen_start_rpc_server(
     # Popen worker to run on a separate process.
     # Create and start the server in a different thread
     state = PopenRPCServerState(
-        host, port, port_end, is_proxy, tracker_addr, key, load_library, custom_addr, silent
+        host,
+        port,
+        port_end,
+        is_proxy,
+        tracker_addr,
+        key,
+        load_library,
+        custom_addr,
+        silent,
+        cache_dir,
     )
     PopenRPCServerState.current = state
     # returns the port so that the main can get the port number.
@@ -425,6 +582,12 @@ class Server(object):
     server_init_callback: Callable, optional
         Additional initialization function when starting the server.
 
+    cache_dir: str, optional
+        The directory of the cache of uploaded files, shared by the sessions and
+        addressed by the SHA-256 of the content. A client uploading content that is
+        already cached only sends its hash. If None, a temporary directory is used for
+        the lifetime of the server.
+
     Note
     ----
     The RPC server only sees functions in the tvm namespace.
@@ -455,6 +618,7 @@ class Server(object):
         silent=False,
         no_fork=False,
         server_init_callback=None,
+        cache_dir=None,
     ):
         try:
             if _ffi_api.ServerLoop is None:
@@ -477,6 +641,7 @@ class Server(object):
                 silent,
                 no_fork,
                 server_init_callback,
+                cache_dir,
             ],
         )
         # receive the port
@@ -38,14 +38,18 @@ List of available APIs:
 - REQUEST: request a new resource from tracker
   - input: [TrackerCode.REQUEST, [key, user, priority]]
   - return: [TrackerCode.SUCCESS, [url, port, match-key]]
+  - note: the requests are ordered by the scheduler of the key, e.g. PriorityScheduler or
+    FairShareScheduler, which shares the devices between the users.
 """
 # pylint: disable=invalid-name
 
 import asyncio
+import collections
 import heapq
 import logging
 import socket
 import threading
+import time
 import errno
 import struct
 import json
@@ -112,6 +116,31 @@ class Scheduler(object):
         raise NotImplementedError()
 
 
+class _WaitStats(object):
+    """Statistics of the time requests wait in the queue, in seconds."""
+
+    def __init__(self, window=100):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = collections.deque(maxlen=window)
+
+    def add(self, wait):
+        self.count += 1
+        self.total += wait
+        self.max = max(self.max, wait)
+        self.recent.append(wait)
+
+    def summary(self):
+        recent = sorted(self.recent)
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "recent_median": recent[len(recent) // 2] if recent else 0.0,
+        }
+
+
 class PriorityScheduler(Scheduler):
     """Priority based scheduler, FIFO based on request order"""
 
@@ -119,16 +148,18 @@ class PriorityScheduler(Scheduler):
         self._key = key
         self._request_cnt = 0
         self._lock = threading.Lock()
-        self._values = []
+        self._values = collections.deque()
         self._requests = []
+        self._wait = _WaitStats()
 
     def _schedule(self):
         while self._requests and self._values:
-            value = self._values.pop(0)
+            value = self._values.popleft()
             item = heapq.heappop(self._requests)
             callback = item[-1]
             if callback(value[1:]):
                 value[0].pending_matchkeys.remove(value[-1])
+                self._wait.add(time.time() - item[2])
             else:
                 self._values.append(value)
 
@@ -138,7 +169,7 @@ class PriorityScheduler(Scheduler):
 
     def request(self, user, priority, callback):
         with self._lock:
-            heapq.heappush(self._requests, (-priority, self._request_cnt, callback))
+            heapq.heappush(self._requests, (-priority, self._request_cnt, time.time(), callback))
             self._request_cnt += 1
         self._schedule()
 
@@ -149,7 +180,235 @@ class PriorityScheduler(Scheduler):
 
     def summary(self):
         """Get summary information of the scheduler."""
-        return {"free": len(self._values), "pending": len(self._requests)}
+        return {
+            "free": len(self._values),
+            "pending": len(self._requests),
+            "wait": self._wait.summary(),
+        }
+
+
+class FairShareScheduler(Scheduler):
+    """Weighted fair-share scheduler that avoids unhealthy devices.
+
+    Requests of higher priority are served first. Among the users with pending requests
+    of the same priority, the one with the least device time used, divided by its weight,
+    is served first, and its requests are served in FIFO order. The device time is the time
+    from handing a device out until its server reports it free again. It decays with a
+    half-life, so past usage does not starve a user forever.
+
+    A device is excluded for a cooldown period when the server drops while the device is
+    in use several times, or when its median session time is an outlier among the devices
+    of the key. Excluded devices are still handed out if no healthy device is registered.
+
+    Parameters
+    ----------
+    key : str
+        The key of the devices.
+
+    weights : Optional[Dict[str, float]]
+        The share of each user. Users not listed have a weight of 1.
+
+    half_life : float
+        The half-life in seconds of the device time used by a user.
+
+    window : int
+        The number of recent sessions of a device its health is judged on.
+
+    max_failures : int
+        The number of drops in the window that exclude a device.
+
+    latency_factor : float
+        A device whose median session time is more than this factor times the median
+        of the other devices is excluded.
+
+    cooldown : float
+        The number of seconds a device stays excluded.
+    """
+
+    def __init__(
+        self,
+        key,
+        weights=None,
+        half_life=3600.0,
+        window=10,
+        max_failures=2,
+        latency_factor=3.0,
+        cooldown=300.0,
+    ):
+        self._key = key
+        self._weights = weights or {}
+        self._half_life = half_life
+        self._window = window
+        self._max_failures = max_failures
+        self._latency_factor = latency_factor
+        self._cooldown = cooldown
+        self._request_cnt = 0
+        self._lock = threading.Lock()
+        # free values in the order they are put
+        self._values = collections.OrderedDict()
+        # user -> heap of (-priority, request count, request time, callback)
+        self._requests = {}
+        # user -> (decayed device time, time of the last update)
+        self._usage = {}
+        # (server connection, addr, port) -> list of (user, start time) of devices in use
+        self._busy = {}
+        # (addr, port) -> recent session times, or None for a drop
+        self._history = {}
+        # (addr, port) -> end of the exclusion
+        self._excluded = {}
+        self._wait = _WaitStats()
+
+    @staticmethod
+    def _device(value):
+        return (value[1], value[2])
+
+    def _decayed_usage(self, user, now):
+        usage, last = self._usage.get(user, (0.0, now))
+        return usage * 0.5 ** ((now - last) / self._half_life)
+
+    def _charge(self, user, seconds, now):
+        self._usage[user] = (self._decayed_usage(user, now) + seconds, now)
+
+    def _share(self, user, now):
+        """The device time used by the user, including the devices in use, over its weight"""
+        used = self._decayed_usage(user, now)
+        for sessions in self._busy.values():
+            used += sum(now - start for busy_user, start in sessions if busy_user == user)
+        return used / self._weights.get(user, 1.0)
+
+    def _is_excluded(self, device, now):
+        until = self._excluded.get(device)
+        if until is None:
+            return False
+        if now < until:
+            return True
+        # give the device a fresh start after the cooldown
+        del self._excluded[device]
+        self._history.pop(device, None)
+        return False
+
+    def _record(self, device, session_time, now):
+        """Record a session of the device, None for a drop, and update its health."""
+        history = self._history.setdefault(device, collections.deque(maxlen=self._window))
+        history.append(session_time)
+        reason = None
+        if sum(1 for x in history if x is None) >= self._max_failures:
+            reason = "dropped %d times" % self._max_failures
+        else:
+            medians = {}
+            for dev, hist in self._history.items():
+                times = sorted(x for x in hist if x is not None)
+                if len(times) >= 3:
+                    medians[dev] = times[len(times) // 2]
+            others = sorted(t for dev, t in medians.items() if dev != device)
+            if device in medians and others:
+                baseline = others[len(others) // 2]
+                if medians[device] > self._latency_factor * baseline:
+                    reason = "median session time %.3g s vs %.3g s" % (medians[device], baseline)
+        if reason:
+            logger.warning("Exclude device %s:%s of %s: %s", *device, self._key, reason)
+            self._excluded[device] = now + self._cooldown
+
+    def _pick_value(self, now):
+        fallback = None
+        for value in self._values:
+            if not self._is_excluded(self._device(value), now):
+                return value
+            if fallback is None:
+                fallback = value
+        if fallback is None:
+            return None
+        # only hand out an excluded device when there is no healthy one at all
+        busy_devices = [(busy[1], busy[2]) for busy, sessions in self._busy.items() if sessions]
+        if any(not self._is_excluded(device, now) for device in busy_devices):
+            return None
+        return fallback
+
+    def _pick_user(self, now):
+        users = [user for user, heap in self._requests.items() if heap]
+        if not users:
+            return None
+        return min(
+            users,
+            key=lambda user: (
+                self._requests[user][0][0],
+                self._share(user, now),
+                self._requests[user][0][1],
+            ),
+        )
+
+    def _schedule(self):
+        while True:
+            now = time.time()
+            user = self._pick_user(now)
+            if user is None:
+                return
+            value = self._pick_value(now)
+            if value is None:
+                return
+            del self._values[value]
+            item = heapq.heappop(self._requests[user])
+            callback = item[-1]
+            if callback(value[1:]):
+                value[0].pending_matchkeys.remove(value[-1])
+                self._wait.add(now - item[2])
+                self._busy.setdefault(value[:3], []).append((user, now))
+            else:
+                self._values[value] = None
+                self._values.move_to_end(value, last=False)
+
+    def put(self, value):
+        now = time.time()
+        sessions = self._busy.get(value[:3])
+        if sessions:
+            # the server reports the device free again after a session
+            user, start = sessions.pop(0)
+            self._charge(user, now - start, now)
+            self._record(self._device(value), now - start, now)
+        self._values[value] = None
+        self._schedule()
+
+    def request(self, user, priority, callback):
+        with self._lock:
+            heapq.heappush(
+                self._requests.setdefault(user, []),
+                (-priority, self._request_cnt, time.time(), callback),
+            )
+            self._request_cnt += 1
+        self._schedule()
+
+    def remove(self, value):
+        now = time.time()
+        sessions = self._busy.pop(value[:3], None)
+        if sessions:
+            # the server dropped while its device was in use
+            for user, start in sessions:
+                self._charge(user, now - start, now)
+                self._record(self._device(value), None, now)
+        if value in self._values:
+            del self._values[value]
+        self._schedule()
+
+    def summary(self):
+        """Get summary information of the scheduler."""
+        now = time.time()
+        users = {}
+        for user in set(self._requests) | set(self._usage):
+            users[user] = {
+                "pending": len(self._requests.get(user, [])),
+                "share": self._share(user, now),
+            }
+        return {
+            "free": len(self._values),
+            "pending": sum(len(heap) for heap in self._requests.values()),
+            "wait": self._wait.summary(),
+            "users": users,
+            "excluded": [
+                "%s:%s" % device
+                for device in list(self._excluded)
+                if self._is_excluded(device, now)
+            ],
+        }
 
 
 class TCPEventHandler(tornado_util.TCPHandler):
@@ -296,8 +555,9 @@ class TCPEventHandler(tornado_util.TCPHandler):
 class TrackerServerHandler(object):
     """Tracker that tracks the resources."""
 
-    def __init__(self, sock, stop_key):
+    def __init__(self, sock, stop_key, scheduler=None):
         self._scheduler_map = {}
+        self._scheduler = scheduler
         self._sock = sock
         self._sock.setblocking(0)
         self._ioloop = ioloop.IOLoop.current()
@@ -320,6 +580,8 @@ class TrackerServerHandler(object):
 
     def create_scheduler(self, key):
         """Create a new scheduler."""
+        if self._scheduler is not None:
+            return self._scheduler(key)
         return PriorityScheduler(key)
 
     def put(self, key, value):
@@ -367,9 +629,9 @@ class TrackerServerHandler(object):
         self._ioloop.start()
 
 
-def _tracker_server(listen_sock, stop_key):
+def _tracker_server(listen_sock, stop_key, scheduler):
     asyncio.set_event_loop(asyncio.new_event_loop())
-    handler = TrackerServerHandler(listen_sock, stop_key)
+    handler = TrackerServerHandler(listen_sock, stop_key, scheduler)
     handler.run()
 
 
@@ -378,7 +640,7 @@ class PopenTrackerServerState(object):
 
     current = None
 
-    def __init__(self, host, port=9190, port_end=9199, silent=False):
+    def __init__(self, host, port=9190, port_end=9199, silent=False, scheduler=None):
         if silent:
             logger.setLevel(logging.WARN)
 
@@ -398,16 +660,18 @@ class PopenTrackerServerState(object):
             raise ValueError("cannot bind to any port in [%d, %d)" % (port, port_end))
         logger.info("bind to %s:%d", host, self.port)
         sock.listen(1)
-        self.thread = threading.Thread(target=_tracker_server, args=(sock, self.stop_key))
+        self.thread = threading.Thread(
+            target=_tracker_server, args=(sock, self.stop_key, scheduler)
+        )
         self.thread.start()
         self.host = host
 
 
-def _popen_start_tracker_server(host, port=9190, port_end=9199, silent=False):
+def _popen_start_tracker_server(host, port=9190, port_end=9199, silent=False, scheduler=None):
     # This is a function that will be sent to the
     # Popen worker to run on a separate process.
     # Create and start the server in a different thread
-    state = PopenTrackerServerState(host, port, port_end, silent)
+    state = PopenTrackerServerState(host, port, port_end, silent, scheduler)
     PopenTrackerServerState.current = state
     # returns the port so that the main can get the port number.
     return (state.port, state.stop_key)
@@ -431,9 +695,13 @@ class Tracker(object):
 
     silent: bool, optional
         Whether run in silent mode
+
+    scheduler: Callable[[str], Scheduler], optional
+        The factory of the scheduler of each key, e.g. FairShareScheduler or a
+        functools.partial of it with weights. Defaults to PriorityScheduler.
     """
 
-    def __init__(self, host="0.0.0.0", port=9190, port_end=9199, silent=False):
+    def __init__(self, host="0.0.0.0", port=9190, port_end=9199, silent=False, scheduler=None):
         if silent:
             logger.setLevel(logging.WARN)
         self.proc = PopenWorker()
@@ -445,6 +713,7 @@ class Tracker(object):
                 port,
                 port_end,
                 silent,
+                scheduler,
             ],
         )
         # receive the port
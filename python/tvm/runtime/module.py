@@ -19,8 +19,10 @@
 """Runtime Module namespace."""
 import os
 import ctypes
+import math
 import struct
-from typing import Sequence
+import time
+from typing import Optional, Sequence
 import numpy as np
 
 import tvm._ffi
@@ -31,10 +33,70 @@ from .packed_func import PackedFunc, PackedFuncHandle, _set_class_module
 from . import _ffi_api
 
 
+def _normal_ppf(prob: float) -> float:
+    """Quantile of the standard normal distribution, by the rational approximation of
+    P. J. Acklam, which has a relative error below 1.2e-9 on (0, 1)."""
+    a = (
+        -39.69683028665376,
+        220.9460984245205,
+        -275.9285104469687,
+        138.3577518672690,
+        -30.66479806614716,
+        2.506628277459239,
+    )
+    b = (
+        -54.47609879822406,
+        161.5858368580409,
+        -155.6989798598866,
+        66.80131188771972,
+        -13.28068155288572,
+    )
+    c = (
+        -7.784894002430293e-03,
+        -0.3223964580411365,
+        -2.400758277161838,
+        -2.549732539343734,
+        4.374664141464968,
+        2.938163982698783,
+    )
+    d = (7.784695709041462e-03, 0.3224671290700398, 2.445134137142996, 3.754408661907416)
+
+    def poly(coeffs, x):
+        res = 0.0
+        for coeff in coeffs:
+            res = res * x + coeff
+        return res
+
+    if 0.02425 <= prob <= 0.97575:
+        q = prob - 0.5
+        r = q * q
+        return poly(a, r) * q / (poly(b, r) * r + 1)
+    q = math.sqrt(-2 * math.log(min(prob, 1 - prob)))
+    z = poly(c, q) / (poly(d, q) * q + 1)
+    return z if prob < 0.5 else -z
+
+
+def _student_t_ppf(prob: float, dof: int) -> float:
+    """Quantile of the Student's t distribution, by the Cornish-Fisher expansion around the
+    normal quantile, which is within a few percent of the exact value for dof >= 3."""
+    z = _normal_ppf(prob)
+    return (
+        z
+        + (z**3 + z) / (4 * dof)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3)
+    )
+
+
 class BenchmarkResult:
     """Runtimes from benchmarking"""
 
-    def __init__(self, results: Sequence[float]):
+    def __init__(
+        self,
+        results: Sequence[float],
+        confidence: float = 0.95,
+        converged: Optional[bool] = None,
+    ):
         """Construct a new BenchmarkResult from a sequence of runtimes.
 
         Parameters
@@ -42,6 +104,13 @@ class BenchmarkResult:
         results : Sequence[float]
             Raw times from benchmarking
 
+        confidence : float
+            The confidence level of the confidence interval of the mean.
+
+        converged : Optional[bool]
+            Whether an adaptive evaluation reached its target relative error, or None if
+            the evaluation was not adaptive.
+
         Attributes
         ----------
         min : float
@@ -65,6 +134,18 @@ class BenchmarkResult:
         results : Sequence[float]
             The collected runtimes (in seconds). This may be a series of mean runtimes if
             py:meth:`Module.time_evaluator` or `benchmark` was run with `number` > 1.
+        num_samples : int
+            The number of results.
+        ci_half_width : float
+            The half width in seconds of the confidence interval of the mean, from the
+            Student's t distribution. It is infinite for less than 2 results.
+        rel_error : float
+            The half width of the confidence interval relative to the mean.
+        confidence : float
+            The confidence level of the confidence interval.
+        converged : Optional[bool]
+            Whether an adaptive evaluation reached its target relative error before its time
+            budget or sample limit ran out, or None if the evaluation was not adaptive.
         """
         self.results = results
         self.mean = np.mean(self.results)
@@ -72,6 +153,18 @@ class BenchmarkResult:
         self.median = np.median(self.results)
         self.min = np.min(self.results)
         self.max = np.max(self.results)
+        self.num_samples = len(self.results)
+        self.confidence = confidence
+        self.converged = converged
+        if self.num_samples >= 2:
+            self.ci_half_width = (
+                _student_t_ppf((1 + confidence) / 2, self.num_samples - 1)
+                * np.std(self.results, ddof=1)
+                / np.sqrt(self.num_samples)
+            )
+        else:
+            self.ci_half_width = float("inf")
+        self.rel_error = self.ci_half_width / self.mean if self.mean > 0 else float("inf")
 
     def __repr__(self):
         return "BenchmarkResult(min={}, mean={}, median={}, max={}, std={}, results={})".format(
@@ -270,7 +363,19 @@ class Module(object):
         """
         _ffi_api.ModuleSaveToFile(self, file_name, fmt)
 
-    def time_evaluator(self, func_name, dev, number=10, repeat=1, min_repeat_ms=0, f_preproc=""):
+    def time_evaluator(
+        self,
+        func_name,
+        dev,
+        number=10,
+        repeat=1,
+        min_repeat_ms=0,
+        f_preproc="",
+        target_rel_error=None,
+        max_time_ms=None,
+        max_repeat=1000,
+        confidence=0.95,
+    ):
         """Get an evaluator that measures time cost of running function.
 
         Parameters
@@ -301,17 +406,31 @@ class Module(object):
             will be automatically increased.
         f_preproc: str, optional
             The preprocess function name we want to execute before executing the time evaluator.
+        target_rel_error: float, optional
+            If set, evaluate adaptively: keep taking batches of `repeat` costs until the
+            confidence interval of the mean cost is within this error relative to the mean,
+            the time budget `max_time_ms` runs out, or `max_repeat` costs are taken.
+            At least 3 costs are taken.
+        max_time_ms: float, optional
+            The time budget of an adaptive evaluation in milliseconds, which is unlimited if
+            not set.
+        max_repeat: int, optional
+            The maximum number of costs taken by an adaptive evaluation.
+        confidence: float, optional
+            The confidence level of the confidence interval of the mean cost.
 
         Note
         ----
         The function will be invoked  (1 + number x repeat) times,
         with the first call discarded in case there is lazy initialization.
+        An adaptive evaluation invokes it (1 + number x repeat) times per batch of costs.
 
         Returns
         -------
         ftimer : function
             The function that takes same argument as func and returns a BenchmarkResult.
-            The ProfileResult reports `repeat` time costs in seconds.
+            The ProfileResult reports `repeat` time costs in seconds, or all the costs
+            taken by an adaptive evaluation.
         """
         try:
             feval = _ffi_api.RPCTimeEvaluator(
@@ -325,14 +444,35 @@ class Module(object):
                 f_preproc,
             )
 
-            def evaluator(*args):
-                """Internal wrapped evaluator."""
-                # Wrap feval so we can add more stats in future.
+            def evaluate_once(*args):
                 blob = feval(*args)
                 fmt = "@" + ("d" * repeat)
-                results = struct.unpack(fmt, blob)
-                return BenchmarkResult(results)
+                return struct.unpack(fmt, blob)
 
+            def evaluator(*args):
+                """Internal wrapped evaluator."""
+                # Wrap feval so we can add more stats in future.
+                return BenchmarkResult(evaluate_once(*args), confidence)
+
+            def adaptive_evaluator(*args):
+                """Internal wrapped evaluator that samples until the mean is precise enough."""
+                tic = time.time()
+                results = []
+                while True:
+                    # number keeps the value adjusted by min_repeat_ms across the calls
+                    results.extend(evaluate_once(*args))
+                    res = BenchmarkResult(results, confidence)
+                    if len(results) >= 3 and res.rel_error <= target_rel_error:
+                        res.converged = True
+                        return res
+                    if len(results) >= max_repeat or (
+                        max_time_ms is not None and (time.time() - tic) * 1e3 >= max_time_ms
+                    ):
+                        res.converged = False
+                        return res
+
+            if target_rel_error is not None:
+                return adaptive_evaluator
             return evaluator
         except NameError:
             raise NameError("time_evaluator is only supported when RPC is enabled")
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 """Utilities for computing an approximate roofline model"""
-from typing import Dict, Union, Optional
+from typing import Dict, List, Union, Optional
 import numpy as np
 
 from .. import auto_scheduler, relay, tir, nd, IRModule, build, topi, transform, get_global_func
@@ -489,3 +489,173 @@ def roofline_analysis(
     report = vmexec.profile(*args)
 
     return roofline_from_existing(report, save_tir.functions, target, dev, remote=remote)
+
+
+class RooflineScreening:
+    """Screen tuning candidates by the run time a roofline model estimates for them.
+
+    Device time is often far more expensive than host time during tuning. The tuners lower
+    each candidate and estimate its run time from the per-store features of its TIR, and only
+    the fastest `ratio` of each batch is built and measured on the device.
+
+    The estimated time of each store is the larger of its compute time and its memory time,
+    and the estimates of the stores are summed:
+      - The compute time is its FLOPs over the peak FLOP/s, scaled down by the fraction of the
+        cores and of the vector lanes the store uses.
+      - The memory time is the bytes of the cache lines it touches over the peak bandwidth.
+        The lines of a buffer whose reuse distance fits in the cache are only counted once.
+
+    The estimates are only used to rank the candidates of one task, so the peaks only need
+    to be of the right order of magnitude.
+
+    Parameters
+    ----------
+    peak_flops : float
+        Peak FLOP/s of the device, e.g. from :py:func:`estimate_peak_fma_flops`.
+    peak_bandwidth : float
+        Peak memory bandwidth of the device in bytes/second, e.g. from
+        :py:func:`estimate_peak_bandwidth`.
+    ratio : float
+        The fraction of the candidates of a batch that is measured.
+    num_cores : int
+        The number of cores (or, on GPUs, of threads) needed to reach the peak FLOP/s.
+    vec_width : int
+        The number of vector lanes needed to reach the peak FLOP/s.
+    cache_bytes : int
+        The size in bytes of the last level cache.
+    cache_line_bytes : int
+        The size in bytes of a cache line.
+    """
+
+    def __init__(
+        self,
+        peak_flops: float,
+        peak_bandwidth: float,
+        ratio: float = 0.5,
+        num_cores: int = 1,
+        vec_width: int = 1,
+        cache_bytes: int = 1 << 20,
+        cache_line_bytes: int = 64,
+    ):
+        if not 0 < ratio <= 1:
+            raise ValueError(f"The screening ratio must be in (0, 1], but got {ratio}")
+        self.peak_flops = peak_flops
+        self.peak_bandwidth = peak_bandwidth
+        self.ratio = ratio
+        self.num_cores = num_cores
+        self.vec_width = vec_width
+        self.cache_bytes = cache_bytes
+        self.cache_line_bytes = cache_line_bytes
+
+    @staticmethod
+    def from_device(
+        target: Target,
+        dev: Device,
+        ratio: float = 0.5,
+        remote: Optional[RPCSession] = None,
+    ) -> "RooflineScreening":
+        """Create a screening with the peaks measured on a CPU device.
+
+        Parameters
+        ----------
+        target : Target
+            The llvm target of the device.
+        dev : Device
+            The device to measure the peaks on.
+        ratio : float
+            The fraction of the candidates of a batch that is measured.
+        remote : Optional[RPCSession]
+            Remote session used to upload artifacts for runtime evaluation. Must be
+            the same session used to create `dev`.
+
+        Returns
+        -------
+        screening : RooflineScreening
+            The screening of the candidates for the device.
+        """
+        vec_width, _ = _detect_vec_width_registers(target, None, 1)
+        return RooflineScreening(
+            estimate_peak_fma_flops(target, dev, remote=remote),
+            estimate_peak_bandwidth(target, dev, remote=remote),
+            ratio=ratio,
+            num_cores=num_threads(),
+            vec_width=vec_width,
+        )
+
+    def estimate_from_features(self, features: Dict[str, np.ndarray]) -> float:
+        """Estimate the run time of a program from its named per-store features.
+
+        Parameters
+        ----------
+        features : Dict[str, np.ndarray]
+            The features of the program, as returned by
+            :py:func:`tvm.auto_scheduler.feature.named_features_from_primfunc`.
+
+        Returns
+        -------
+        float
+            The estimated run time in seconds, or infinity if the features are empty, e.g.
+            because the program could not be lowered.
+        """
+        flops = features["float_addsub"] + features["float_mul"] + features["float_mad"]
+        if features["is_gpu"].any():
+            parallel = np.ones_like(flops)
+            for axis in ["blockIdx_x", "blockIdx_y", "blockIdx_z"]:
+                parallel *= np.maximum(features[axis + "_len"], 1)
+            for axis in ["threadIdx_x", "threadIdx_y", "threadIdx_z"]:
+                parallel *= np.maximum(features[axis + "_len"], 1)
+        else:
+            parallel = np.maximum(features["parallel_prod"], 1)
+        vec = np.maximum(features["vec_len"], 1)
+        efficiency = (np.minimum(parallel, self.num_cores) / self.num_cores) * (
+            np.minimum(vec, self.vec_width) / self.vec_width
+        )
+        compute_time = flops / (self.peak_flops * efficiency)
+
+        lines = np.zeros_like(flops)
+        i = 0
+        while f"B{i}.lines" in features:
+            fits = features[f"B{i}.reuse_dis_bytes"] <= self.cache_bytes
+            lines += np.where(fits, features[f"B{i}.unique_lines"], features[f"B{i}.lines"])
+            i += 1
+        memory_time = lines * self.cache_line_bytes / self.peak_bandwidth
+
+        if not flops.any() and not lines.any():
+            return float("inf")
+        return float(np.sum(np.maximum(compute_time, memory_time)))
+
+    def estimate(self, func: tir.PrimFunc) -> float:
+        """Estimate the run time of a lowered PrimFunc.
+
+        Parameters
+        ----------
+        func : PrimFunc
+            The function, lowered before `tir.MakePackedAPI`.
+
+        Returns
+        -------
+        float
+            The estimated run time in seconds.
+        """
+        return self.estimate_from_features(
+            auto_scheduler.feature.named_features_from_primfunc(
+                func, cache_line_bytes=self.cache_line_bytes
+            )
+        )
+
+    def select(self, estimates: List[float]) -> List[int]:
+        """Select the candidates to measure.
+
+        Parameters
+        ----------
+        estimates : List[float]
+            The estimated run times of the candidates of a batch.
+
+        Returns
+        -------
+        List[int]
+            The indices of the `ratio` of the candidates with the smallest estimates, and at
+            least one, in increasing order.
+        """
+        num = max(int(np.ceil(len(estimates) * self.ratio)), 1)
+        return sorted(np.argsort(estimates, kind="stable")[:num].tolist())
@@ -56,6 +56,8 @@ static const char* ErrorNoToStr[] = {
     "BuildTimeoutError",
     "RunTimeoutError",
     "UnknownError",
+    "Censored",
+    "Screened",
 };
 
 /********** Measure input and result **********/
@@ -265,6 +267,10 @@ Array<MeasureResult> ProgramMeasurerNode::Measure(const SearchTask& task,
         flops = task->compute_dag->flop_ct / FloatArrayMean(result_batch[j]->costs);
         error_ct = 0;
         has_valid.insert(workload_key);
+      } else if (result_batch[j]->error_no == static_cast<int>(MeasureErrorNO::kCensored) ||
+                 result_batch[j]->error_no == static_cast<int>(MeasureErrorNO::kScreened)) {
+        // Rejected early by a probe run or by the screening, which is not an error
+        flops = 0.0;
       } else {
         flops = 0.0;
         error_ct++;
@@ -29,6 +29,7 @@
 #include <tvm/runtime/registry.h>
 
 #include <fstream>
+#include <mutex>
 #include <sstream>
 #include <string>
 #include <utility>
@@ -351,6 +352,9 @@ void ReadMeasureRecord(const std::string& str, MeasureInputNode* inp, MeasureRes
 
 void RecordToFileNode::Callback(const SearchPolicy& policy, const Array<MeasureInput>& inputs,
                                 const Array<MeasureResult>& results) {
+  // The task scheduler may tune several tasks concurrently, which log to the same file.
+  static std::mutex mutex;
+  std::lock_guard<std::mutex> lock(mutex);
   std::ofstream ofs(filename, std::ofstream::app);
   WriteMeasureRecords(&ofs, inputs, results);
 }
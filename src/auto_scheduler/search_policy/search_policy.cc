@@ -54,8 +54,11 @@ void SearchPolicyNode::PreloadMeasuredStates(const String& log_file) {
           StepApplyToState(step, &state, search_task->compute_dag);
         }
         measured_states.push_back(std::move(state));
-        measured_throughputs.push_back(
-            res.second[i]->error_no == 0 ? (1.0 / FloatArrayMean(res.second[i]->costs)) : 0.0);
+        // A censored result holds the time of the probe run that rejected it
+        bool has_costs = res.second[i]->error_no == 0 ||
+                         res.second[i]->error_no == static_cast<int>(MeasureErrorNO::kCensored);
+        measured_throughputs.push_back(has_costs ? (1.0 / FloatArrayMean(res.second[i]->costs))
+                                                 : 0.0);
       }
     }
     // We can assume the recorded states will all be valid after infer bound
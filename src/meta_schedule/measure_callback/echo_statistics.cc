@@ -58,6 +58,11 @@ struct TaskInfo {
                                    << ". Best GFLOPs: " << best_gflops;
   }
 
+  void UpdateScreened(const std::string& msg) {
+    ++trials;
+    TVM_PY_LOG(INFO, logging_func) << "[" << name << "] Trial #" << trials << ": " << msg;
+  }
+
   void UpdateError(std::string err, const MeasureCandidate& candidate) {
     static const auto* f_proc = runtime::Registry::Get("meta_schedule._process_error_message");
     ICHECK(f_proc != nullptr);
@@ -93,7 +98,12 @@ class EchoStatisticsNode : public MeasureCallbackNode {
       BuilderResult builder_result = builder_results[i];
       RunnerResult runner_result = runner_results[i];
       if (Optional<String> err = builder_result->error_msg) {
-        info.UpdateError(err.value(), candidate);
+        if (support::StartsWith(err.value(), "Screened")) {
+          // Not built because of the screening of the LocalBuilder, which is not an error
+          info.UpdateScreened(err.value());
+        } else {
+          info.UpdateError(err.value(), candidate);
+        }
       } else if (Optional<String> err = runner_result->error_msg) {
         info.UpdateError(err.value(), candidate);
       } else {
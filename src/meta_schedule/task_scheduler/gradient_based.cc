@@ -119,7 +119,10 @@ class GradientBasedNode final : public TaskSchedulerNode {
     }
     if (num_rounds_already_ == n_tasks) {
       for (int i = 0; i < n_tasks; ++i) {
-        this->JoinRunningTask(i);
+        // A task may have terminated in the first round, e.g. when its trial budget is used up
+        if (tasks[i]->runner_futures.defined()) {
+          this->JoinRunningTask(i);
+        }
       }
     }
     ++num_rounds_already_;
@@ -19,6 +19,7 @@ import pytest
 import os
 import psutil
 import time
+from tvm.contrib import popen_pool
 from tvm.contrib.popen_pool import PopenWorker, PopenPoolExecutor
 from tvm.testing import (
     identity_after,
@@ -179,6 +180,64 @@ def test_popen_pool_executor_recycles():
     assert initial_pid != pool.submit(os.getpid).result()
 
 
+def test_popen_pool_executor_shared_memory():
+    pool = PopenPoolExecutor(max_workers=2, timeout=None, shared_memory_threshold=1024)
+
+    payload = b"x" * (1 << 20)
+    assert pool.submit(identity_after, payload, 0).result() == payload
+    assert pool.submit(identity_after, 1, 0).result() == 1
+    values = pool.map_with_error_catching(lambda x: bytes(x), [10, 4096])
+    assert [len(val.value) for val in values] == [10, 4096]
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="shared memory is not in /dev/shm")
+def test_popen_worker_shared_memory_unlinked_on_kill():
+    proc = PopenWorker(shared_memory_threshold=1024)
+    proc.send(identity_after, [b"x" * 4096, 0])
+    _, result_name = proc._shared_memory_names
+
+    # the result is written by the worker, but never read
+    path = os.path.join("/dev/shm", result_name)
+    tic = time.time()
+    while not os.path.exists(path) and time.time() - tic < 60:
+        time.sleep(0.1)
+    assert os.path.exists(path)
+    proc.kill()
+    assert not os.path.exists(path)
+
+
+def _wait_for_spares(num, timeout=60):
+    reserve = popen_pool._WARM_RESERVE
+    tic = time.time()
+    while len(reserve._spares) != num and time.time() - tic < timeout:
+        time.sleep(0.1)
+    return [spare[0].pid for spare in reserve._spares]
+
+
+def test_popen_pool_executor_warm_workers():
+    pool = PopenPoolExecutor(max_workers=1, timeout=None, maximum_process_uses=1, warm_workers=1)
+
+    # the first task runs in the spare process started with the pool
+    spares = _wait_for_spares(1)
+    assert len(spares) == 1
+    assert pool.submit(os.getpid).result() == spares[0]
+
+    pids = [pool.submit(os.getpid).result() for _ in range(4)]
+    assert len(set(pids)) == 4
+    assert pool.submit(identity_after, 5, 0).result() == 5
+
+    timings = list(pool.task_timings)
+    assert len(timings) == 6
+    for timing in timings:
+        assert timing.queue >= 0 and timing.transfer >= 0 and timing.compute >= 0
+    # every task started a new process
+    assert all(timing.startup > 0 for timing in timings)
+
+    # the spares are stopped when the pool is deleted
+    del pool
+    assert _wait_for_spares(0) == []
+
+
 if __name__ == "__main__":
     test_popen_worker()
     test_popen_worker_recycles()
@@ -188,3 +247,6 @@ if __name__ == "__main__":
     test_popen_ffi()
     test_popen_pool_executor_timeout()
     test_popen_pool_executor_recycles()
+    test_popen_pool_executor_shared_memory()
+    test_popen_worker_shared_memory_unlinked_on_kill()
+    test_popen_pool_executor_warm_workers()
@@ -79,6 +79,30 @@ def test_xgb_model():
     model.load(tmpfile)
 
 
+def test_xgb_model_incremental():
+    task, inputs, results = get_sample_records(60)
+
+    model = auto_scheduler.XGBModel(
+        num_warmup_sample=-1, incremental=True, full_refit_interval=1, replay_buffer_size=10
+    )
+    model.update(inputs[:40], results[:40])
+    assert model.num_incremental_updates == 0
+    n_trees = len(model.bst.get_dump())
+
+    # continue boosting the previous model
+    model.update(inputs[40:50], results[40:50])
+    assert model.num_incremental_updates == 1
+    assert len(model.bst.get_dump()) > n_trees
+
+    # refit from scratch after full_refit_interval incremental updates
+    model.update(inputs[50:], results[50:])
+    assert model.num_incremental_updates == 0
+
+    preds = model.predict(task, [x.state for x in inputs])
+    assert len(preds) == len(inputs)
+
+
 if __name__ == "__main__":
     test_random_model()
     test_xgb_model()
+    test_xgb_model_incremental()
@@ -24,8 +24,10 @@ import tvm
 from tvm import topi
 from tvm import te, auto_scheduler
 import tempfile
+import time
 import tvm.testing
 import pickle
+import pytest
 from tvm.testing.auto_scheduler import matmul_auto_scheduler_test
 from tvm.auto_scheduler import workload_registry
 
@@ -293,6 +295,213 @@ def test_dag_measure_local_builder_runner():
         assert mress[0].error_no == 0
 
 
+def test_record_reader_read_batches():
+    target = tvm.target.Target("llvm")
+    dag = auto_scheduler.ComputeDAG(matmul_auto_scheduler_test(64, 64, 64))
+    tasks = [
+        auto_scheduler.SearchTask(compute_dag=dag, workload_key=key, target=target)
+        for key in ["wkl_a", "wkl_b"]
+    ]
+
+    inputs = [auto_scheduler.MeasureInput(tasks[i % 2], dag.get_init_state()) for i in range(10)]
+    results = [auto_scheduler.MeasureResult([0.1 * i], 0, "", 0.2, 1) for i in range(10)]
+
+    with tempfile.NamedTemporaryFile() as fp:
+        auto_scheduler.save_records(fp.name, inputs, results)
+        reader = auto_scheduler.RecordReader(fp.name)
+
+        batches = list(reader.read_batches(batch_size=3, num_threads=2))
+        assert len(batches) == 4
+        loaded = [inp.task.workload_key for inps, _ in batches for inp in inps]
+        assert loaded == [inp.task.workload_key for inp in inputs]
+
+        batches = list(reader.read_batches(batch_size=3, workload_key="wkl_b"))
+        costs = [res.costs[0].value for _, ress in batches for res in ress]
+        assert np.allclose(costs, [0.1, 0.3, 0.5, 0.7, 0.9])
+
+        batches = list(reader.read_batches(target=tvm.target.Target("cuda")))
+        assert not batches
+
+        inp, res = auto_scheduler.load_best_record(fp.name, "wkl_b", target)
+        assert inp.task.workload_key == "wkl_b"
+        assert np.isclose(res.costs[0].value, 0.1)
+
+
+def test_measure_cache():
+    task = auto_scheduler.SearchTask(
+        func=matmul_auto_scheduler_test, args=(64, 64, 64), target="llvm"
+    )
+    cache = auto_scheduler.MeasureCache()
+    local_builder = auto_scheduler.LocalBuilder()
+    local_runner = auto_scheduler.LocalRunner(timeout=60)
+
+    minp = auto_scheduler.MeasureInput(task, task.compute_dag.init_state)
+    with cache:
+        bress = local_builder.build([minp])
+        mress = local_runner.run([minp], bress)
+        assert mress[0].error_no == 0
+        assert len(cache) == 1 and cache.hits == 0
+
+        # creating a builder does not reset the cache
+        auto_scheduler.LocalBuilder()
+        assert auto_scheduler.MeasureCache.current is cache
+
+        # the same program again is neither compiled nor run
+        bress = local_builder.build([minp, minp])
+        assert all(bres.filename.startswith(cache.HIT_PREFIX) for bres in bress)
+        mress_again = local_runner.run([minp, minp], bress)
+        assert cache.hits == 2
+        assert [x.value for x in mress_again[1].costs] == [x.value for x in mress[0].costs]
+    assert auto_scheduler.MeasureCache.current is None
+
+    # the inputs of a batch that share a program are compiled and run once
+    state = task.compute_dag.init_state
+    minps = [auto_scheduler.MeasureInput(task, state) for _ in range(3)]
+    with auto_scheduler.MeasureCache() as cache:
+        bress = local_builder.build(minps)
+        assert not bress[0].filename.startswith(cache.HIT_PREFIX)
+        assert all(bres.filename.startswith(cache.HIT_PREFIX) for bres in bress[1:])
+        mress = local_runner.run(minps, bress)
+        assert all(mres.error_no == 0 for mres in mress)
+        assert len(cache) == 1 and cache.hits == 2
+        costs = [x.value for x in mress[0].costs]
+        assert all([x.value for x in mres.costs] == costs for mres in mress)
+
+
+@tvm.testing.requires_llvm
+def test_measure_persistent_local_runner():
+    from tvm.contrib import cc
+
+    task = auto_scheduler.SearchTask(
+        func=matmul_auto_scheduler_test, args=(64, 64, 64), target="llvm"
+    )
+    minp = auto_scheduler.MeasureInput(task, task.compute_dag.init_state)
+    local_runner = auto_scheduler.LocalRunner(timeout=60, persistent=True)
+    persistent = auto_scheduler.PersistentRunner.current
+    assert persistent is not None
+
+    for build_func in ["default", cc.create_shared]:
+        local_builder = auto_scheduler.LocalBuilder(build_func=build_func)
+        for _ in range(2):
+            bress = local_builder.build([minp, minp])
+            mress = local_runner.run([minp, minp], bress)
+            assert all(mres.error_no == 0 for mres in mress)
+
+    # one worker process is kept across the batches
+    assert len(persistent.workers) == 1
+    assert persistent.workers[0].is_alive()
+
+    auto_scheduler.LocalRunner(timeout=60)
+    assert auto_scheduler.PersistentRunner.current is None
+
+
+@tvm.testing.requires_llvm
+def test_load_module_under_unique_path():
+    from tvm.contrib import cc, utils
+
+    temp = utils.tempdir()
+    a = tvm.nd.array(np.zeros(4, dtype="float32"))
+    for value in [1.0, 2.0]:
+        # the same file name is reused for the other program, as by the builders
+        A = te.placeholder((4,), name="A")
+        B = te.compute((4,), lambda i: A[i] + value, name="B")
+        path = temp.relpath("main.so")
+        tvm.build(te.create_schedule(B.op), [A, B], "llvm").export_library(path, cc.create_shared)
+        mod = auto_scheduler.measure._load_module_under_unique_path(path)
+        b = tvm.nd.array(np.zeros(4, dtype="float32"))
+        mod(a, b)
+        np.testing.assert_equal(b.numpy(), np.full(4, value, dtype="float32"))
+        del mod
+
+
+def test_measure_early_rejection():
+    task = auto_scheduler.SearchTask(
+        func=matmul_auto_scheduler_test, args=(64, 64, 64), target="llvm"
+    )
+    minp = auto_scheduler.MeasureInput(task, task.compute_dag.init_state)
+    local_builder = auto_scheduler.LocalBuilder()
+    # any probe run is slower than this fraction of the incumbent
+    local_runner = auto_scheduler.LocalRunner(timeout=60, repeat=3, early_reject_ratio=1e-9)
+
+    bress = local_builder.build([minp, minp])
+    first, second = local_runner.run([minp, minp], bress)
+    assert first.error_no == 0
+    assert len(first.costs) == 3
+    # the censored result keeps the time of its probe run
+    assert second.error_no == auto_scheduler.measure.MeasureErrorNo.CENSORED
+    assert len(second.costs) == 1 and second.costs[0].value > 0
+    assert task.workload_key in auto_scheduler.EarlyRejection.best_costs
+
+    auto_scheduler.LocalRunner(timeout=60)
+    assert auto_scheduler.EarlyRejection.ratio is None
+
+
+@tvm.testing.requires_llvm
+def test_measure_screening():
+    import tvm.utils
+
+    task = auto_scheduler.SearchTask(
+        func=matmul_auto_scheduler_test, args=(64, 64, 64), target="llvm"
+    )
+    minp = auto_scheduler.MeasureInput(task, task.compute_dag.init_state)
+    screening = tvm.utils.RooflineScreening(1e9, 1e10, ratio=0.5)
+    local_builder = auto_scheduler.LocalBuilder(screening=screening)
+    local_runner = auto_scheduler.LocalRunner(timeout=60)
+
+    bress = local_builder.build([minp] * 4)
+    error_nos = [bres.error_no for bres in bress]
+    assert error_nos == [0, 0] + [auto_scheduler.measure.MeasureErrorNo.SCREENED] * 2
+    mress = local_runner.run([minp] * 4, bress)
+    assert [mres.error_no for mres in mress] == error_nos
+
+    auto_scheduler.LocalBuilder()
+    assert auto_scheduler.measure.BuildFunc.screening is None
+
+
+@tvm.testing.requires_llvm
+@tvm.testing.requires_rpc
+def test_measure_remote_builder():
+    from tvm.contrib.build_farm import BuildFarm, start_build_worker
+    from tvm.rpc.tracker import Tracker
+
+    # only the build workers can run the tasks sent to them
+    assert tvm.get_global_func("tvm.contrib.build_farm.run", allow_missing=True) is None
+
+    tracker = Tracker(port=9000, port_end=10000, silent=True)
+    task = auto_scheduler.SearchTask(
+        func=matmul_auto_scheduler_test, args=(64, 64, 64), target="llvm"
+    )
+    minp = auto_scheduler.MeasureInput(task, task.compute_dag.init_state)
+
+    # without a registered worker the build fails instead of waiting for one
+    farm = BuildFarm("127.0.0.1", tracker.port, key="build")
+    with pytest.raises(RuntimeError, match="no build worker"):
+        farm.map_with_error_catching(str, [1])
+
+    workers = [
+        start_build_worker(("127.0.0.1", tracker.port), host="127.0.0.1", port=9000, port_end=10000)
+        for _ in range(2)
+    ]
+    time.sleep(1)
+
+    remote_builder = auto_scheduler.RemoteBuilder("build", "127.0.0.1", tracker.port, timeout=60)
+    local_runner = auto_scheduler.LocalRunner(timeout=60)
+
+    bress = remote_builder.build([minp, minp, minp])
+    assert all(bres.error_no == 0 for bres in bress)
+    assert len(set(bres.filename for bres in bress)) == 3
+    mress = local_runner.run([minp], bress[:1])
+    assert mress[0].error_no == 0
+
+    # the local builder does not build on the farm
+    auto_scheduler.LocalBuilder()
+    assert auto_scheduler.measure.BuildFunc.farm is None
+
+    for worker in workers:
+        worker.terminate()
+    tracker.terminate()
+
+
 def test_workload_serialization():
     key = tvm.auto_scheduler.utils.get_func_name(matmul_auto_scheduler_test)
     transfer_data = workload_registry.serialize_workload_registry_entry(key)
@@ -391,6 +600,17 @@ def test_measure_special_inputs_map_by_name_local_runner():
     assert mress[0].error_no == 0
 
 
+def test_task_input_check_func_registry():
+    # topi registers its sparse input check function at import time
+    assert "try_get_sparse_input" in auto_scheduler.measure.TASK_INPUT_CHECK_FUNC_REGISTRY
+
+    X = te.placeholder(shape=[10], dtype="int32")
+    Index = te.placeholder(shape=[1], dtype="int32", name="Index")
+    Y = te.compute((1,), lambda i: X[Index[i]])
+    tensor_input_map = auto_scheduler.measure.prepare_input_map([X, Index, Y])
+    assert list(tensor_input_map.values()) == ["Index"]
+
+
 @tvm.testing.requires_llvm
 def test_measure_special_inputs_map_by_name_rpc_runner():
     @auto_scheduler.register_workload
@@ -139,7 +139,48 @@ def test_task_scheduler_gradient():
         del measure_ctx
 
 
+@tvm.testing.requires_llvm
+def test_task_scheduler_parallel():
+    tasks = []
+    for n in [2, 4, 8]:
+        tasks.append(
+            auto_scheduler.SearchTask(
+                func=matmul_auto_scheduler_test, args=(n, n, n), target="llvm"
+            )
+        )
+
+    with tempfile.NamedTemporaryFile() as fp:
+        log_file = fp.name
+        num_trials_per_task = 2
+
+        # Tune two tasks at a time
+        measure_ctx = auto_scheduler.LocalRPCMeasureContext()
+        tune_option = auto_scheduler.TuningOptions(
+            num_measure_trials=num_trials_per_task * len(tasks),
+            runner=measure_ctx.runner,
+            num_measures_per_round=1,
+            measure_callbacks=[auto_scheduler.RecordToFile(log_file)],
+        )
+        task_scheduler = auto_scheduler.TaskScheduler(
+            tasks, strategy="round-robin", callbacks=[], num_parallel_tasks=2
+        )
+        task_scheduler.tune(tune_option, search_policy="sketch.random")
+
+        counters = {}
+        for task in tasks:
+            counters[task.workload_key] = 0
+
+        for inp, _ in auto_scheduler.load_records(log_file):
+            counters[inp.task.workload_key] += 1
+
+        for task in tasks:
+            assert counters[task.workload_key] == num_trials_per_task
+        assert task_scheduler.ct == num_trials_per_task * len(tasks)
+        del measure_ctx
+
+
 if __name__ == "__main__":
     test_task_scheduler_round_robin()
     test_task_scheduler_round_robin_spawn()
     test_task_scheduler_gradient()
+    test_task_scheduler_parallel()
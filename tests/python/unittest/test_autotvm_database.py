@@ -19,6 +19,7 @@ import copy
 import logging
 
 from tvm.autotvm import database
+from tvm.contrib import utils
 from tvm.autotvm.record import encode, MeasureResult
 
 from tvm.testing.autotvm import get_sample_records
@@ -116,9 +117,37 @@ def test_db_filter():
     assert len(records) == 2
 
 
+def test_sqlite_db():
+    logging.info("test sqlite db ...")
+    temp = utils.tempdir()
+    records = get_sample_records(5)
+    inp1, res1 = records[0]
+    _, res2 = records[1]
+
+    _db = database.SQLiteDatabase(temp.relpath("records.db"))
+    _db.flush()
+    for inp, result in records:
+        _db.save(inp, result)
+    _db.save(inp1, res2, extend=True)
+    assert len(_db.load(inp1, get_all=True)) == 2
+
+    # reopen the file and check records persist
+    _db = database.SQLiteDatabase(temp.relpath("records.db"))
+    assert encode(inp1, _db.load(inp1, get_all=True)[0]) == encode(inp1, res1)
+    _db.save(inp1, res1)
+    assert len(_db.load(inp1, get_all=True)) == 1
+
+    records = _db.filter(lambda inp, ress: any(r.costs[0] <= 2 for r in ress))
+    assert len(records) == 2
+
+    _db.flush()
+    assert _db.load(inp1) is None
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     test_save_load()
     test_db_hash()
     test_db_latest_all()
     test_db_filter()
+    test_sqlite_db()
@@ -17,12 +17,14 @@
 """Test builder and runner"""
 import logging
 import multiprocessing
+import os
 import concurrent
 
 import numpy as np
 
 import tvm
 from tvm import te
+from tvm.contrib import utils
 from tvm.autotvm.measure import executor
 from tvm.testing.autotvm import DummyRunner, bad_matmul, get_sample_task
 from tvm import autotvm
@@ -50,6 +52,148 @@ def test_task_tuner_without_measurement():
         assert tuner.best_flops > 1
 
 
+def test_task_tuner_with_database():
+    """test that configs cached in the database are not measured again"""
+    task, _ = get_sample_task()
+    temp = utils.tempdir()
+    db_path = temp.relpath("records.db")
+
+    n_measured = []
+
+    class CountingRunner(DummyRunner):
+        def run(self, measure_inputs, build_results):
+            n_measured.append(len(measure_inputs))
+            return super().run(measure_inputs, build_results)
+
+    runner = CountingRunner()
+    measure_option = autotvm.measure_option(builder=autotvm.LocalBuilder(), runner=runner)
+
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(n_trial=4, measure_option=measure_option, database=db_path)
+    assert sum(n_measured) == 4
+
+    n_measured.clear()
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(n_trial=6, measure_option=measure_option, database=db_path)
+    assert sum(n_measured) == 2
+    assert tuner.best_flops > 1
+
+
+def test_task_tuner_with_database_failed_record():
+    """test that failed results in the database are measured again"""
+    task, target = get_sample_task()
+    temp = utils.tempdir()
+    db_path = temp.relpath("records.db")
+    db = autotvm.database.SQLiteDatabase(db_path)
+    inp = measure.MeasureInput(target, task, task.config_space.get(0))
+    db.save(inp, MeasureResult((RuntimeError("timeout"),), MeasureErrorNo.RUN_TIMEOUT, 10, 0))
+
+    measured = []
+
+    class CountingRunner(DummyRunner):
+        def run(self, measure_inputs, build_results):
+            measured.extend(measure_inputs)
+            return super().run(measure_inputs, build_results)
+
+    measure_option = autotvm.measure_option(
+        builder=autotvm.LocalBuilder(), runner=CountingRunner()
+    )
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(n_trial=2, measure_option=measure_option, database=db)
+    assert len(measured) == 2
+    assert db.load(inp).error_no == MeasureErrorNo.NO_ERROR
+
+
+def test_task_tuner_pipeline():
+    """test that a pipelined tuner measures every trial exactly once"""
+    task, target = get_sample_task()
+    tuners = [
+        autotvm.tuner.GridSearchTuner(task),
+        autotvm.tuner.XGBTuner(task),
+        # generations of 4 configs, which batches of 3 do not divide
+        autotvm.tuner.GATuner(task, pop_size=4),
+    ]
+    measure_option = autotvm.measure_option(
+        builder=autotvm.LocalBuilder(n_parallel=3), runner=DummyRunner()
+    )
+    for tuner in tuners:
+        measured = []
+        tuner.tune(
+            n_trial=10,
+            measure_option=measure_option,
+            callbacks=[lambda _, inputs, results: measured.extend(inputs)],
+            pipeline=True,
+        )
+        assert len(measured) == 10
+        assert len(set(inp.config.index for inp in measured)) == 10
+        assert tuner.best_flops > 1
+
+    # early stopping discards the batch built in advance
+    measure_option = autotvm.measure_option(
+        builder=autotvm.LocalBuilder(n_parallel=2), runner=DummyRunner()
+    )
+    measured = []
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(
+        n_trial=20,
+        measure_option=measure_option,
+        early_stopping=1,
+        callbacks=[lambda _, inputs, results: measured.extend(inputs)],
+        pipeline=True,
+    )
+    assert len(measured) == 2
+
+    # the modules of a batch are kept while the next batch builds
+    builder = autotvm.LocalBuilder()
+    builder.set_task(task)
+    inputs = [autotvm.MeasureInput(target, task, task.config_space.get(0))]
+    first = builder.build(inputs)[0].filename
+    builder.build(inputs)
+    assert os.path.exists(first)
+    builder.build(inputs)
+    assert not os.path.exists(first)
+
+
+def test_measure_cache():
+    """test that identical programs are only built and run once"""
+    task, target = get_sample_task()
+
+    n_built = []
+    n_measured = []
+
+    class CountingBuilder(autotvm.LocalBuilder):
+        def build(self, measure_inputs):
+            n_built.append(len(measure_inputs))
+            return super().build(measure_inputs)
+
+    class CountingRunner(DummyRunner):
+        def run(self, measure_inputs, build_results):
+            n_measured.append(len(measure_inputs))
+            return super().run(measure_inputs, build_results)
+
+    cache = autotvm.MeasureCache()
+    measure_option = autotvm.measure_option(
+        builder=CountingBuilder(), runner=CountingRunner(), cache=cache
+    )
+    measure_batch = autotvm.measure.create_measure_batch(task, measure_option)
+
+    inputs = [autotvm.MeasureInput(target, task, task.config_space.get(i)) for i in range(2)]
+    results = measure_batch(inputs)
+    assert sum(n_measured) == 2 and len(cache) == 2
+
+    results_again = measure_batch(inputs)
+    assert sum(n_built) == 2 and sum(n_measured) == 2 and cache.hits == 2
+    for res, res_again in zip(results, results_again):
+        assert res_again.error_no == 0
+        assert res.costs == res_again.costs
+
+    # the configs of a batch that share a program are built and run once
+    inputs = [autotvm.MeasureInput(target, task, task.config_space.get(2))] * 3
+    results = measure_batch(inputs)
+    assert sum(n_built) == 3 and sum(n_measured) == 3 and len(cache) == 3
+    assert all(res.error_no == 0 and res.costs == results[0].costs for res in results)
+
+
 def task_tuner_spawn():
     assert multiprocessing.get_start_method(False) == "spawn"
     test_task_tuner_without_measurement()
@@ -86,9 +230,97 @@ def test_task_runner_with_ref_input():
     assert runner.executor.ran_dummy_executor
 
 
+def test_task_runner_early_rejection():
+    """test that the runner rejects configs slower than its best one after a probe run"""
+    runner = measure.LocalRunner(early_reject_ratio=2.0)
+    runner.n_parallel = 1
+    reject_costs = []
+
+    class DummyExecutor(measure.executor.Executor):
+        def submit(self, func, *args, **kwargs):
+            sig = Signature.from_callable(func)
+            reject_cost = sig.bind(*args, **kwargs).arguments["reject_cost"]
+            reject_costs.append(reject_cost)
+            dummy_future = concurrent.futures.Future()
+            if reject_cost is None:
+                dummy_future.set_result(MeasureResult((0.5,), MeasureErrorNo.NO_ERROR, 0, 0))
+            else:
+                dummy_future.set_result(MeasureResult((2.0,), MeasureErrorNo.CENSORED, 0, 0))
+            return dummy_future
+
+    runner.executor = DummyExecutor()
+    results = runner.run([None] * 3, [None] * 3)
+    assert reject_costs == [None, 1.0, 1.0]
+    assert [res.error_no for res in results] == [0] + [MeasureErrorNo.CENSORED] * 2
+    # censored results do not change the incumbent
+    assert runner.best_cost == 0.5
+
+
+@tvm.testing.requires_llvm
+def test_task_runner_compression():
+    """test that the default module loader compresses the transfers when asked to"""
+    task, _ = get_sample_task()
+    runner = measure.LocalRunner(compression=["zlib"])
+    measure_option = autotvm.measure_option(builder=autotvm.LocalBuilder(), runner=runner)
+    results = []
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(
+        n_trial=2,
+        measure_option=measure_option,
+        callbacks=[lambda _, inputs, res: results.extend(res)],
+    )
+    assert [res.error_no for res in results] == [MeasureErrorNo.NO_ERROR] * 2
+
+
+def test_task_builder_screening():
+    """test that only the configs ranked fastest by the roofline model are built"""
+    import tvm.utils
+
+    task, target = get_sample_task()
+    screening = tvm.utils.RooflineScreening(1e9, 1e10, ratio=0.5)
+    measure_option = autotvm.measure_option(
+        builder=autotvm.LocalBuilder(), runner=DummyRunner(), screening=screening
+    )
+    measure_batch = measure.create_measure_batch(task, measure_option)
+
+    inputs = [measure.MeasureInput(target, task, task.config_space.get(i)) for i in range(4)]
+    results = measure_batch.build(inputs)
+    screened = [getattr(res, "error_no", None) == MeasureErrorNo.SCREENED for res in results]
+    assert sum(screened) == 2
+    # the costs of a screened config hold its estimated run time
+    assert all(res.costs[0] > 0 for res, s in zip(results, screened) if s)
+
+
+def test_task_tuner_screening_with_database():
+    """test that screened configs are not cached in the database"""
+    import tvm.utils
+
+    task, target = get_sample_task()
+    temp = utils.tempdir()
+    db = autotvm.database.SQLiteDatabase(temp.relpath("records.db"))
+    screening = tvm.utils.RooflineScreening(1e9, 1e10, ratio=0.5)
+    measure_option = autotvm.measure_option(
+        builder=autotvm.LocalBuilder(n_parallel=4), runner=DummyRunner(), screening=screening
+    )
+    results = []
+    tuner = autotvm.tuner.GridSearchTuner(task)
+    tuner.tune(
+        n_trial=4,
+        measure_option=measure_option,
+        database=db,
+        callbacks=[lambda _, inputs, res: results.extend(zip(inputs, res))],
+    )
+    screened = [inp for inp, res in results if res.error_no == MeasureErrorNo.SCREENED]
+    assert screened
+    assert all(db.load(inp) is None for inp in screened)
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
 
     test_task_tuner_without_measurement()
     test_task_tuner_without_measurement_spawn()
+    test_task_tuner_pipeline()
     test_task_runner_with_ref_input()
+    test_task_runner_early_rejection()
+    test_task_builder_screening()
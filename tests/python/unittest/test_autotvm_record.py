@@ -24,6 +24,7 @@ from tvm.contrib import utils
 from tvm import autotvm
 from tvm.autotvm.measure import MeasureInput, MeasureResult, MeasureErrorNo
 from tvm.autotvm.record import encode, decode, ApplyHistoryBest, measure_str_key
+from tvm.autotvm.record_store import RecordStore, convert_log_to_store
 
 from tvm.testing.autotvm import get_sample_task
 
@@ -97,7 +98,48 @@ def test_apply_history_best():
     assert str(x) == str(tsk.config_space.get(2))
 
 
+def test_record_store():
+    temp = utils.tempdir()
+    log_path = temp.relpath("temp.log")
+    store_path = temp.relpath("temp.db")
+
+    tsk, target = get_sample_task()
+    inputs = [MeasureInput(target, tsk, tsk.config_space.get(i)) for i in range(0, 10)]
+    results = [MeasureResult((10 - i,), 0, 0, 0) for i in range(0, 10)]
+    results[9] = MeasureResult((1e9,), MeasureErrorNo.RUNTIME_DEVICE, 0, 0)
+
+    with open(log_path, "w") as fo:
+        autotvm.callback.log_to_file(fo)(None, inputs[:5], results[:5])
+
+    store = convert_log_to_store(log_path, store_path)
+    assert len(store) == 5
+    inp, _ = store.best_by_targetkey("cpu", tsk.workload)
+    assert str(inp.config) == str(inputs[4].config)
+
+    # appends are incremental and keep the best index up to date
+    autotvm.record_store.log_to_store(store)(None, inputs[5:], results[5:])
+    assert len(store) == 10
+    assert len(list(store.load(tsk.workload))) == 10
+    store.close()
+
+    hist_best = ApplyHistoryBest(store_path)
+    x = hist_best.query(target, tsk.workload)
+    assert str(x) == str(inputs[8].config)
+
+    # a store can be passed directly
+    hist_best = ApplyHistoryBest(RecordStore(store_path))
+    x = hist_best.query(target, tsk.workload)
+    assert str(x) == str(inputs[8].config)
+
+    # in-memory records and stores are merged
+    better = (MeasureInput(target, tsk, tsk.config_space.get(11)), MeasureResult((0.1,), 0, 0, 0))
+    hist_best = ApplyHistoryBest([RecordStore(store_path), better])
+    x = hist_best.query(target, tsk.workload)
+    assert str(x) == str(better[0].config)
+
+
 if __name__ == "__main__":
     test_load_dump()
     test_apply_history_best()
     test_file_io()
+    test_record_store()
@@ -16,8 +16,12 @@
 # under the License.
 """Test space definition primitives"""
 
+import numpy as np
+
 import tvm
 from tvm import te
+from tvm.autotvm.tuner.model_based_tuner import knob2point, point2knob
+from tvm.autotvm.tuner.sa_model_optimizer import random_walk_batch
 from tvm.autotvm.task.space import ConfigSpace, FallbackConfigEntity
 
 
@@ -102,5 +106,69 @@ def test_split():
         pass
 
 
+def test_batch_index():
+    cfg = ConfigSpace()
+    gemm_func(cfg, 128)
+    cfg.define_knob("unroll", [0, 1, 2])
+    assert cfg.dims == [8, 8, 3]
+
+    points = np.arange(len(cfg))
+    knobs = cfg.point2knob(points)
+    assert knobs.shape == (len(cfg), 3)
+    for p, knob in zip(points, knobs):
+        assert list(knob) == point2knob(int(p), cfg.dims)
+        assert knob2point(list(knob), cfg.dims) == p
+    assert np.array_equal(cfg.knob2point(knobs), points)
+
+    assert list(cfg.is_index_valid([-1, 0, len(cfg) - 1, len(cfg)])) == [False, True, True, False]
+
+    configs = cfg.get_batch([5, 0, 191])
+    for config in configs:
+        expected = cfg.get(config.index)
+        assert str(config) == str(expected)
+    try:
+        cfg.get_batch([0, len(cfg)])
+        assert False
+    except IndexError:
+        pass
+
+    # every walk moves exactly one knob to a different value
+    new_points = random_walk_batch(points, cfg)
+    diff = cfg.point2knob(new_points) != knobs
+    assert np.all(diff.sum(axis=1) == 1)
+
+
+def test_huge_space():
+    # a lazily enumerated split space has the same entities as an enumerated one
+    cfg = ConfigSpace()
+    cfg.define_split("lazy", cfg.axis(224), policy="verbose", num_outputs=3)
+    cfg.define_split("eager", cfg.axis(224), policy="verbose", num_outputs=3, filter=lambda x: True)
+    lazy, eager = cfg.space_map["lazy"], cfg.space_map["eager"]
+    assert len(lazy) == len(eager) == 84
+    assert [x.size for x in lazy.entities] == [x.size for x in eager.entities]
+
+    cfg = ConfigSpace()
+    for i in range(6):
+        cfg.define_split("tile_%d" % i, cfg.axis(2**25), policy="factors", num_outputs=4)
+    # 3276 ** 6 > 2 ** 63
+    assert cfg.range_length == 3276**6
+    assert cfg.index_dtype is object
+    try:
+        len(cfg)
+        assert False
+    except OverflowError:
+        pass
+
+    points = cfg.sample_indices(16)
+    assert len(set(points.tolist())) == 16
+    assert all(cfg.is_index_valid(points))
+    assert list(cfg.knob2point(cfg.point2knob(points))) == list(points)
+    last = cfg.get(cfg.range_length - 1)
+    assert [last["tile_%d" % i].size for i in range(6)] == [[-1, 1, 1, 2**25]] * 6
+    assert all(cfg.is_index_valid(random_walk_batch(points, cfg)))
+
+
 if __name__ == "__main__":
     test_split()
+    test_batch_index()
+    test_huge_space()
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import os
 import time
 
 import multiprocessing
@@ -23,7 +24,9 @@ import tvm
 from tvm import te
 from tvm import autotvm
 from tvm.autotvm import MeasureInput, MeasureResult
+from tvm.autotvm.tuner.model_based_tuner import feature_cache_key
 from tvm.autotvm.tuner.xgboost_cost_model import XGBoostCostModel
+from tvm.contrib import utils
 
 from tvm.testing.autotvm import get_sample_task, get_sample_records
 
@@ -91,8 +94,36 @@ def test_update():
     assert all(x in tuner.visited for x in tuner.xs)
 
 
+def test_disk_feature_cache():
+    task, target = get_sample_task()
+    records = get_sample_records(n=50)
+    cache_dir = utils.tempdir().relpath("features")
+
+    model = XGBoostCostModel(task, "itervar", "rank", feature_cache=cache_dir)
+    assert model.fit_log(records, plan_size=32, min_seed_records=50)
+    model.fit(np.arange(10), np.arange(10), plan_size=32)
+    expected = model.predict(np.arange(5))
+
+    # a new model reads the features of both the records and the indices from disk
+    cache = autotvm.tuner.DiskFeatureCache(cache_dir)
+    fea_cache = cache.get(feature_cache_key("itervar", task, target))
+    assert all(inp.config.index in fea_cache for inp, _ in records)
+    assert all(i in fea_cache for i in range(10))
+    assert cache.size(feature_cache_key("itervar", task, target)) == 0
+
+    # no feature is extracted again, so no segment is added
+    key_dir = os.path.join(cache_dir, feature_cache_key("itervar", task, target))
+    n_segments = len(os.listdir(key_dir))
+    model = XGBoostCostModel(task, "itervar", "rank", feature_cache=cache)
+    assert model.fit_log(records, plan_size=32, min_seed_records=50)
+    model.fit(np.arange(10), np.arange(10), plan_size=32)
+    assert model.predict(np.arange(5)).shape == expected.shape
+    assert len(os.listdir(key_dir)) == n_segments
+
+
 if __name__ == "__main__":
     test_fit()
     test_fit_spawn()
     test_tuner()
     test_update()
+    test_disk_feature_cache()
@@ -31,7 +31,11 @@ from tvm.meta_schedule.builder import (
     BuilderResult,
     LocalBuilder,
     PyBuilder,
+    RemoteBuilder,
 )
+from tvm.contrib.build_farm import start_build_worker
+from tvm.meta_schedule.runner import RPCConfig
+from tvm.rpc.tracker import Tracker
 from tvm.runtime import Module
 from tvm.script import tir as T
 from tvm.target import Target
@@ -121,6 +125,24 @@ def test_meta_schedule_single_build():
     _check_build_results(builder_results)
 
 
+def test_meta_schedule_screening_build():
+    """Test meta schedule builder with a roofline screening of the inputs"""
+    import tvm.utils  # pylint: disable=import-outside-toplevel
+
+    screening = tvm.utils.RooflineScreening(1e9, 1e10, ratio=0.5)
+    builder = LocalBuilder(screening=screening)
+    builder_inputs = [
+        BuilderInput(MatmulModule, Target("llvm")),
+        BuilderInput(BatchMatmulModule, Target("llvm")),
+    ]
+    builder_results = builder.build(builder_inputs)
+    assert len(builder_results) == len(builder_inputs)
+    # the batch matmul has 32x fewer FLOPs, so only it is built
+    assert builder_results[0].artifact_path is None
+    assert builder_results[0].error_msg.startswith("Screened")
+    _check_build_results(builder_results[1:])
+
+
 def test_meta_schedule_multiple_build():
     """Test meta schedule builder for multiple builds"""
     builder = LocalBuilder()
@@ -225,5 +247,39 @@ def test_meta_schedule_missing_build_func():
         LocalBuilder(f_build="wrong-name")
 
 
+@tvm.testing.requires_rpc
+def test_meta_schedule_remote_build():
+    """Test meta schedule builder on build workers registered to a tracker"""
+    tracker = Tracker(port=9000, port_end=10000, silent=True)
+    workers = [
+        start_build_worker(("127.0.0.1", tracker.port), host="127.0.0.1", port=9000, port_end=10000)
+        for _ in range(2)
+    ]
+    time.sleep(1)
+    rpc_config = RPCConfig(tracker_host="127.0.0.1", tracker_port=tracker.port, tracker_key="build")
+
+    builder = RemoteBuilder(rpc_config)
+    builder_inputs = [
+        BuilderInput(MatmulModule, Target("llvm")),
+        BuilderInput(MatmulReluModule, Target("llvm")),
+        BuilderInput(BatchMatmulModule, Target("llvm")),
+    ]
+    builder_results = builder.build(builder_inputs)
+    assert len(builder_results) == len(builder_inputs)
+    _check_build_results(builder_results)
+
+    def test_build(mod: Module, target: Target, _) -> None:  # pylint: disable=unused-argument
+        raise ValueError("Builder intended Test Error (build func).")
+
+    builder = RemoteBuilder(rpc_config, f_build=test_build)
+    builder_results = builder.build([BuilderInput(MatmulModule, Target("llvm"))])
+    assert builder_results[0].artifact_path is None
+    assert builder_results[0].error_msg.startswith("RemoteBuilder: An exception occurred")
+
+    for worker in workers:
+        worker.terminate()
+    tracker.terminate()
+
+
 if __name__ == "__main__":
     tvm.testing.main()
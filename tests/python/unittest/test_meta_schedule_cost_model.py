@@ -26,13 +26,17 @@ import numpy as np
 import pytest
 import tvm
 import tvm.testing
+from tvm.meta_schedule.arg_info import ArgInfo
 from tvm.meta_schedule.cost_model import PyCostModel, RandomModel, XGBModel
+from tvm.meta_schedule.database import TuningRecord
 from tvm.meta_schedule.feature_extractor import RandomFeatureExtractor
 from tvm.meta_schedule.runner import RunnerResult
 from tvm.meta_schedule.search_strategy import MeasureCandidate
+from tvm.meta_schedule.testing.utils import DummyDatabase
 from tvm.meta_schedule.tune_context import TuneContext
 from tvm.meta_schedule.utils import derived_object
 from tvm.script import tir as T
+from tvm.target import Target
 from tvm.tir.schedule.schedule import Schedule
 
 
@@ -228,5 +232,67 @@ def test_meta_schedule_xgb_model_reupdate():
     model.predict(TuneContext(), [_dummy_candidate() for i in range(predict_sample_count)])
 
 
+def test_meta_schedule_xgb_model_incremental():
+    extractor = RandomFeatureExtractor()
+    model = XGBModel(
+        extractor=extractor,
+        num_warmup_samples=2,
+        incremental=True,
+        full_refit_interval=1,
+        replay_buffer_size=8,
+    )
+    update_sample_count = 20
+    for expected_incremental_updates in [0, 1, 0]:
+        model.update(
+            TuneContext(),
+            [_dummy_candidate() for i in range(update_sample_count)],
+            [_dummy_result() for i in range(update_sample_count)],
+        )
+        assert model.num_incremental_updates == expected_incremental_updates
+    assert model.data_size == 3 * update_sample_count
+    model.predict(TuneContext(), [_dummy_candidate() for i in range(10)])
+
+
+def test_meta_schedule_xgb_model_pretrain():
+    database = DummyDatabase()
+    workload = database.commit_workload(Matmul)
+    num_records = 20
+    for _ in range(num_records):
+        sch = Schedule(Matmul)
+        i, _, _ = sch.get_loops(sch.get_block("matmul"))
+        sch.split(i, factors=sch.sample_perfect_tile(i, n=2))
+        database.commit_tuning_record(
+            TuningRecord(
+                sch.trace,
+                workload,
+                run_secs=list(np.random.rand(4) + 1e-6),
+                target=Target("llvm"),
+                args_info=ArgInfo.from_prim_func(Matmul["main"]),
+            )
+        )
+
+    model = XGBModel(extractor=RandomFeatureExtractor(), num_warmup_samples=10, incremental=True)
+    model.pretrain(database, target=Target("cuda"))
+    assert model.data_size == 0 and model.booster is None
+    model.pretrain(database, target=Target("llvm"))
+    assert model.data_size == num_records and model.booster is not None
+
+    with tempfile.NamedTemporaryFile() as path:
+        model.save(path.name)
+        model = XGBModel(
+            extractor=RandomFeatureExtractor(), num_warmup_samples=10, incremental=True
+        )
+        model.load(path.name)
+    # the loaded model predicts right away, and is fine-tuned incrementally
+    assert model.data_size == num_records
+    model.update(
+        TuneContext(),
+        [_dummy_candidate() for i in range(10)],
+        [_dummy_result() for i in range(10)],
+    )
+    assert model.num_incremental_updates == 1
+    model.predict(TuneContext(), [_dummy_candidate() for i in range(10)])
+
+
 if __name__ == "__main__":
     tvm.testing.main()
@@ -27,7 +27,7 @@ import tvm.testing
 from tvm import tir
 from tvm.ir.module import IRModule
 from tvm.meta_schedule.arg_info import ArgInfo
-from tvm.meta_schedule.database import JSONDatabase, TuningRecord
+from tvm.meta_schedule.database import JSONDatabase, SQLiteDatabase, TuningRecord
 from tvm.script import tir as T
 from tvm.tir import Schedule
 
@@ -167,6 +167,8 @@ def test_meta_schedule_database_add_entry():
         assert len(database) == 1
         (ret,) = database.get_top_k(workload, 3)
         _equal_record(ret, record)
+        (ret,) = database.get_all_tuning_records()
+        _equal_record(ret, record)
 
 
 def test_meta_schedule_database_missing():
@@ -296,5 +298,47 @@ def test_meta_schedule_database_reload():
             _equal_record(ret[1], records[2])
 
 
+def test_meta_schedule_sqlite_database():
+    mod: IRModule = Matmul
+    missing_mod: IRModule = MatmulRelu
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "database.db")
+        database = SQLiteDatabase(path)
+        token = database.commit_workload(mod)
+        assert database.has_workload(mod)
+        assert not database.has_workload(missing_mod)
+        trace = _create_schedule(mod, _schedule_matmul).trace
+        records = [
+            TuningRecord(
+                trace,
+                token,
+                run_secs,
+                tvm.target.Target("llvm"),
+                ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+            )
+            for run_secs in [[7.0, 8.0, 9.0], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        ]
+        for record in records:
+            database.commit_tuning_record(record)
+        assert len(database) == 3
+        ret = database.get_top_k(token, 2)
+        assert len(ret) == 2
+        _equal_record(ret[0], records[1])
+        _equal_record(ret[1], records[2])
+        assert len(database.get_top_k(database.commit_workload(missing_mod), 3)) == 0
+
+        # another process opening the same file sees the committed records
+        new_database = SQLiteDatabase(path)
+        assert len(new_database) == 3
+        assert new_database.has_workload(mod)
+        token = new_database.commit_workload(mod)
+        (ret,) = new_database.get_top_k(token, 1)
+        _equal_record(ret, records[1])
+        ret = new_database.get_all_tuning_records()
+        assert len(ret) == 3
+        for ret_record, record in zip(ret, records):
+            _equal_record(ret_record, record)
+
+
 if __name__ == "__main__":
     tvm.testing.main()
@@ -15,13 +15,21 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=missing-module-docstring,missing-function-docstring,missing-class-docstring
+import os
 import re
+import tempfile
 from typing import List
 
 import pytest
 import tvm
+from tvm.meta_schedule import TuneContext
 from tvm.meta_schedule.builder import BuilderResult
-from tvm.meta_schedule.measure_callback import PyMeasureCallback
+from tvm.meta_schedule.cost_model import RandomModel
+from tvm.meta_schedule.measure_callback import (
+    PyMeasureCallback,
+    SaveCheckpoint,
+    load_checkpoint,
+)
 from tvm.meta_schedule.runner import RunnerResult
 from tvm.meta_schedule.search_strategy import MeasureCandidate
 from tvm.meta_schedule.task_scheduler import RoundRobin, TaskScheduler
@@ -122,6 +130,38 @@ def test_meta_schedule_measure_callback_fail():
         )
 
 
+def test_meta_schedule_measure_callback_save_checkpoint():
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        assert load_checkpoint(checkpoint_dir) is None
+        task_scheduler = RoundRobin(
+            tasks=[TuneContext(mod=Matmul, task_name="matmul")],
+            task_weights=[1.0],
+            builder=DummyBuilder(),
+            runner=DummyRunner(),
+            database=DummyDatabase(),
+            cost_model=RandomModel(),
+            max_trials=10,
+        )
+        measure_callback = SaveCheckpoint(checkpoint_dir, interval_sec=0.0, trials=[3])
+        measure_callback.apply(
+            task_scheduler,
+            0,
+            [MeasureCandidate(Schedule(Matmul), None)] * 2,
+            [BuilderResult("test_build", None)] * 2,
+            [RunnerResult([1.0, 2.1], None)] * 2,
+        )
+        state = load_checkpoint(checkpoint_dir)
+        assert state["num_trials"] == 5
+        assert len(state["tasks"]) == 1
+        assert state["tasks"][0]["task_name"] == "matmul"
+        assert state["tasks"][0]["trials"] == 5
+        assert os.path.isfile(state["cost_model"])
+        RandomModel().load(state["cost_model"])
+        assert sorted(os.listdir(checkpoint_dir)) == sorted(
+            ["state.json", os.path.basename(state["cost_model"])]
+        )
+
+
 def test_meta_schedule_measure_callback_as_string():
     @derived_object
     class NotSoFancyMeasureCallback(PyMeasureCallback):
@@ -143,4 +183,5 @@ def test_meta_schedule_measure_callback_as_string():
 if __name__ == "__main__":
     test_meta_schedule_measure_callback()
     test_meta_schedule_measure_callback_fail()
+    test_meta_schedule_measure_callback_save_checkpoint()
     test_meta_schedule_measure_callback_as_string()
@@ -295,6 +295,110 @@ def test_meta_schedule_rpc_multiple_runs():
         _clean_build(builder_result.artifact_path)
 
 
+def test_meta_schedule_rpc_batched_runs():
+    """Test meta schedule rpc runner measuring candidates in batches"""
+    # Build the module
+    mods = [
+        MatmulModule,
+        MatmulReluModule,
+        MatmulModule,
+        BatchMatmulModule,
+        MatmulReluModule,
+    ]
+    builder = LocalBuilder()
+    builder_inputs = [BuilderInput(mod, Target("llvm")) for mod in mods]
+    builder_results = builder.build(builder_inputs)
+    for builder_result in builder_results:
+        assert builder_result.artifact_path is not None
+        assert builder_result.error_msg is None
+
+    matmul_args_info = [TensorInfo("float32", (MATMUL_N, MATMUL_N)) for _ in range(3)]
+    batch_matmul_args_info = [TensorInfo("float32", [16, MATMUL_M, MATMUL_M]) for _ in range(3)]
+    runner_inputs = [
+        RunnerInput(
+            builder_result.artifact_path,
+            "llvm",
+            batch_matmul_args_info if mod is BatchMatmulModule else matmul_args_info,
+        )
+        for mod, builder_result in zip(mods, builder_results)
+    ]
+
+    with LocalRPC() as rpc:
+        rpc_config = RPCConfig(
+            tracker_host=rpc.tracker_host,
+            tracker_port=rpc.tracker_port,
+            tracker_key=rpc.tracker_key,
+            session_priority=1,
+            session_timeout_sec=100,
+        )
+        evaluator_config = EvaluatorConfig(
+            number=1,
+            repeat=1,
+            min_repeat_ms=0,
+            enable_cpu_cache_flush=False,
+        )
+        runner = RPCRunner(rpc_config, evaluator_config, batch_size=3)
+        # Run the module
+        runner_futures = runner.run(runner_inputs)
+        runner_results = [runner_future.result() for runner_future in runner_futures]
+
+    assert len(runner_results) == len(runner_inputs)
+    for runner_result in runner_results:
+        assert runner_result.error_msg is None
+        for result in runner_result.run_secs:
+            if isinstance(result, FloatImm):
+                result = result.value
+            assert isinstance(result, float)
+            assert result >= 0.0
+
+    for builder_result in builder_results:
+        _clean_build(builder_result.artifact_path)
+
+
+def test_meta_schedule_local_early_rejection():
+    """Test meta schedule local runner rejecting a slow candidate after a probe run"""
+    # Build the module
+    mod = MatmulModule
+    builder = LocalBuilder()
+    builder_results = builder.build([BuilderInput(mod, Target("llvm"))] * 2)
+    for builder_result in builder_results:
+        assert builder_result.artifact_path is not None
+        assert builder_result.error_msg is None
+
+    runner_inputs = [
+        RunnerInput(
+            builder_result.artifact_path,
+            "llvm",
+            [
+                TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+                TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+                TensorInfo("float32", (MATMUL_N, MATMUL_N)),
+            ],
+        )
+        for builder_result in builder_results
+    ]
+
+    evaluator_config = EvaluatorConfig(
+        number=1,
+        repeat=3,
+        min_repeat_ms=0,
+        enable_cpu_cache_flush=False,
+        # any probe run is slower than this fraction of the incumbent
+        early_reject_ratio=1e-9,
+    )
+    runner = LocalRunner(timeout_sec=100, evaluator_config=evaluator_config)
+    # Run the modules
+    first, second = (future.result() for future in runner.run(runner_inputs))
+    assert first.error_msg is None
+    assert len(first.run_secs) == 3
+    # The second candidate is censored: it keeps the time of its probe run
+    assert second.error_msg.startswith("Censored")
+    assert len(second.run_secs) == 1
+    assert second.run_secs[0].value > 0.0
+    for builder_result in builder_results:
+        _clean_build(builder_result.artifact_path)
+
+
 def test_meta_schedule_local_multiple_runs():
     """Test meta schedule local runner for multiple runs"""
     # Build the module
@@ -17,10 +17,12 @@
 import time
 import ctypes
 
+import numpy as np
+
 import tvm
 from tvm import te
 from tvm.contrib.utils import tempdir
-from tvm.runtime.module import BenchmarkResult
+from tvm.runtime.module import BenchmarkResult, _normal_ppf, _student_t_ppf
 
 
 def test_min_repeat_ms():
@@ -64,8 +66,53 @@ def test_benchmark_result():
     assert r.min == 1
     assert r.max == 5
     assert r.std == 1.5
+    assert r.num_samples == 4
+    assert r.converged is None
+
+    # the 97.5% quantile of the t distribution with 3 degrees of freedom is 3.182
+    assert abs(r.ci_half_width - 3.182 * np.std([1, 2, 2, 5], ddof=1) / 2) < 0.05
+    assert abs(r.rel_error - r.ci_half_width / 2.5) < 1e-9
+    assert BenchmarkResult([1]).ci_half_width == float("inf")
+
+
+def test_student_t_ppf():
+    assert _normal_ppf(0.5) == 0.0
+    assert abs(_normal_ppf(0.975) - 1.959964) < 1e-6
+    assert abs(_normal_ppf(0.01) + 2.326348) < 1e-6
+    assert abs(_normal_ppf(0.999) - 3.090232) < 1e-6
+
+    # exact 97.5% quantiles of the t distribution
+    for dof, quantile in [(3, 3.182), (5, 2.571), (10, 2.228), (30, 2.042)]:
+        assert abs(_student_t_ppf(0.975, dof) - quantile) / quantile < 0.01
+    assert abs(_student_t_ppf(0.975, 10**6) - _normal_ppf(0.975)) < 1e-5
+
+
+def test_adaptive_time_evaluator():
+    X = te.placeholder((1024,), name="X")
+    Y = te.compute((1024,), lambda i: X[i] + 1, name="Y")
+    s = te.create_schedule(Y.op)
+    func = tvm.build(s, [X, Y])
+    x = tvm.nd.empty((1024,), dtype="float32")
+    y = tvm.nd.empty((1024,), dtype="float32")
+
+    ftimer = func.time_evaluator(
+        func.entry_name, tvm.cpu(), number=10, repeat=2, target_rel_error=1e-9, max_repeat=10
+    )
+    res = ftimer(x, y)
+    assert res.num_samples == 10
+    assert res.converged is False
+
+    ftimer = func.time_evaluator(
+        func.entry_name, tvm.cpu(), number=10, repeat=2, target_rel_error=10.0
+    )
+    res = ftimer(x, y)
+    assert res.num_samples == 4
+    assert res.converged is True
+    assert res.rel_error <= 10.0
 
 
 if __name__ == "__main__":
     test_min_repeat_ms()
     test_benchmark_result()
+    test_student_t_ppf()
+    test_adaptive_time_evaluator()
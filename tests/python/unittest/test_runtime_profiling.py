@@ -360,5 +360,38 @@ def test_roofline_analysis_rpc():
             assert call["Percent of Theoretical Optimal"].ratio >= 5.0
 
 
+@T.prim_func
+def matmul_serial(a: T.handle, b: T.handle, c: T.handle) -> None:
+    A = T.match_buffer(a, [64, 64], "float32")
+    B = T.match_buffer(b, [64, 64], "float32")
+    C = T.match_buffer(c, [64, 64], "float32")
+    for i, j, k in T.grid(64, 64, 64):
+        C[i, j] = C[i, j] + A[i, k] * B[k, j]
+
+
+@T.prim_func
+def matmul_parallel(a: T.handle, b: T.handle, c: T.handle) -> None:
+    A = T.match_buffer(a, [64, 64], "float32")
+    B = T.match_buffer(b, [64, 64], "float32")
+    C = T.match_buffer(c, [64, 64], "float32")
+    for i in T.parallel(64):
+        for j, k in T.grid(64, 64):
+            C[i, j] = C[i, j] + A[i, k] * B[k, j]
+
+
+def test_roofline_screening():
+    screening = tvm.utils.RooflineScreening(1e9, 1e10, ratio=0.5, num_cores=4)
+    serial = screening.estimate(matmul_serial)
+    parallel = screening.estimate(matmul_parallel)
+    assert 0 < parallel < serial
+
+    assert screening.select([serial, parallel, serial, parallel]) == [1, 3]
+    assert screening.select([serial, parallel, parallel]) == [1, 2]
+    # at least one candidate is measured
+    assert screening.select([serial]) == [0]
+    with pytest.raises(ValueError):
+        tvm.utils.RooflineScreening(1e9, 1e10, ratio=0)
+
+
 if __name__ == "__main__":
     tvm.testing.main()
@@ -17,10 +17,14 @@
 import tvm
 from tvm import te
 import tvm.testing
+import asyncio
+import concurrent.futures
+import hashlib
 import multiprocessing
 import os
 import stat
 import sys
+import threading
 import time
 
 import pytest
@@ -28,7 +32,7 @@ import numpy as np
 from tvm import rpc
 from tvm.relay.backend import Runtime
 from tvm.contrib import utils, cc
-from tvm.rpc.tracker import Tracker
+from tvm.rpc.tracker import FairShareScheduler, Tracker
 from tvm.rpc.proxy import Proxy
 
 
@@ -234,6 +238,55 @@ def test_rpc_file_exchange():
     check_remote()
 
 
+@tvm.testing.requires_rpc
+def test_rpc_file_exchange_chunked():
+    cache_dir = utils.tempdir()
+    server = rpc.Server(cache_dir=cache_dir.temp_dir)
+    remote = rpc.connect("127.0.0.1", server.port)
+
+    blob = bytearray(np.random.randint(0, 10, size=(1000)))
+    progress = []
+    remote.upload(blob, "dat.bin", chunk_size=300, progress=lambda *x: progress.append(x))
+    assert progress == [(300, 1000), (600, 1000), (900, 1000), (1000, 1000)]
+    assert remote.download("dat.bin", chunk_size=300) == blob
+    assert cache_dir.listdir() == [hashlib.sha256(blob).hexdigest()]
+
+    # the same content is copied from the cache instead of being sent again
+    progress = []
+    remote.upload(blob, "copy.bin", chunk_size=300, progress=lambda *x: progress.append(x))
+    assert progress == [(1000, 1000)]
+    assert remote.download("copy.bin") == blob
+
+    remote.upload(bytearray(), "empty.bin")
+    assert remote.download("empty.bin") == bytearray()
+
+
+@tvm.testing.requires_rpc
+def test_rpc_compressed_transfer():
+    server = rpc.Server()
+    remote = rpc.connect("127.0.0.1", server.port)
+    assert remote.set_compression(threshold=100) in rpc.compression.available_codecs()
+
+    blob = bytearray(np.random.randint(0, 2, size=(1000)))
+    remote.upload(blob, "dat.bin", chunk_size=300)
+    assert remote.download("dat.bin", chunk_size=300) == blob
+    arr = np.random.randint(0, 2, size=(32, 32)).astype("float32")
+    remote_arr = remote.upload_array(arr, remote.cpu(0))
+    np.testing.assert_equal(remote_arr.numpy(), arr)
+    np.testing.assert_equal(remote.download_array(remote_arr), arr)
+
+    stats = remote.transfer_stats()
+    assert stats["messages"] == 10
+    assert stats["raw_bytes"] == 2 * len(blob) + 2 * arr.nbytes
+    assert stats["ratio"] > 1
+
+    # payloads are sent as is without compression
+    assert remote.set_compression([]) is None
+    remote.upload(blob, "raw.bin")
+    assert remote.download("raw.bin") == blob
+    assert remote.transfer_stats()["messages"] == 10
+
+
 @tvm.testing.requires_rpc
 @tvm.testing.requires_llvm
 def test_rpc_remote_module():
@@ -520,6 +573,55 @@ def _target(host, port, device_key, timeout):
     remote.cpu()
 
 
+def test_rpc_tracker_fair_share_scheduler():
+    class Conn:
+        def __init__(self):
+            self.pending_matchkeys = set()
+
+    def make_value(conn, port, matchkey):
+        conn.pending_matchkeys.add(matchkey)
+        return (conn, "10.0.0.1", port, matchkey)
+
+    served = []
+
+    def request(user):
+        scheduler.request(user, 1, lambda value: served.append((user, value[-1])) or True)
+
+    scheduler = FairShareScheduler("dev")
+    conn = Conn()
+    for _ in range(3):
+        request("a")
+    scheduler.put(make_value(conn, 9090, "dev:0"))
+    assert served == [("a", "dev:0")]
+
+    # "b" has used no device time, so it is served before the pending requests of "a"
+    request("b")
+    time.sleep(0.01)
+    scheduler.put(make_value(conn, 9090, "dev:1"))
+    assert served[-1] == ("b", "dev:1")
+    summary = scheduler.summary()
+    assert summary["pending"] == 2
+    assert summary["wait"]["count"] == 2
+    assert summary["users"]["a"]["share"] > 0
+
+    # a device whose server drops twice while in use is excluded
+    other = Conn()
+    scheduler = FairShareScheduler("dev", max_failures=2)
+    for i in range(2):
+        request("a")
+        value = make_value(other, 9091, "dev:drop%d" % i)
+        scheduler.put(value)
+        scheduler.remove(value)
+    assert scheduler.summary()["excluded"] == ["10.0.0.1:9091"]
+    # it is not handed out while a healthy device is in use
+    request("a")
+    scheduler.put(make_value(conn, 9090, "dev:healthy"))
+    request("a")
+    scheduler.put(make_value(other, 9091, "dev:excluded"))
+    assert served[-1] == ("a", "dev:healthy")
+    assert scheduler.summary()["pending"] == 1
+
+
 @tvm.testing.requires_rpc
 def test_rpc_tracker_request():
     # test concurrent request
@@ -561,6 +663,95 @@ def test_rpc_tracker_request():
     tracker.terminate()
 
 
+@tvm.testing.requires_rpc
+def test_rpc_session_pool():
+    tracker = Tracker(port=9000, port_end=10000)
+    device_key = "test_device"
+    server = rpc.Server(
+        port=9000,
+        port_end=10000,
+        key=device_key,
+        tracker_addr=("127.0.0.1", tracker.port),
+    )
+    time.sleep(1)
+    client = rpc.connect_tracker("127.0.0.1", tracker.port)
+    pool = rpc.SessionPool("127.0.0.1", tracker.port, idle_timeout=2.0)
+
+    # a released session is leased again and keeps its device
+    with pool.session(device_key) as remote:
+        assert remote.cpu(0).exist
+    assert pool.num_idle(device_key) == 1
+    assert client.summary()["queue_info"][device_key]["free"] == 0
+    with pool.session(device_key) as remote2:
+        assert remote2 is remote
+    del remote, remote2
+
+    # a failed session is not reused
+    with pytest.raises(ValueError):
+        with pool.session(device_key):
+            raise ValueError()
+    assert pool.num_idle(device_key) == 0
+    time.sleep(1)
+    assert client.summary()["queue_info"][device_key]["free"] == 1
+
+    # an idle session is closed after the idle timeout
+    pool.release(device_key, pool.lease(device_key))
+    assert pool.num_idle(device_key) == 1
+    time.sleep(4)
+    assert pool.num_idle(device_key) == 0
+    assert client.summary()["queue_info"][device_key]["free"] == 1
+
+    pool.close()
+    server.terminate()
+    tracker.terminate()
+
+
+@tvm.testing.requires_rpc
+def test_rpc_asyncio_client():
+    tracker = Tracker(port=9000, port_end=10000)
+    device_key = "test_device"
+    servers = [
+        rpc.Server(
+            port=9000,
+            port_end=10000,
+            key=device_key,
+            tracker_addr=("127.0.0.1", tracker.port),
+        )
+        for _ in range(2)
+    ]
+    time.sleep(1)
+
+    async def run(remote, value):
+        blob = bytearray(np.random.randint(0, 10, size=(1000)))
+        await remote.aupload(blob, "dat.bin")
+        assert await remote.adownload("dat.bin") == blob
+        await remote.aremove("dat.bin")
+        addone = await remote.aget_function("rpc.test.addone")
+        return await addone(value)
+
+    async def main(executor):
+        client = await rpc.aconnect_tracker("127.0.0.1", tracker.port, executor=executor)
+        assert (await client.summary())["queue_info"][device_key]["free"] == 2
+        remotes = await asyncio.gather(*[client.request(device_key) for _ in range(2)])
+        assert all(remote.executor is executor for remote in remotes)
+        assert (await client.summary())["queue_info"][device_key]["free"] == 0
+        results = await asyncio.gather(*[run(remote, i) for i, remote in enumerate(remotes)])
+        assert results == [1, 2]
+        await client.close()
+
+    asyncio.run(main(None))
+    # wait for the servers of the closed sessions to register again
+    time.sleep(1)
+    with concurrent.futures.ThreadPoolExecutor(2, thread_name_prefix="rpc_test") as executor:
+        asyncio.run(main(executor))
+        # the awaitable calls are made in the given executor
+        thread_name = rpc.AsyncFunction(lambda: threading.current_thread().name, executor)
+        assert asyncio.run(thread_name()).startswith("rpc_test")
+    for server in servers:
+        server.terminate()
+    tracker.terminate()
+
+
 @tvm.testing.requires_rpc
 def test_rpc_tracker_via_proxy():
     """